@@ -0,0 +1,243 @@
+# benchmarks/run.py
+#
+# Offline benchmark suite. Models are answered by the deterministic FakeLLM and
+# searches by FakeTavilyClient (praxis_ai.testing), so results measure Praxis'
+# own overhead and are comparable between runs and machines of the same kind.
+#
+#   python -m benchmarks.run --output results.json
+#   python -m benchmarks.run --quick --compare baseline.json --threshold 0.25
+#
+# --compare exits with status 1 if any benchmark's median is slower than the
+# baseline's by more than the threshold, so CI can fail on regressions.
+
+import argparse
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from rich.console import Console
+
+SCHEMA_VERSION = 1
+BENCHMARKS = {}
+
+def benchmark(group: str):
+    def register(func):
+        BENCHMARKS[group] = func
+        return func
+    return register
+
+def measure(func, repeat: int, setup=None) -> dict:
+    """Run ``func`` ``repeat`` times (after ``setup`` each time, untimed) and return timing statistics in seconds."""
+    durations = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return {"median_s": statistics.median(durations), "min_s": min(durations), "runs": repeat}
+
+@benchmark("orchestrator_loop")
+def bench_orchestrator_loop(quick: bool) -> dict:
+    import asyncio
+    from fastapi import Response
+    from praxis_ai.interfaces.api import process_objective, ObjectiveRequest
+    from praxis_ai.testing import FakeLLM, fake_models
+
+    rounds = 5 if quick else 20
+    results = {}
+    with fake_models(FakeLLM(rounds=rounds)):
+        request = ObjectiveRequest(objective="Benchmark objective")
+        stats = measure(lambda: asyncio.run(process_objective(request, Response())), repeat=3 if quick else 10)
+    # Each round is one orchestrator and one sub-agent call; the final orchestrator call ends the loop.
+    results["orchestrator_loop.per_round"] = {
+        **stats, "median_s": stats["median_s"] / rounds, "min_s": stats["min_s"] / rounds, "rounds": rounds}
+    return results
+
+@benchmark("prompt_construction")
+def bench_prompt_construction(quick: bool) -> dict:
+    from praxis_ai.config.models import AgentContext, Task
+    from praxis_ai.core.chat import chat
+    from praxis_ai.core.orchestrator import orchestrator
+    from praxis_ai.core.sub_agent import sub_agent
+    from praxis_ai.testing import FakeLLM, fake_models
+
+    sizes = (0, 10, 100) if quick else (0, 10, 100, 500)
+    repeat = 5 if quick else 20
+    result_text = "Completed a sub-task with a moderately long single-line result. " * 4
+    results = {}
+    with fake_models(FakeLLM(rounds=10 ** 6)):
+        for size in sizes:
+            context = AgentContext(objective="Benchmark objective", previous_results=[result_text] * size)
+            results[f"prompt_construction.orchestrator[history={size}]"] = measure(lambda: orchestrator(context), repeat)
+
+            tasks = [Task(id=str(i), description=f"Task {i}", status="completed", result=result_text) for i in range(size)]
+            task = Task(id="current", description="Current task", status="pending")
+            results[f"prompt_construction.sub_agent[history={size}]"] = measure(lambda: sub_agent(task, tasks), repeat)
+
+            history = [f"Message {i}: {result_text}" for i in range(size)]
+            results[f"prompt_construction.chat[history={size}]"] = measure(lambda: chat("Hello", history, None), repeat)
+    return results
+
+def _bench_workspace(root: Path):
+    from praxis_ai.tools import file_operations
+    from praxis_ai.workspace_manager import WorkspaceManager
+
+    manager = WorkspaceManager(str(root / "workspaces"))
+    manager.create_workspace("bench", "File tool benchmarks")
+    file_operations.workspace_manager = manager
+    return file_operations
+
+@benchmark("file_tools")
+def bench_file_tools(quick: bool) -> dict:
+    from praxis_ai.utils.extraction_cache import extraction_cache
+
+    repeat = 3 if quick else 10
+    paragraphs = 200 if quick else 2000
+    text = "\n\n".join(f"Paragraph {i}. " + "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 6
+                       for i in range(paragraphs))
+    file_count = 100 if quick else 1000
+    structure = {"project": {f"pkg{d}": {f"module_{d}_{i}.py": None for i in range(file_count // 10)} for d in range(10)}}
+    code_blocks = [(f"module_{d}_{i}.py", f"# module {d}.{i}\n" + "x = 1\n" * 50)
+                   for d in range(10) for i in range(file_count // 10)]
+
+    results = {}
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        try:
+            ops = _bench_workspace(Path(tmp))
+            results["file_tools.pdf_write"] = measure(lambda: ops.create_pdf_tool("doc.pdf", text, "bench"), repeat)
+            results["file_tools.pdf_read_cold"] = measure(
+                lambda: ops.read_pdf_tool("doc.pdf", "bench"), repeat, setup=extraction_cache.clear)
+            results["file_tools.docx_write"] = measure(
+                lambda: ops.create_word_document_tool("doc.docx", text, "bench"), repeat)
+            results["file_tools.docx_read_cold"] = measure(
+                lambda: ops.read_word_document_tool("doc.docx", "bench"), repeat, setup=extraction_cache.clear)
+            results["file_tools.docx_read_warm"] = measure(lambda: ops.read_word_document_tool("doc.docx", "bench"), repeat)
+
+            counter = iter(range(10 ** 6))
+            results["file_tools.materialize_new"] = measure(
+                lambda: ops.create_folder_structure_tool(f"new{next(counter)}", structure, code_blocks, "bench"), repeat)
+            results["file_tools.materialize_unchanged"] = measure(
+                lambda: ops.create_folder_structure_tool("new0", structure, code_blocks, "bench"), repeat)
+        finally:
+            os.chdir(cwd)
+    for name, result in results.items():
+        result["size"] = file_count if "materialize" in name else paragraphs
+    return results
+
+@benchmark("search_tools")
+def bench_search_tools(quick: bool) -> dict:
+    from praxis_ai.testing import fake_search
+    from praxis_ai.tools import web_search
+
+    queries = [f"benchmark topic {i}" for i in range(5 if quick else 20)]
+    repeat = 3 if quick else 10
+    results = {}
+    # The results table is still rendered, as in the CLI, but not written to the terminal.
+    console = web_search.console
+    web_search.console = Console(file=io.StringIO(), width=120)
+    with fake_search():
+        results["search_tools.multi_search_cold"] = measure(
+            lambda: web_search.multi_web_search(queries, num_results=10), repeat, setup=web_search.search_cache.clear)
+        results["search_tools.multi_search_cached"] = measure(
+            lambda: web_search.multi_web_search(queries, num_results=10), repeat)
+    web_search.console = console
+    for result in results.values():
+        result["queries"] = len(queries)
+    return results
+
+@benchmark("workspace_manager")
+def bench_workspace_manager(quick: bool) -> dict:
+    from praxis_ai.workspace_manager import WorkspaceManager
+
+    count = 100 if quick else 1000
+    names = [f"workspace-{i}" for i in range(count)]
+    results = {}
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        try:
+            manager = WorkspaceManager(tmp)
+            results["workspace_manager.create"] = measure(
+                lambda: [manager.create_workspace(name, "benchmark") for name in names], 1)
+            results["workspace_manager.load"] = measure(lambda: WorkspaceManager(tmp), 5)
+            results["workspace_manager.select_and_resolve"] = measure(
+                lambda: [manager.select_workspace(name) and manager.get_workspace_path(name) for name in names], 3)
+            results["workspace_manager.list"] = measure(manager.list_workspaces, 20)
+            results["workspace_manager.delete"] = measure(lambda: [manager.delete_workspace(name) for name in names], 1)
+        finally:
+            os.chdir(cwd)
+    for result in results.values():
+        result["workspaces"] = count
+    return results
+
+def run(groups, quick: bool) -> dict:
+    results = {}
+    for group in groups:
+        print(f"Running {group}...", file=sys.stderr)
+        results.update(BENCHMARKS[group](quick))
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "schema": SCHEMA_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(),
+        "commit": commit,
+        "quick": quick,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+def compare(current: dict, baseline: dict, threshold: float) -> list:
+    """Return (name, baseline median, current median, ratio, regressed) for benchmarks present in both runs."""
+    rows = []
+    for name, result in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None or not base["median_s"]:
+            continue
+        ratio = result["median_s"] / base["median_s"]
+        rows.append((name, base["median_s"], result["median_s"], ratio, ratio > 1 + threshold))
+    return rows
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the offline Praxis AI benchmark suite.")
+    parser.add_argument("--only", action="append", choices=sorted(BENCHMARKS), help="Run only this group (repeatable)")
+    parser.add_argument("--quick", action="store_true", help="Smaller inputs and fewer repetitions")
+    parser.add_argument("--output", help="Write results to this JSON file")
+    parser.add_argument("--compare", help="Baseline JSON file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed slowdown before a regression is reported")
+    args = parser.parse_args()
+
+    report = run(args.only or list(BENCHMARKS), args.quick)
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2) + "\n")
+
+    for name, result in report["results"].items():
+        print(f"{name:<55} {result['median_s'] * 1000:10.3f} ms  (min {result['min_s'] * 1000:.3f} ms)")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        rows = compare(report, baseline, args.threshold)
+        print(f"\nCompared with {args.compare} (threshold {args.threshold:.0%}):")
+        for name, before, after, ratio, regressed in rows:
+            flag = "REGRESSION" if regressed else ""
+            print(f"{name:<55} {before * 1000:10.3f} -> {after * 1000:10.3f} ms  {ratio:5.2f}x  {flag}")
+        if any(row[4] for row in rows):
+            sys.exit(1)
+
+if __name__ == "__main__":
+    # Keep benchmark runs away from the user's caches and traces, and never call real services.
+    os.environ.setdefault("OPENAI_API_KEY", "benchmark")
+    os.environ.setdefault("TAVILY_API_KEY", "benchmark")
+    os.environ.setdefault("PRAXIS_TRACING", "false")
+    os.environ.setdefault("PRAXIS_CACHE_DIR", tempfile.mkdtemp(prefix="praxis-bench-cache-"))
+    main()
@@ -9,15 +9,24 @@ from rich import print as rprint
 from rich.markdown import Markdown
 from dotenv import load_dotenv
 from .core.chat import chat
+from .core.providers import configure_models, required_api_keys
 from .workspace_manager import WorkspaceManager, WorkspaceError
 from .config.models import AgentContext
 from .utils.helpers import create_task
+from .utils.tracing import span, read_spans, summarize_spans
+from .utils.logging import log_context
+from .utils.profiling import profile, should_sample
+from .config.settings import TRACE_FILE, PROFILE_SAMPLE_RATE, PROFILE_MEMORY
 import inspect
+import time
+from contextlib import nullcontext
+from rich.table import Table
 
 # Import tools
 from .tools.file_operations import (
     read_file_tool,
     write_file_tool,
+    edit_file_tool,
     create_folder_structure_tool,
     create_pdf_tool,
     read_pdf_tool,
@@ -28,13 +37,16 @@ from .tools.file_operations import (
     copy_file_tool,
     move_file_tool,
     delete_file_tool,
-    list_files_tool
+    list_files_tool,
+    grep_workspace_tool,
+    batch_file_operations_tool
 )
 from .tools.conversation_history import (
     update_conversation_history_tool,
     read_conversation_history_tool
 )
-from .tools.web_search import web_search
+from .tools.web_search import web_search, multi_web_search
+from .tools.web_fetch import fetch_urls_tool
 from .config.settings import ENABLE_CALENDAR
 
 console = Console()
@@ -42,20 +54,22 @@ workspace_manager = WorkspaceManager()
 
 def check_api_keys():
     load_dotenv()
-    openai_key = os.getenv("OPENAI_API_KEY")
-    tavily_key = os.getenv("TAVILY_API_KEY")
-    
-    if not openai_key:
-        console.print("[yellow]No OpenAI API key found in environment variables.[/yellow]")
-        openai_key = Prompt.ask("Please enter your OpenAI API key")
-        os.environ["OPENAI_API_KEY"] = openai_key
-        console.print("[green]OpenAI API key set successfully.[/green]")
-    
-    if not tavily_key:
+
+    # Only the providers configured for the model roles need keys; Ollama runs locally without one.
+    for key_variable, name in required_api_keys():
+        if not os.getenv(key_variable):
+            console.print(f"[yellow]No {name} API key found in environment variables.[/yellow]")
+            os.environ[key_variable] = Prompt.ask(f"Please enter your {name} API key")
+            console.print(f"[green]{name} API key set successfully.[/green]")
+
+    if not os.getenv("TAVILY_API_KEY"):
         console.print("[yellow]No Tavily API key found in environment variables.[/yellow]")
-        tavily_key = Prompt.ask("Please enter your Tavily API key")
-        os.environ["TAVILY_API_KEY"] = tavily_key
-        console.print("[green]Tavily API key set successfully.[/green]")
+        tavily_key = Prompt.ask("Please enter your Tavily API key (leave blank to run without web search)", default="", show_default=False)
+        if tavily_key:
+            os.environ["TAVILY_API_KEY"] = tavily_key
+            console.print("[green]Tavily API key set successfully.[/green]")
+        else:
+            console.print("[yellow]Web search will be unavailable.[/yellow]")
     
     if ENABLE_CALENDAR:
         google_credentials = os.getenv("GOOGLE_CALENDAR_CREDENTIALS_FILE")
@@ -70,7 +84,11 @@ def check_api_keys():
                 console.print("[yellow]Google Calendar functionality will be disabled.[/yellow]")
                 os.environ["ENABLE_CALENDAR"] = "false"
     
-    return openai_key and tavily_key
+    if not all(os.getenv(key_variable) for key_variable, _ in required_api_keys()):
+        return False
+    # Rebind the models now that keys entered above are in the environment.
+    configure_models()
+    return True
 
 def initialize_praxis():
     base_path = workspace_manager.get_base_path()
@@ -88,9 +106,14 @@ def initialize_praxis():
     
     console.print(Panel(system_message, title="Praxis AI Initialization", border_style="green"))
 
-@click.command()
-def cli():
+@click.group(invoke_without_command=True)
+@click.option("--profile", "profile_turns", is_flag=True, help="Profile each turn with cProfile and print the hottest functions.")
+@click.option("--profile-memory", is_flag=True, help="Also trace allocations with tracemalloc (implies --profile; slower).")
+@click.pass_context
+def cli(ctx, profile_turns, profile_memory):
     """Praxis AI - Your intelligent workspace assistant with web search and calendar management capabilities"""
+    if ctx.invoked_subcommand is not None:
+        return
     if not check_api_keys():
         console.print("[red]Required API keys are missing. Exiting.[/red]")
         return
@@ -122,86 +145,141 @@ def cli():
         if user_input.lower() == 'exit':
             break
 
-        # Pass tool_results to the chat function
-        response = chat(user_input, conversation_history, current_workspace, tool_results)
+        show_profile = profile_turns or profile_memory
+        turn_profiler = (profile("turn", memory=profile_memory or PROFILE_MEMORY)
+                         if show_profile or should_sample(PROFILE_SAMPLE_RATE) else nullcontext())
+        with log_context(workspace=current_workspace), span("turn", kind="turn", workspace=current_workspace), \
+                turn_profiler as turn_profile:
+            # Pass tool_results to the chat function
+            response = chat(user_input, conversation_history, current_workspace, tool_results)
+
+            # Handle the response, whether it's a string or a Message object
+            assistant_response = response.text if hasattr(response, 'text') else str(response)
 
-        # Handle the response, whether it's a string or a Message object
-        assistant_response = response.text if hasattr(response, 'text') else str(response)
+            console.print(Markdown(f"**Praxis**: {assistant_response}"))
+            conversation_history.append(f"You: {user_input}")
+            conversation_history.append(f"Praxis: {assistant_response}")
 
-        console.print(Markdown(f"**Praxis**: {assistant_response}"))
-        conversation_history.append(f"You: {user_input}")
-        conversation_history.append(f"Praxis: {assistant_response}")
+            # Update conversation history after each response
+            update_conversation_history_tool(f"User: {user_input}\nPraxis: {assistant_response}", current_workspace)
 
-        # Update conversation history after each response
-        update_conversation_history_tool(f"User: {user_input}\nPraxis: {assistant_response}", current_workspace)
+            tool_results = []
 
-        tool_results = []
+            # Check if tool_calls exists and is not empty
+            if hasattr(response, 'tool_calls') and response.tool_calls:
+                for tool_call in response.tool_calls:
+                    tool_result = execute_tool(tool_call, current_workspace)
+                    tool_results.append(tool_result)
 
-        # Check if tool_calls exists and is not empty
-        if hasattr(response, 'tool_calls') and response.tool_calls:
-            for tool_call in response.tool_calls:
-                tool_result = execute_tool(tool_call, current_workspace)
-                tool_results.append(tool_result)
+                    # Update current workspace if it was changed during tool execution
+                    if "enter_workspace_tool" in str(tool_call):
+                        current_workspace = tool_result.split("Entered workspace: ")[-1]
 
-                # Update current workspace if it was changed during tool execution
-                if "enter_workspace_tool" in str(tool_call):
-                    current_workspace = tool_result.split("Entered workspace: ")[-1]
+                # Get Praxis's response to the tool results
+                response = chat(f"Tool execution results: {', '.join(tool_results)}", conversation_history, current_workspace, tool_results)
+                assistant_response = response.text if hasattr(response, 'text') else str(response)
 
-            # Get Praxis's response to the tool results
-            response = chat(f"Tool execution results: {', '.join(tool_results)}", conversation_history, current_workspace, tool_results)
-            assistant_response = response.text if hasattr(response, 'text') else str(response)
+                console.print(Markdown(f"**Praxis**: {assistant_response}"))
+                conversation_history.append(f"Praxis: {assistant_response}")
 
-            console.print(Markdown(f"**Praxis**: {assistant_response}"))
-            conversation_history.append(f"Praxis: {assistant_response}")
+                # Update conversation history with tool results
+                conversation_history.append(f"Praxis: {assistant_response}")
+                update_conversation_history_tool(f"Tool Results: {', '.join(tool_results)}\nPraxis: {assistant_response}", current_workspace)
 
-            # Update conversation history with tool results
-            conversation_history.append(f"Praxis: {assistant_response}")
-            update_conversation_history_tool(f"Tool Results: {', '.join(tool_results)}\nPraxis: {assistant_response}", current_workspace)
+        if show_profile:
+            print_profile(turn_profile)
 
     console.print("[bold cyan]Thank you for using Praxis AI. Goodbye![/bold cyan]")
 
+def print_profile(result):
+    if result.skipped:
+        console.print("[yellow]Profile skipped: another profile was already running.[/yellow]")
+        return
+    table = Table(title=f"Hottest functions ({result.duration:.2f}s turn)", show_header=True, header_style="bold magenta")
+    for column in ("Self s", "Cumulative s", "Calls", "Function"):
+        table.add_column(column, justify="left" if column == "Function" else "right")
+    for row in result.functions:
+        table.add_row(f"{row['self_s']:.4f}", f"{row['cumulative_s']:.4f}", str(row["calls"]), row["function"])
+    console.print(table)
+    if result.allocations:
+        table = Table(title="Largest allocations", show_header=True, header_style="bold magenta")
+        for column in ("KiB", "Blocks", "Location"):
+            table.add_column(column, justify="left" if column == "Location" else "right")
+        for row in result.allocations:
+            table.add_row(f"{row['size_kb']:.1f}", str(row["count"]), row["location"])
+        console.print(table)
+    if result.stats_path:
+        console.print(f"[dim]Profile saved to {result.stats_path}[/dim]")
+
 def execute_tool(tool_call, current_workspace):
-    try:
-        # Debug print to inspect the tool_call object
-        rprint("[bold yellow]Debug: Tool Call Object:[/bold yellow]", tool_call)
-
-        # Try to access different possible attributes
-        if hasattr(tool_call, 'function'):  # Check for LangChain tools
-            tool_name = getattr(tool_call.function, 'name', str(tool_call.function))
-            tool_args = getattr(tool_call.function, 'arguments', {})
-        elif hasattr(tool_call, 'tool'): # Check for other tool formats
-            tool_name = getattr(tool_call.tool, '__name__', str(tool_call.tool))
-            tool_args = tool_call.arguments if hasattr(tool_call, 'arguments') else {}
-        else: # Fallback if tool structure is unknown
-            tool_name = str(tool_call)
-            tool_args = {}
-
-        rprint(f"[bold cyan]Executing tool:[/bold cyan] {tool_name}")
-        rprint(f"[bold cyan]Arguments:[/bold cyan] {tool_args}")
-
-        # Add current_workspace to the arguments if it's expected by the tool
-        if 'current_workspace' in inspect.signature(tool_call).parameters:
-            tool_args['current_workspace'] = current_workspace
-
-        # Execute the tool based on its structure
-        if callable(tool_call):
-            result = tool_call(**tool_args)
-        elif hasattr(tool_call, 'tool') and callable(tool_call.tool):
-            result = tool_call.tool(**tool_args)
-        else:
-            raise ValueError(f"Unable to execute tool: {tool_name}")
+    with log_context(workspace=current_workspace), span("tool", kind="tool") as tool_span:
+        try:
+            # Try to access different possible attributes
+            if hasattr(tool_call, 'function'):  # Check for LangChain tools
+                tool_name = getattr(tool_call.function, 'name', str(tool_call.function))
+                tool_args = getattr(tool_call.function, 'arguments', {})
+            elif hasattr(tool_call, 'tool'): # Check for other tool formats
+                tool_name = getattr(tool_call.tool, '__name__', str(tool_call.tool))
+                tool_args = tool_call.arguments if hasattr(tool_call, 'arguments') else {}
+            else: # Fallback if tool structure is unknown
+                tool_name = str(tool_call)
+                tool_args = {}
 
-        # Handle rich formatting for web search results
-        if tool_name == 'web_search':
-            console.print(result)
-            return "Web search results displayed."
-        else:
-            rprint(f"[bold green]Tool Execution Result:[/bold green] {result}")
+            tool_span.name = tool_name
+            tool_span.set(arguments=sorted(tool_args))
+            rprint(f"[bold cyan]Executing tool:[/bold cyan] {tool_name}")
+            rprint(f"[bold cyan]Arguments:[/bold cyan] {tool_args}")
+
+            # Add current_workspace to the arguments if it's expected by the tool
+            if 'current_workspace' in inspect.signature(tool_call).parameters:
+                tool_args['current_workspace'] = current_workspace
+
+            # Execute the tool based on its structure
+            if callable(tool_call):
+                result = tool_call(**tool_args)
+            elif hasattr(tool_call, 'tool') and callable(tool_call.tool):
+                result = tool_call.tool(**tool_args)
+            else:
+                raise ValueError(f"Unable to execute tool: {tool_name}")
+
+            # Tools report failures as strings starting with "Error".
+            if isinstance(result, str) and result.startswith("Error"):
+                tool_span.error = result[:500]
+
+            # Search tools print their own results table; the model still needs the text result.
+            if tool_name not in ('web_search', 'multi_web_search'):
+                rprint(f"[bold green]Tool Execution Result:[/bold green] {result}")
             return result
-    except Exception as e:
-        error_message = f"Error executing tool: {str(e)}"
-        console.print(f"[bold red]Error:[/bold red] {error_message}")
-        return error_message
+        except Exception as e:
+            error_message = f"Error executing tool: {str(e)}"
+            tool_span.error = f"{type(e).__name__}: {e}"
+            console.print(f"[bold red]Error:[/bold red] {error_message}")
+            return error_message
+
+@cli.command("trace-summary")
+@click.option("--file", "trace_file", default=TRACE_FILE, show_default=True, help="JSON lines trace file to read.")
+@click.option("--hours", type=float, default=None, help="Only include spans from the last N hours.")
+def trace_summary(trace_file, hours):
+    """Show latency percentiles, errors and token usage for each traced stage and tool."""
+    if not os.path.exists(trace_file):
+        console.print(f"[yellow]No trace file found at {trace_file}.[/yellow]")
+        return
+    since = time.time() - hours * 3600 if hours else None
+    rows = summarize_spans(read_spans(trace_file), since=since)
+    if not rows:
+        console.print("[yellow]No spans recorded yet.[/yellow]")
+        return
+
+    table = Table(title=f"Trace summary: {trace_file}", show_header=True, header_style="bold magenta")
+    for column in ("Kind", "Name", "Count", "Errors", "p50 ms", "p95 ms", "p99 ms", "Max ms", "Prompt tokens", "Completion tokens"):
+        table.add_column(column, justify="left" if column in ("Kind", "Name") else "right")
+    for row in rows:
+        table.add_row(
+            str(row["kind"]), str(row["name"]), str(row["count"]), str(row["errors"]),
+            f"{row['p50']:.1f}", f"{row['p95']:.1f}", f"{row['p99']:.1f}", f"{row['max']:.1f}",
+            str(row["prompt_tokens"]), str(row["completion_tokens"]),
+        )
+    console.print(table)
 
 if __name__ == "__main__":
     cli()
\ No newline at end of file
@@ -12,4 +12,5 @@ class Task(BaseModel):
 class AgentContext(BaseModel):
     objective: str
     previous_results: List[str] = Field(default_factory=list)
-    tasks: List[Task] = Field(default_factory=list)
\ No newline at end of file
+    tasks: List[Task] = Field(default_factory=list)
+    file_content: Optional[str] = None
\ No newline at end of file
@@ -15,34 +15,113 @@ ELL_STORE_PATH = './ell_logdir'
 ELL_AUTOCOMMIT = True
 
 # Model Configuration
-ORCHESTRATOR_MODEL = "gpt-4o"
-SUB_AGENT_MODEL = "gpt-4o-mini"
-REFINER_MODEL = "gpt-4o-mini"
-CHAT_MODEL = "gpt-4o-mini"
+# Each role runs on a provider: 'openai', 'groq' (hosted, low latency) or 'ollama' (local server, no API key).
+# PRAXIS_MODEL_PROVIDER sets it for every role and PRAXIS_<ROLE>_PROVIDER for one; PRAXIS_<ROLE>_MODEL
+# picks the model, defaulting to the provider's entry below.
+DEFAULT_MODELS = {"openai": "gpt-4o-mini", "groq": "llama-3.1-8b-instant", "ollama": "llama3.1"}
+ORCHESTRATOR_DEFAULT_MODELS = {**DEFAULT_MODELS, "openai": "gpt-4o", "groq": "llama-3.3-70b-versatile"}
+MODEL_PROVIDER = os.getenv("PRAXIS_MODEL_PROVIDER", "openai").lower()
+ORCHESTRATOR_PROVIDER = os.getenv("PRAXIS_ORCHESTRATOR_PROVIDER", MODEL_PROVIDER).lower()
+ORCHESTRATOR_MODEL = os.getenv("PRAXIS_ORCHESTRATOR_MODEL", ORCHESTRATOR_DEFAULT_MODELS.get(ORCHESTRATOR_PROVIDER))
+SUB_AGENT_PROVIDER = os.getenv("PRAXIS_SUB_AGENT_PROVIDER", MODEL_PROVIDER).lower()
+SUB_AGENT_MODEL = os.getenv("PRAXIS_SUB_AGENT_MODEL", DEFAULT_MODELS.get(SUB_AGENT_PROVIDER))
+REFINER_PROVIDER = os.getenv("PRAXIS_REFINER_PROVIDER", MODEL_PROVIDER).lower()
+REFINER_MODEL = os.getenv("PRAXIS_REFINER_MODEL", DEFAULT_MODELS.get(REFINER_PROVIDER))
+CHAT_PROVIDER = os.getenv("PRAXIS_CHAT_PROVIDER", MODEL_PROVIDER).lower()
+CHAT_MODEL = os.getenv("PRAXIS_CHAT_MODEL", DEFAULT_MODELS.get(CHAT_PROVIDER))
+# Ollama's OpenAI-compatible API is served under <OLLAMA_BASE_URL>/v1.
+OLLAMA_BASE_URL = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
 
 # Logging Configuration
-LOG_LEVEL = "INFO"
-LOG_FILE = "praxis_ai.log"
+LOG_LEVEL = os.getenv("PRAXIS_LOG_LEVEL", "INFO").upper()
+# Resolved once, so later changes of the working directory (e.g. entering a workspace) do not move the log.
+LOG_DIR = os.path.abspath(os.path.expanduser(os.getenv("PRAXIS_LOG_DIR", "~/.praxis_ai/logs")))
+LOG_FILE = os.path.join(LOG_DIR, "praxis_ai.log")
+# The log is rotated at LOG_MAX_BYTES, keeping LOG_BACKUP_COUNT old files.
+LOG_MAX_BYTES = int(os.getenv("PRAXIS_LOG_MAX_BYTES", 10 * 1024 * 1024))
+LOG_BACKUP_COUNT = int(os.getenv("PRAXIS_LOG_BACKUP_COUNT", 5))
+# 'json' writes one JSON object per record; 'text' writes the previous plain format.
+LOG_FORMAT = os.getenv("PRAXIS_LOG_FORMAT", "json").lower()
+
+# Tracing Configuration
+# Spans for turns, objectives, LLM calls and tool executions are appended to TRACE_FILE as JSON lines.
+TRACING_ENABLED = os.getenv("PRAXIS_TRACING", "true").lower() == "true"
+TRACE_FILE = os.getenv("PRAXIS_TRACE_FILE", os.path.expanduser("~/.praxis_ai/traces/spans.jsonl"))
+TRACE_MAX_BYTES = int(os.getenv("PRAXIS_TRACE_MAX_BYTES", 64 * 1024 * 1024))
+
+# Profiling Configuration
+# Profiled turns and objectives are saved to PROFILE_DIR as a .prof file and a text report.
+PROFILE_DIR = os.path.abspath(os.path.expanduser(os.getenv("PRAXIS_PROFILE_DIR", "~/.praxis_ai/profiles")))
+# Fraction of CLI turns and API objectives profiled without being asked to; keep it low in production.
+PROFILE_SAMPLE_RATE = float(os.getenv("PRAXIS_PROFILE_SAMPLE_RATE", 0.0))
+# tracemalloc slows allocation-heavy code several times over, so sampled profiles leave it off unless enabled.
+PROFILE_MEMORY = os.getenv("PRAXIS_PROFILE_MEMORY", "false").lower() == "true"
+PROFILE_TOP_N = int(os.getenv("PRAXIS_PROFILE_TOP_N", 15))
+# Whether API clients may ask for a profile with ?profile=true or ?profile_memory=true. tracemalloc slows the
+# whole process, so this is off by default.
+ALLOW_REQUEST_PROFILING = os.getenv("PRAXIS_ALLOW_REQUEST_PROFILING", "false").lower() == "true"
+
+# Cache Configuration
+CACHE_DIR = os.getenv("PRAXIS_CACHE_DIR", os.path.expanduser("~/.praxis_ai/cache"))
+EXTRACTION_CACHE_DIR = os.path.join(CACHE_DIR, "extraction")
+EXTRACTION_CACHE_MAX_BYTES = int(os.getenv("PRAXIS_EXTRACTION_CACHE_MAX_BYTES", 512 * 1024 * 1024))
+SEARCH_CACHE_PATH = os.getenv("PRAXIS_SEARCH_CACHE_PATH", os.path.join(CACHE_DIR, "search.sqlite3"))
+SEARCH_CACHE_MAX_BYTES = int(os.getenv("PRAXIS_SEARCH_CACHE_MAX_BYTES", 64 * 1024 * 1024))
+# Search results expire after SEARCH_CACHE_TTL seconds, or SEARCH_CACHE_NEWS_TTL for time-sensitive queries.
+SEARCH_CACHE_TTL = int(os.getenv("PRAXIS_SEARCH_CACHE_TTL", 24 * 60 * 60))
+SEARCH_CACHE_NEWS_TTL = int(os.getenv("PRAXIS_SEARCH_CACHE_NEWS_TTL", 60 * 60))
+
+# Web Search Configuration
+SEARCH_CONCURRENCY = int(os.getenv("PRAXIS_SEARCH_CONCURRENCY", 8))
+# Snippets returned to the model are trimmed to about SEARCH_SNIPPET_TOKENS tokens, and results whose
+# snippets overlap by at least SEARCH_SNIPPET_SIMILARITY (Jaccard similarity of their words) are dropped.
+SEARCH_SNIPPET_TOKENS = int(os.getenv("PRAXIS_SEARCH_SNIPPET_TOKENS", 120))
+SEARCH_SNIPPET_SIMILARITY = float(os.getenv("PRAXIS_SEARCH_SNIPPET_SIMILARITY", 0.8))
+
+# Web Fetch Configuration
+FETCH_CACHE_PATH = os.getenv("PRAXIS_FETCH_CACHE_PATH", os.path.join(CACHE_DIR, "fetch.sqlite3"))
+FETCH_CACHE_MAX_BYTES = int(os.getenv("PRAXIS_FETCH_CACHE_MAX_BYTES", 256 * 1024 * 1024))
+# Pages with an ETag or Last-Modified header are revalidated on every fetch; others are reused until they expire.
+FETCH_CACHE_TTL = int(os.getenv("PRAXIS_FETCH_CACHE_TTL", 24 * 60 * 60))
+FETCH_CONCURRENCY = int(os.getenv("PRAXIS_FETCH_CONCURRENCY", 8))
+FETCH_TIMEOUT = float(os.getenv("PRAXIS_FETCH_TIMEOUT", 15))
+FETCH_MAX_BYTES = int(os.getenv("PRAXIS_FETCH_MAX_BYTES", 2 * 1024 * 1024))
+FETCH_MAX_CHARS = int(os.getenv("PRAXIS_FETCH_MAX_CHARS", 12000))
+
+# PDF Extraction Configuration
+PDF_PARALLEL_MIN_PAGES = int(os.getenv("PRAXIS_PDF_PARALLEL_MIN_PAGES", 64))
+PDF_EXTRACTION_WORKERS = int(os.getenv("PRAXIS_PDF_EXTRACTION_WORKERS", os.cpu_count() or 1))
+
+# File Operation Configuration
+FILE_BATCH_WORKERS = int(os.getenv("PRAXIS_FILE_BATCH_WORKERS", 16))
+# Text files larger than READ_MAX_BYTES are returned one page of READ_PAGE_BYTES at a time.
+READ_MAX_BYTES = int(os.getenv("PRAXIS_READ_MAX_BYTES", 256 * 1024))
+READ_PAGE_BYTES = int(os.getenv("PRAXIS_READ_PAGE_BYTES", 64 * 1024))
+LIST_PAGE_ENTRIES = int(os.getenv("PRAXIS_LIST_PAGE_ENTRIES", 200))
+GREP_WORKERS = int(os.getenv("PRAXIS_GREP_WORKERS", 8))
+GREP_MAX_RESULTS = int(os.getenv("PRAXIS_GREP_MAX_RESULTS", 100))
 
 # API Configuration (for future use)
 API_HOST = "0.0.0.0"
 API_PORT = 8000
 
 # API Key Configuration
+# Only the keys of the configured model providers are needed; without a Tavily key web search is unavailable.
 TAVILY_API_KEY = os.getenv("TAVILY_API_KEY")
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")  
+OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+GROQ_API_KEY = os.getenv("GROQ_API_KEY")
 
 # Google Calendar API settings
 GOOGLE_CALENDAR_CREDENTIALS_FILE = os.getenv("GOOGLE_CALENDAR_CREDENTIALS_FILE")
+# Resolved once, so later changes of the working directory do not lose the cached token.
+GOOGLE_CALENDAR_TOKEN_FILE = os.path.abspath(os.path.expanduser(os.getenv("GOOGLE_CALENDAR_TOKEN_FILE", "token.json")))
+# Access tokens are refreshed this many seconds before they expire.
+CALENDAR_TOKEN_REFRESH_MARGIN = int(os.getenv("PRAXIS_CALENDAR_TOKEN_REFRESH_MARGIN", 300))
+CALENDAR_TIMEZONE_TTL = int(os.getenv("PRAXIS_CALENDAR_TIMEZONE_TTL", 60 * 60))
+# Events are mirrored locally and synced incrementally at most once per CALENDAR_SYNC_INTERVAL seconds.
+CALENDAR_STORE_DIR = os.getenv("PRAXIS_CALENDAR_STORE_DIR", os.path.join(CACHE_DIR, "calendar"))
+CALENDAR_SYNC_INTERVAL = int(os.getenv("PRAXIS_CALENDAR_SYNC_INTERVAL", 60))
+CALENDAR_SYNC_PAST_DAYS = int(os.getenv("PRAXIS_CALENDAR_SYNC_PAST_DAYS", 30))
 
 # Flag to enable/disable calendar functionality
 ENABLE_CALENDAR = os.getenv("ENABLE_CALENDAR", "false").lower() == "true"
-
-missing_keys = []
-if not TAVILY_API_KEY:
-    missing_keys.append("TAVILY_API_KEY")
-if not OPENAI_API_KEY:
-    missing_keys.append("OPENAI_API_KEY")
-
-if missing_keys:
-    raise ValueError(f"The following API key(s) are not set in the environment variables or .env file: {', '.join(missing_keys)}")
\ No newline at end of file
@@ -0,0 +1,10 @@
+# core/__init__.py
+
+from .providers import configure_models
+from ..utils.tracing import instrument_ell
+
+# Bind each role's model to the client of its configured provider (OpenAI, Groq or Ollama).
+configure_models()
+
+# Report the model and token usage of every LLM call to the span that made it.
+instrument_ell()
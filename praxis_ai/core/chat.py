@@ -3,6 +3,7 @@
 import ell
 from ..config.settings import CHAT_MODEL, PRAXIS_NAME, ENABLE_CALENDAR
 from ..workspace_manager import WorkspaceManager
+from ..utils.tracing import traced
 from typing import List
 from ..tools.workspace_tools import (
     create_workspace_tool,
@@ -14,6 +15,7 @@ from ..tools.workspace_tools import (
 from ..tools.file_operations import (
     read_file_tool,
     write_file_tool,
+    edit_file_tool,
     create_folder_structure_tool,
     create_pdf_tool,
     read_pdf_tool,
@@ -24,13 +26,16 @@ from ..tools.file_operations import (
     copy_file_tool,
     move_file_tool,
     delete_file_tool,
-    list_files_tool
+    list_files_tool,
+    grep_workspace_tool,
+    batch_file_operations_tool
 )
 from ..tools.conversation_history import (
     update_conversation_history_tool,
     read_conversation_history_tool
 )
-from ..tools.web_search import web_search
+from ..tools.web_search import web_search, multi_web_search
+from ..tools.web_fetch import fetch_urls_tool
 
 workspace_manager = WorkspaceManager()
 
@@ -43,6 +48,7 @@ tools = [
     create_folder_tool,
     read_file_tool,
     write_file_tool,
+    edit_file_tool,
     create_folder_structure_tool,
     create_pdf_tool,
     read_pdf_tool,
@@ -54,9 +60,13 @@ tools = [
     move_file_tool,
     delete_file_tool,
     list_files_tool,
+    grep_workspace_tool,
+    batch_file_operations_tool,
     update_conversation_history_tool,
     read_conversation_history_tool,
     web_search,
+    multi_web_search,
+    fetch_urls_tool,
 ]
 
 # Conditionally add calendar tools if enabled
@@ -65,19 +75,24 @@ if ENABLE_CALENDAR:
         get_user_timezone,
         schedule_meeting,
         list_upcoming_meetings,
+        search_meetings,
         update_meeting,
         delete_meeting,
+        batch_update_meetings,
         find_free_time
     )
     tools.extend([
         get_user_timezone,
         schedule_meeting,
         list_upcoming_meetings,
+        search_meetings,
         update_meeting,
         delete_meeting,
+        batch_update_meetings,
         find_free_time
     ])
 
+@traced("chat", kind="llm")
 @ell.complex(model=CHAT_MODEL, tools=tools)
 def chat(user_input: str, conversation_history: List[str], current_workspace: str, tool_results: List[str] = None):
     """Praxis AI Chat function that handles user interactions."""
@@ -107,27 +122,37 @@ def chat(user_input: str, conversation_history: List[str], current_workspace: st
     You have access to several tools, including file operations, web search, and calendar management tools (if enabled). Use them when necessary to complete tasks. Always execute one tool at a time and wait for the result before proceeding.
 
     File Operation Tools:
-    - read_file_tool: Read the contents of a file.
+    - read_file_tool: Read the contents of a file. For large text files, read a window with start_line/end_line or byte_offset/byte_length, and continue with the returned cursor.
     - write_file_tool: Write content to a file.
+    - edit_file_tool: Change part of an existing text file with a unified diff or SEARCH/REPLACE blocks. Prefer it over write_file_tool for small changes to large files.
     - create_folder_structure_tool: Create a folder structure with files.
     - create_pdf_tool: Create a PDF file.
-    - read_pdf_tool: Read the contents of a PDF file.
+    - read_pdf_tool: Read the contents of a PDF file. Use start_page/end_page to read only part of a long document.
     - create_word_document_tool: Create a Word document.
-    - read_word_document_tool: Read the contents of a Word document.
+    - read_word_document_tool: Read the contents of a Word document, including tables. Use start_paragraph/end_paragraph to read part of a long document.
     - create_markdown_file_tool: Create a Markdown file.
     - read_markdown_file_tool: Read the contents of a Markdown file.
     - copy_file_tool: Copy a file within the workspace.
     - move_file_tool: Move a file within the workspace.
     - delete_file_tool: Delete a file from the workspace.
-    - list_files_tool: List files in a directory within the workspace.
+    - list_files_tool: List files in a directory within the workspace, with size and modification time. Set recursive=True to walk subdirectories, filter with a glob pattern and ignore patterns (.gitignore is honored), and pass the returned cursor to get the next page.
+    - grep_workspace_tool: Search workspace text files for a regular expression and get matching lines with line numbers. Use it to find symbols or strings instead of reading files one by one.
+    - batch_file_operations_tool: Copy, move and delete many files in a single call. Prefer it over repeated copy/move/delete calls when reorganizing a workspace.
+
+    Web Search Tools:
+    - web_search: Search the web for a single query.
+    - multi_web_search: Run several related queries concurrently and get one merged, deduplicated result list. Prefer it when researching a topic from several angles.
+    - fetch_urls_tool: Fetch one or more web pages and read their main text. Use it when search snippets are not enough.
 
     Calendar Tools (when enabled):
     - get_user_timezone: Retrieve the user's timezone from Google Calendar settings.
     - schedule_meeting: Schedule a new meeting on Google Calendar.
     - list_upcoming_meetings: List upcoming meetings from Google Calendar.
+    - search_meetings: Find meetings by title, description, location or attendee.
     - update_meeting: Update an existing meeting on Google Calendar.
     - delete_meeting: Delete a meeting from Google Calendar.
-    - find_free_time: Find available time slots for a meeting within a given date range.
+    - batch_update_meetings: Create, update and delete many meetings in one call. Prefer it for bulk changes.
+    - find_free_time: Find available time slots for a meeting within a given date range, optionally for several attendees, within working hours and with buffers around existing events.
 
     Guidelines for responses:
     1. Be concise yet informative. Offer detailed explanations only when necessary or requested.
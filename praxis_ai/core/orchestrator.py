@@ -4,9 +4,11 @@ import ell
 from ..config.settings import ORCHESTRATOR_MODEL, PRAXIS_NAME
 from ..config.models import AgentContext
 from ..workspace_manager import WorkspaceManager
+from ..utils.tracing import traced
 
 workspace_manager = WorkspaceManager()
 
+@traced("orchestrator", kind="llm")
 @ell.complex(model=ORCHESTRATOR_MODEL)
 def orchestrator(context: AgentContext):
     """Praxis AI Orchestrator that breaks down objectives into sub-tasks."""
@@ -14,6 +16,7 @@ def orchestrator(context: AgentContext):
     workspace_path = workspace_manager.get_workspace_path(current_workspace)
     
     previous_results_text = "\n".join(context.previous_results) if context.previous_results else "None"
+    file_content_text = f"\n\nFile content:\n{context.file_content}" if context.file_content else ""
     
     messages = [
         ell.system(f"You are the orchestrator for {PRAXIS_NAME}, a detailed and meticulous AI assistant. "
@@ -29,7 +32,7 @@ def orchestrator(context: AgentContext):
                  f"include the phrase 'The task is complete:' at the beginning of your response. If the objective is not yet fully achieved, "
                  f"break it down into the next sub-task and create a concise and detailed prompt for a subagent to execute that task. "
                  f"Remember to consider the current workspace context and any file operations required in your response.\n\n"
-                 f"Objective: {context.objective}\n\n"
+                 f"Objective: {context.objective}{file_content_text}\n\n"
                  f"Previous sub-task results:\n{previous_results_text}")
     ]
 
@@ -0,0 +1,72 @@
+# core/providers.py
+
+import os
+import ell
+import openai
+from ..config.settings import (
+    ORCHESTRATOR_PROVIDER, ORCHESTRATOR_MODEL, SUB_AGENT_PROVIDER, SUB_AGENT_MODEL,
+    REFINER_PROVIDER, REFINER_MODEL, CHAT_PROVIDER, CHAT_MODEL, OLLAMA_BASE_URL
+)
+from ..utils.logging import logger
+
+PROVIDERS = ("openai", "groq", "ollama")
+
+# Environment variable and display name of each provider's API key; Ollama runs locally and needs none.
+API_KEYS = {"openai": ("OPENAI_API_KEY", "OpenAI"), "groq": ("GROQ_API_KEY", "Groq")}
+
+ROLES = {
+    "orchestrator": (ORCHESTRATOR_PROVIDER, ORCHESTRATOR_MODEL),
+    "sub_agent": (SUB_AGENT_PROVIDER, SUB_AGENT_MODEL),
+    "refiner": (REFINER_PROVIDER, REFINER_MODEL),
+    "chat": (CHAT_PROVIDER, CHAT_MODEL),
+}
+
+def make_client(provider: str):
+    """Create the API client for a provider, reading its key from the environment."""
+    if provider == "openai":
+        return openai.OpenAI()
+    if provider == "groq":
+        try:
+            import groq
+        except ImportError:
+            raise ValueError("The groq provider requires the groq package: pip install groq")
+        return groq.Groq()
+    if provider == "ollama":
+        return openai.OpenAI(base_url=f"{OLLAMA_BASE_URL.rstrip('/')}/v1", api_key="ollama")
+    raise ValueError(f"Unknown model provider '{provider}'. Expected one of: {', '.join(PROVIDERS)}")
+
+def required_api_keys(roles: dict = ROLES) -> list:
+    """(environment variable, provider name) for each API key the configured roles need."""
+    return sorted({API_KEYS[provider] for provider, _ in roles.values() if provider in API_KEYS})
+
+def configure_models(roles: dict = ROLES) -> dict:
+    """
+    Register each role's model with ell, bound to a client for its provider.
+
+    A provider whose API key is not set yet is registered without a client,
+    so calls to its models fail instead of silently falling back to OpenAI;
+    call this again once the key is available. Returns the model to provider
+    mapping.
+    """
+    models = {}
+    for role, (provider, model) in roles.items():
+        if provider not in PROVIDERS:
+            raise ValueError(f"Unknown model provider '{provider}' for {role}. Expected one of: {', '.join(PROVIDERS)}")
+        if not model:
+            raise ValueError(f"No model configured for {role}. Set PRAXIS_{role.upper()}_MODEL.")
+        if models.setdefault(model, provider) != provider:
+            raise ValueError(f"Model '{model}' is configured for both the {models[model]} and {provider} providers.")
+
+    clients = {}
+    for provider in set(models.values()):
+        key_variable, name = API_KEYS.get(provider, (None, None))
+        if key_variable and not os.getenv(key_variable):
+            logger.warning(f"{key_variable} is not set; {name} models are unavailable until it is.")
+            clients[provider] = None
+        else:
+            clients[provider] = make_client(provider)
+
+    for model, provider in models.items():
+        # Replies are only used once complete, and Groq and Ollama report usage reliably only without streaming.
+        ell.config.register_model(model, clients[provider], supports_streaming=None if provider == "openai" else False)
+    return models
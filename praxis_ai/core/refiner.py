@@ -2,9 +2,11 @@ import ell
 from ..config.settings import REFINER_MODEL, PRAXIS_NAME
 from ..config.models import AgentContext
 from ..workspace_manager import WorkspaceManager
+from ..utils.tracing import traced
 
 workspace_manager = WorkspaceManager()
 
+@traced("refiner", kind="llm")
 @ell.complex(model=REFINER_MODEL)
 def refiner(context: AgentContext):
     """Praxis AI Refiner that provides the final output."""
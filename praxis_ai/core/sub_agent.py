@@ -4,10 +4,12 @@ import ell
 from ..config.settings import SUB_AGENT_MODEL, PRAXIS_NAME
 from ..config.models import Task
 from ..workspace_manager import WorkspaceManager
+from ..utils.tracing import traced
 from typing import List
 
 workspace_manager = WorkspaceManager()
 
+@traced("sub_agent", kind="llm")
 @ell.complex(model=SUB_AGENT_MODEL)
 def sub_agent(task: Task, previous_tasks: List[Task] = None):
     """Praxis AI Sub-agent that executes specific tasks."""
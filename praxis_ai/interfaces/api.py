@@ -1,15 +1,31 @@
 # interfaces/api.py
 
-from fastapi import FastAPI, HTTPException
+import os
+import uuid
+from contextlib import contextmanager
+from typing import List
+from fastapi import FastAPI, HTTPException, Response
+from fastapi.responses import PlainTextResponse
 from pydantic import BaseModel
 from ..config.models import AgentContext
 from ..core.orchestrator import orchestrator
 from ..core.sub_agent import sub_agent
 from ..core.refiner import refiner
 from ..utils.helpers import create_task
+from ..utils.tracing import span, span_listeners
+from ..utils.logging import log_context, logger
+from ..utils import profiling
+from ..config.settings import PROFILE_SAMPLE_RATE, PROFILE_MEMORY, ALLOW_REQUEST_PROFILING
+from ..utils.metrics import registry, objectives_in_progress, observe_span, watch_cache
+from ..tools.web_search import search_cache
+from ..tools.web_fetch import fetch_cache
 
 app = FastAPI()
 
+span_listeners.append(observe_span)
+watch_cache("search", search_cache)
+watch_cache("fetch", fetch_cache)
+
 class ObjectiveRequest(BaseModel):
     objective: str
     file_content: str = None
@@ -23,31 +39,60 @@ class FinalResponse(BaseModel):
     objective: str
     refined_output: str
 
+def require_request_profiling(requested: bool, memory: bool):
+    if (requested or memory) and not ALLOW_REQUEST_PROFILING:
+        raise HTTPException(status_code=403, detail="Per-request profiling is disabled. Set PRAXIS_ALLOW_REQUEST_PROFILING=true to enable it.")
+
+@contextmanager
+def profiled(name: str, response: Response, requested: bool, memory: bool):
+    """Profile the block when the request asks for it or it is sampled, and name the saved report in the response."""
+    if not (requested or memory or profiling.should_sample(PROFILE_SAMPLE_RATE)):
+        yield
+        return
+    with profiling.profile(name, memory=memory or PROFILE_MEMORY) as result:
+        yield
+    if result.stats_path:
+        # Only the file name: the server's directory layout is not the client's business.
+        response.headers["X-Praxis-Profile"] = os.path.basename(result.stats_path)
+        logger.info(f"Saved profile of {name} to {result.stats_path}\n{profiling.format_report(result)}")
+
 @app.post("/objective", response_model=List[TaskResponse])
-async def process_objective(request: ObjectiveRequest):
+async def process_objective(request: ObjectiveRequest, response: Response, profile: bool = False,
+                            profile_memory: bool = False):
+    require_request_profiling(profile, profile_memory)
     context = AgentContext(objective=request.objective, file_content=request.file_content)
     
     tasks = []
-    while True:
-        orchestrator_response = orchestrator(context)
-        orchestrator_text = orchestrator_response.text
+    with objectives_in_progress.track_in_progress(), log_context(objective_id=uuid.uuid4().hex), \
+            span("objective", kind="objective") as objective_span, \
+            profiled("objective", response, profile, profile_memory):
+        while True:
+            orchestrator_response = orchestrator(context)
+            orchestrator_text = orchestrator_response.text
+            objective_span.increment("rounds")
 
-        if "The task is complete:" in orchestrator_text:
-            break
+            if "The task is complete:" in orchestrator_text:
+                break
 
-        task = create_task(orchestrator_text)
-        context.tasks.append(task)
-        tasks.append(TaskResponse(task_id=task.id, description=task.description, status=task.status))
+            task = create_task(orchestrator_text)
+            context.tasks.append(task)
+            tasks.append(TaskResponse(task_id=task.id, description=task.description, status=task.status))
 
-        sub_agent_response = sub_agent(task, context.tasks)
-        sub_agent_text = sub_agent_response.text
+            with log_context(task_id=task.id):
+                sub_agent_response = sub_agent(task, context.tasks)
+            sub_agent_text = sub_agent_response.text
 
-        task.result = sub_agent_text
-        task.status = "completed"
-        context.previous_results.append(sub_agent_text)
+            task.result = sub_agent_text
+            task.status = "completed"
+            context.previous_results.append(sub_agent_text)
 
     return tasks
 
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Prometheus metrics for objectives, LLM calls, tools and caches."""
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
 @app.get("/task/{task_id}", response_model=TaskResponse)
 async def get_task(task_id: str):
     # Implement task retrieval logic
@@ -55,9 +100,13 @@ async def get_task(task_id: str):
     return TaskResponse(task_id=task_id, description="Task description", status="completed")
 
 @app.post("/refine", response_model=FinalResponse)
-async def refine_results(context: AgentContext):
-    refiner_response = refiner(context)
-    refined_output = refiner_response.text
+async def refine_results(context: AgentContext, response: Response, profile: bool = False,
+                         profile_memory: bool = False):
+    require_request_profiling(profile, profile_memory)
+    with objectives_in_progress.track_in_progress(), span("refine", kind="objective"), \
+            profiled("refine", response, profile, profile_memory):
+        refiner_response = refiner(context)
+        refined_output = refiner_response.text
 
     return FinalResponse(objective=context.objective, refined_output=refined_output)
 
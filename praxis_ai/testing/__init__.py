@@ -0,0 +1,3 @@
+# testing/__init__.py
+
+from .fake_backend import FakeLLM, FakeTavilyClient, fake_models, fake_search
@@ -0,0 +1,168 @@
+# testing/fake_backend.py
+
+import json
+import re
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+import ell
+import httpx
+import openai
+from ..config.settings import ORCHESTRATOR_MODEL, SUB_AGENT_MODEL, REFINER_MODEL, CHAT_MODEL
+from ..utils.search_results import estimate_tokens
+
+_CODE_HINTS = re.compile(r"```|\bdef |\bclass |\bfunction\b|\bscript\b|\bcode\b", re.IGNORECASE)
+
+def _text(content) -> str:
+    if isinstance(content, str):
+        return content
+    return "\n".join(part.get("text", "") for part in content or [] if isinstance(part, dict))
+
+class FakeLLM:
+    """
+    Deterministic stand-in for the OpenAI chat completions API.
+
+    The reply depends only on the request: the role is recognised from the
+    system prompt and each role answers in the shape the real loop expects.
+    The orchestrator declares the objective complete once ``rounds`` sub-task
+    results are in its prompt, sub-agents answer on a single line, and the
+    refiner returns a project with a folder structure and code files when the
+    results contain code. ``latency`` adds a fixed delay per call, and
+    ``handlers`` replaces the reply for a role with ``handler(messages)``.
+    """
+
+    def __init__(self, rounds: int = 3, latency: float = 0.0, handlers: Optional[Dict[str, Callable]] = None):
+        self.rounds = rounds
+        self.latency = latency
+        self.handlers = handlers or {}
+        self.requests: List[dict] = []
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def role_of(messages: List[dict]) -> str:
+        system = _text(messages[0]["content"]) if messages and messages[0]["role"] == "system" else ""
+        for role, marker in (("orchestrator", "orchestrator for"), ("sub_agent", "sub-agent for"), ("refiner", "refiner for")):
+            if marker in system:
+                return role
+        return "chat"
+
+    def reply(self, messages: List[dict]) -> str:
+        role = self.role_of(messages)
+        if role in self.handlers:
+            return self.handlers[role](messages)
+        user = _text(next((m["content"] for m in reversed(messages) if m["role"] == "user"), ""))
+        return getattr(self, f"_{role}")(user, messages)
+
+    def _orchestrator(self, prompt: str, messages: List[dict]) -> str:
+        objective = prompt.split("Objective: ", 1)[-1].split("\n", 1)[0]
+        previous = prompt.split("Previous sub-task results:\n", 1)[-1].strip()
+        done = 0 if previous in ("", "None") else len(previous.splitlines())
+        uses_file = " using the attached file content" if "\nFile content:\n" in prompt else ""
+        if done >= self.rounds:
+            return f"The task is complete: '{objective}' was addressed in {done} sub-tasks{uses_file}."
+        return f"Sub-task {done + 1}: Work on step {done + 1} of '{objective}'{uses_file}."
+
+    def _sub_agent(self, prompt: str, messages: List[dict]) -> str:
+        system = _text(messages[0]["content"])
+        previous = system.count("\nTask: ")
+        return f"Completed: {' '.join(prompt.split())} (Previous tasks considered: {previous})"
+
+    def _refiner(self, prompt: str, messages: List[dict]) -> str:
+        objective = prompt.split("Objective: ", 1)[-1].split("\n", 1)[0]
+        results = prompt.split("Sub-task results:\n", 1)[-1].split("\n\nPlease review", 1)[0]
+        output = f"Final output for: {objective}\n\n{results}"
+        if _CODE_HINTS.search(results):
+            output += ("\n\nProject Name: fake_project\n"
+                       '<folder_structure>{"fake_project": {"main.py": null, "README.md": null}}</folder_structure>\n'
+                       f"Filename: main.py\n```python\n{results}\n```\n"
+                       f"Filename: README.md\n```markdown\n# {objective}\n```")
+        return output
+
+    def _chat(self, prompt: str, messages: List[dict]) -> str:
+        return f"You said: {prompt}"
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        with self._lock:
+            self.requests.append(body)
+        if self.latency:
+            time.sleep(self.latency)
+        messages = body["messages"]
+        text = self.reply(messages)
+        usage = {
+            "prompt_tokens": sum(estimate_tokens(_text(m.get("content"))) for m in messages),
+            "completion_tokens": estimate_tokens(text),
+        }
+        usage["total_tokens"] = usage["prompt_tokens"] + usage["completion_tokens"]
+        base = {"id": f"fake-{len(self.requests)}", "created": 0, "model": body["model"]}
+
+        if not body.get("stream"):
+            return httpx.Response(200, json={
+                **base, "object": "chat.completion", "usage": usage,
+                "choices": [{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": text}}],
+            })
+        chunks = [
+            {**base, "object": "chat.completion.chunk",
+             "choices": [{"index": 0, "finish_reason": None, "delta": {"role": "assistant", "content": text}}]},
+            {**base, "object": "chat.completion.chunk",
+             "choices": [{"index": 0, "finish_reason": "stop", "delta": {}}]},
+            {**base, "object": "chat.completion.chunk", "choices": [], "usage": usage},
+        ]
+        stream = "".join(f"data: {json.dumps(chunk)}\n\n" for chunk in chunks) + "data: [DONE]\n\n"
+        return httpx.Response(200, content=stream.encode("utf-8"), headers={"Content-Type": "text/event-stream"})
+
+    def client(self) -> openai.OpenAI:
+        """An OpenAI client whose requests are answered in-process by this fake."""
+        return openai.OpenAI(api_key="fake", base_url="http://fake-llm/v1",
+                             http_client=httpx.Client(transport=httpx.MockTransport(self.handle)))
+
+@contextmanager
+def fake_models(llm: Optional[FakeLLM] = None, models=(ORCHESTRATOR_MODEL, SUB_AGENT_MODEL, REFINER_MODEL, CHAT_MODEL)):
+    """Route the given ell models to ``llm`` (a new ``FakeLLM`` by default) until the block exits."""
+    llm = llm or FakeLLM()
+    saved = dict(ell.config.registry)
+    client = llm.client()
+    for model in models:
+        # Keep the model's streaming setting, so requests look like those sent to its configured provider.
+        ell.config.register_model(model, client, supports_streaming=getattr(saved.get(model), "supports_streaming", None))
+    try:
+        yield llm
+    finally:
+        ell.config.registry.clear()
+        ell.config.registry.update(saved)
+
+class FakeTavilyClient:
+    """Deterministic stand-in for ``TavilyClient`` that returns ``max_results`` made-up results per query."""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.queries: List[str] = []
+
+    def search(self, query: str, max_results: int = 5, search_depth: str = "basic", **kwargs) -> dict:
+        self.queries.append(query)
+        if self.latency:
+            time.sleep(self.latency)
+        slug = re.sub(r"\W+", "-", query.lower()).strip("-")
+        return {"query": query, "results": [
+            {"title": f"{query} - result {i}", "url": f"https://example.com/{slug}/{i}",
+             "content": f"Result {i} about {query}. It explains {query} in detail.", "score": 1 - i / 100}
+            for i in range(1, max_results + 1)
+        ]}
+
+@contextmanager
+def fake_search(client: Optional[FakeTavilyClient] = None):
+    """Serve web searches from ``client`` with an empty, temporary search cache until the block exits."""
+    from ..tools import web_search
+    from ..utils.disk_cache import DiskCache
+
+    client = client or FakeTavilyClient()
+    saved = web_search._tavily_client, web_search.search_cache
+    with tempfile.TemporaryDirectory() as cache_dir:
+        web_search._tavily_client = client
+        web_search.search_cache = DiskCache(f"{cache_dir}/search.sqlite3", max_bytes=64 * 1024 * 1024, default_ttl=3600)
+        try:
+            yield client
+        finally:
+            web_search._tavily_client, web_search.search_cache = saved
@@ -8,37 +8,202 @@ from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
 import os.path
 import datetime
+import re
+import threading
+import time
 import pytz
-from ..config.settings import GOOGLE_CALENDAR_CREDENTIALS_FILE, ENABLE_CALENDAR
+from ..config.settings import (
+    GOOGLE_CALENDAR_CREDENTIALS_FILE, GOOGLE_CALENDAR_TOKEN_FILE, CALENDAR_TOKEN_REFRESH_MARGIN, CALENDAR_TIMEZONE_TTL,
+    CALENDAR_STORE_DIR, CALENDAR_SYNC_INTERVAL, CALENDAR_SYNC_PAST_DAYS, ENABLE_CALENDAR
+)
+from ..utils.scheduling import parse_time, merge_intervals, working_windows, find_free_slots
+from ..utils.calendar_store import CalendarStore
 from rich.console import Console
 from rich.prompt import Prompt
 
 console = Console()
 SCOPES = ['https://www.googleapis.com/auth/calendar']
 
+class CalendarClient:
+    """
+    Long-lived holder for the Calendar API service and its credentials.
+
+    The discovery-built service is created once and reused. Credentials are
+    refreshed shortly before they expire rather than after a call fails, and
+    the user's timezone is cached for ``timezone_ttl`` seconds. Each account's
+    events are mirrored in a local ``CalendarStore`` under ``store_dir``.
+    """
+
+    def __init__(self, token_file: str, credentials_file: str = None, refresh_margin: int = 300, timezone_ttl: int = 3600,
+                 store_dir: str = None):
+        self.token_file = token_file
+        self.credentials_file = credentials_file
+        self.refresh_margin = datetime.timedelta(seconds=refresh_margin)
+        self.timezone_ttl = timezone_ttl
+        self.store_dir = store_dir
+        self._lock = threading.RLock()
+        self._creds = None
+        self._service = None
+        self._timezone = None
+        self._timezone_expires_at = 0.0
+        self._store = None
+
+    def _run_flow(self):
+        credentials_file = self.credentials_file or os.environ.get("GOOGLE_CALENDAR_CREDENTIALS_FILE")
+        if not credentials_file:
+            console.print("[yellow]Google Calendar credentials file path not set.[/yellow]")
+            credentials_file = Prompt.ask("Please enter the path to your Google Calendar credentials file")
+            os.environ["GOOGLE_CALENDAR_CREDENTIALS_FILE"] = credentials_file
+        flow = InstalledAppFlow.from_client_secrets_file(credentials_file, SCOPES)
+        creds = flow.run_local_server(port=0)
+        self._save(creds)
+        return creds
+
+    def _save(self, creds):
+        with open(self.token_file, 'w') as token:
+            token.write(creds.to_json())
+
+    def _expiring(self, creds) -> bool:
+        if not creds.valid:
+            return True
+        # google-auth stores expiry as a naive UTC datetime.
+        return creds.expiry is not None and creds.expiry - datetime.datetime.utcnow() < self.refresh_margin
+
+    def credentials(self):
+        """Return valid credentials, refreshing them if they expire within the refresh margin."""
+        with self._lock:
+            if self._creds is None and os.path.exists(self.token_file):
+                self._creds = Credentials.from_authorized_user_file(self.token_file, SCOPES)
+            if self._creds is not None and self._expiring(self._creds):
+                if self._creds.refresh_token:
+                    self._creds.refresh(Request())
+                    self._save(self._creds)
+                elif not self._creds.valid:
+                    self._creds = None
+            if self._creds is None:
+                self._creds = self._run_flow()
+                self._service = None
+            return self._creds
+
+    def service(self):
+        """Return the Calendar API service, building it on first use."""
+        with self._lock:
+            creds = self.credentials()
+            if self._service is None:
+                # The service keeps a reference to creds, which are refreshed in place.
+                self._service = build('calendar', 'v3', credentials=creds, cache_discovery=False)
+            return self._service
+
+    def timezone(self) -> str:
+        """Return the user's calendar timezone, cached for ``timezone_ttl`` seconds."""
+        with self._lock:
+            if self._timezone is None or time.monotonic() >= self._timezone_expires_at:
+                setting = self.service().settings().get(setting='timezone').execute()
+                self._timezone = setting['value']
+                self._timezone_expires_at = time.monotonic() + self.timezone_ttl
+            return self._timezone
+
+    def store(self) -> CalendarStore:
+        """Return the local event store of the signed-in account."""
+        with self._lock:
+            if self._store is None:
+                account = self.service().calendars().get(calendarId='primary').execute()['id']
+                file_name = re.sub(r'[^\w.@-]', '_', account) + '.sqlite3'
+                self._store = CalendarStore(os.path.join(self.store_dir, file_name), CALENDAR_SYNC_PAST_DAYS)
+            return self._store
+
+    def mark_stale(self, calendar_id: str = 'primary'):
+        """Make the next read resync the local store, after events were changed through the API."""
+        with self._lock:
+            if self._store is not None:
+                self._store.mark_stale(calendar_id)
+
+    def reset(self):
+        """Forget the cached service, credentials, timezone and store."""
+        with self._lock:
+            self._creds = None
+            self._service = None
+            self._timezone = None
+            self._store = None
+
+calendar_client = CalendarClient(GOOGLE_CALENDAR_TOKEN_FILE, GOOGLE_CALENDAR_CREDENTIALS_FILE,
+                                 CALENDAR_TOKEN_REFRESH_MARGIN, CALENDAR_TIMEZONE_TTL, CALENDAR_STORE_DIR)
+
 def get_calendar_service():
     if not ENABLE_CALENDAR:
         return None
-
-    creds = None
-    if os.path.exists('token.json'):
-        creds = Credentials.from_authorized_user_file('token.json', SCOPES)
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            creds.refresh(Request())
-        else:
-            if not GOOGLE_CALENDAR_CREDENTIALS_FILE:
-                console.print("[yellow]Google Calendar credentials file path not set.[/yellow]")
-                credentials_file = Prompt.ask("Please enter the path to your Google Calendar credentials file")
-                os.environ["GOOGLE_CALENDAR_CREDENTIALS_FILE"] = credentials_file
-            
-            flow = InstalledAppFlow.from_client_secrets_file(
-                os.environ["GOOGLE_CALENDAR_CREDENTIALS_FILE"], SCOPES)
-            creds = flow.run_local_server(port=0)
-        with open('token.json', 'w') as token:
-            token.write(creds.to_json())
-    
-    return build('calendar', 'v3', credentials=creds)
+    return calendar_client.service()
+
+def get_synced_store() -> CalendarStore:
+    """Return the local event store, syncing the primary calendar first if it is stale."""
+    store = calendar_client.store()
+    if store.needs_sync('primary', CALENDAR_SYNC_INTERVAL):
+        store.sync(calendar_client.service(), 'primary')
+    return store
+
+def list_events_from_api(service, time_min: datetime.datetime = None, time_max: datetime.datetime = None,
+                         max_results: int = 10, query: str = None) -> list:
+    """List events straight from the API, for windows reaching further back than the local mirror."""
+    params = {'calendarId': 'primary', 'maxResults': max_results, 'singleEvents': True, 'orderBy': 'startTime'}
+    if time_min is not None:
+        params['timeMin'] = time_min.isoformat()
+    if time_max is not None:
+        params['timeMax'] = time_max.isoformat()
+    if query:
+        params['q'] = query
+    return service.events().list(**params).execute().get('items', [])
+
+def format_event(event: dict) -> str:
+    start = event['start'].get('dateTime', event['start'].get('date'))
+    end = event['end'].get('dateTime', event['end'].get('date'))
+    attendees = ', '.join([attendee['email'] for attendee in event.get('attendees', [])])
+    return f"- {start} to {end}: {event.get('summary', '(No title)')} (ID: {event['id']})\n  Attendees: {attendees}"
+
+def new_event_body(title: str, description: str, start_time: str, end_time: str, attendees: str, timezone: str) -> dict:
+    """Build the request body for a new event."""
+    return {
+        'summary': title,
+        'description': description,
+        'start': {
+            'dateTime': start_time,
+            'timeZone': timezone,
+        },
+        'end': {
+            'dateTime': end_time,
+            'timeZone': timezone,
+        },
+        'attendees': [{'email': attendee.strip()} for attendee in (attendees or '').split(',') if attendee.strip()],
+        'reminders': {
+            'useDefault': False,
+            'overrides': [
+                {'method': 'email', 'minutes': 24 * 60},
+                {'method': 'popup', 'minutes': 10},
+            ],
+        },
+    }
+
+def event_patch_body(title: str = None, description: str = None, start_time: str = None, end_time: str = None,
+                     attendees: str = None, timezone: str = None) -> dict:
+    """Build a patch body holding only the fields being changed."""
+    body = {}
+    if title:
+        body['summary'] = title
+    if description:
+        body['description'] = description
+    # Patches merge into the existing start and end objects, so an omitted timeZone
+    # keeps the event's own zone and a timezone alone moves both ends to it.
+    for field, time_value in (('start', start_time), ('end', end_time)):
+        if time_value or timezone:
+            body[field] = {}
+            if time_value:
+                body[field]['dateTime'] = time_value
+            if timezone:
+                body[field]['timeZone'] = timezone
+    if attendees:
+        body['attendees'] = [{'email': attendee.strip()} for attendee in attendees.split(',') if attendee.strip()]
+    if not body:
+        raise ValueError("No changes given.")
+    return body
 
 @ell.tool()
 def get_user_timezone():
@@ -52,12 +217,7 @@ def get_user_timezone():
         return "Calendar functionality is not enabled. Please set ENABLE_CALENDAR=true in your environment or .env file to use this feature."
 
     try:
-        service = get_calendar_service()
-        if not service:
-            return "Failed to initialize calendar service. Please check your credentials."
-
-        settings = service.settings().get(setting='timezone').execute()
-        return settings['value']
+        return calendar_client.timezone()
     except HttpError as error:
         return f"An error occurred: {error}"
 
@@ -86,30 +246,12 @@ def schedule_meeting(title: str, description: str, start_time: str, end_time: st
             return "Failed to initialize calendar service. Please check your credentials."
 
         if not timezone:
-            timezone = get_user_timezone()
-
-        event = {
-            'summary': title,
-            'description': description,
-            'start': {
-                'dateTime': start_time,
-                'timeZone': timezone,
-            },
-            'end': {
-                'dateTime': end_time,
-                'timeZone': timezone,
-            },
-            'attendees': [{'email': attendee.strip()} for attendee in attendees.split(',')],
-            'reminders': {
-                'useDefault': False,
-                'overrides': [
-                    {'method': 'email', 'minutes': 24 * 60},
-                    {'method': 'popup', 'minutes': 10},
-                ],
-            },
-        }
+            timezone = calendar_client.timezone()
+
+        event = new_event_body(title, description, start_time, end_time, attendees, timezone)
 
         event = service.events().insert(calendarId='primary', body=event).execute()
+        calendar_client.mark_stale()
         return f"Meeting scheduled successfully. Event ID: {event.get('id')}"
     except HttpError as error:
         return f"An error occurred: {error}"
@@ -135,26 +277,54 @@ def list_upcoming_meetings(max_results: int = 10, time_min: str = None, time_max
         if not service:
             return "Failed to initialize calendar service. Please check your credentials."
 
-        now = datetime.datetime.utcnow().isoformat() + 'Z'
-        time_min = time_min or now
-        
-        events_result = service.events().list(calendarId='primary', timeMin=time_min,
-                                              timeMax=time_max,
-                                              maxResults=max_results, singleEvents=True,
-                                              orderBy='startTime').execute()
-        events = events_result.get('items', [])
+        now = datetime.datetime.now(datetime.timezone.utc)
+        time_min = parse_time(time_min) if time_min else now
+        time_max = parse_time(time_max) if time_max else None
+        store = calendar_client.store()
+        if store.covers(time_min):
+            events = get_synced_store().list_events('primary', time_min, time_max, max_results)
+        else:
+            events = list_events_from_api(service, time_min, time_max, max_results)
 
         if not events:
             return "No upcoming events found."
         
-        event_list = []
-        for event in events:
-            start = event['start'].get('dateTime', event['start'].get('date'))
-            end = event['end'].get('dateTime', event['end'].get('date'))
-            attendees = ', '.join([attendee['email'] for attendee in event.get('attendees', [])])
-            event_list.append(f"- {start} to {end}: {event['summary']}\n  Attendees: {attendees}")
+        event_list = [format_event(event) for event in events]
         
         return "Upcoming events:\n" + "\n".join(event_list)
+    except ValueError as error:
+        return f"Invalid time: {error}"
+    except HttpError as error:
+        return f"An error occurred: {error}"
+
+@ell.tool()
+def search_meetings(query: str, max_results: int = 10, include_past: bool = False):
+    """
+    Search meetings on Google Calendar by title, description, location or attendee email.
+    
+    Args:
+    query (str): The words to look for, e.g. 'design review' or 'alice@example.com'.
+    max_results (int): Maximum number of meetings to return (default: 10).
+    include_past (bool): Whether to include meetings that have already ended (default: False).
+    
+    Returns:
+    str: A formatted list of matching meetings.
+    """
+    if not ENABLE_CALENDAR:
+        return "Calendar functionality is not enabled. Please set ENABLE_CALENDAR=true in your environment or .env file to use this feature."
+
+    try:
+        time_min = None if include_past else datetime.datetime.now(datetime.timezone.utc)
+        if calendar_client.store().covers(time_min):
+            events = get_synced_store().search('primary', query, time_min, max_results)
+        else:
+            service = get_calendar_service()
+            if not service:
+                return "Failed to initialize calendar service. Please check your credentials."
+            events = list_events_from_api(service, max_results=max_results, query=query)
+        if not events:
+            return f"No meetings found matching '{query}'."
+        return f"Meetings matching '{query}':\n" + "\n".join(format_event(event) for event in events)
     except HttpError as error:
         return f"An error occurred: {error}"
 
@@ -183,24 +353,12 @@ def update_meeting(event_id: str, title: str = None, description: str = None, st
         if not service:
             return "Failed to initialize calendar service. Please check your credentials."
 
-        event = service.events().get(calendarId='primary', eventId=event_id).execute()
-
-        if title:
-            event['summary'] = title
-        if description:
-            event['description'] = description
-        if start_time:
-            event['start']['dateTime'] = start_time
-        if end_time:
-            event['end']['dateTime'] = end_time
-        if timezone:
-            event['start']['timeZone'] = timezone
-            event['end']['timeZone'] = timezone
-        if attendees:
-            event['attendees'] = [{'email': attendee.strip()} for attendee in attendees.split(',')]
-
-        updated_event = service.events().update(calendarId='primary', eventId=event_id, body=event).execute()
+        body = event_patch_body(title, description, start_time, end_time, attendees, timezone)
+        updated_event = service.events().patch(calendarId='primary', eventId=event_id, body=body).execute()
+        calendar_client.mark_stale()
         return f"Meeting updated successfully. Event ID: {updated_event['id']}"
+    except ValueError as error:
+        return f"Invalid update: {error}"
     except HttpError as error:
         return f"An error occurred: {error}"
 
@@ -224,12 +382,140 @@ def delete_meeting(event_id: str):
             return "Failed to initialize calendar service. Please check your credentials."
 
         service.events().delete(calendarId='primary', eventId=event_id).execute()
+        calendar_client.mark_stale()
         return f"Meeting with ID {event_id} deleted successfully."
     except HttpError as error:
         return f"An error occurred: {error}"
 
+# The Calendar API accepts at most this many requests per HTTP batch.
+BATCH_MAX_REQUESTS = 50
+
+def execute_batch(service, requests):
+    """
+    Send API requests as HTTP batches of up to ``BATCH_MAX_REQUESTS``.
+
+    Returns one (response, error) pair per request, in the same order.
+    """
+    results = [None] * len(requests)
+
+    def callback(request_id, response, exception):
+        results[int(request_id)] = (response, exception)
+
+    for offset in range(0, len(requests), BATCH_MAX_REQUESTS):
+        batch = service.new_batch_http_request(callback=callback)
+        for index in range(offset, min(offset + BATCH_MAX_REQUESTS, len(requests))):
+            batch.add(requests[index], request_id=str(index))
+        batch.execute()
+    return results
+
+def _batch_request(service, operation: dict):
+    """Build the API request for one batch operation, raising ValueError if it is invalid."""
+    if not isinstance(operation, dict):
+        raise ValueError(f"operation must be an object, got {type(operation).__name__}")
+    action = operation.get('action')
+    events = service.events()
+    if action == 'create':
+        missing = [field for field in ('title', 'start_time', 'end_time') if not operation.get(field)]
+        if missing:
+            raise ValueError(f"create requires {', '.join(missing)}")
+        body = new_event_body(operation['title'], operation.get('description', ''), operation['start_time'],
+                              operation['end_time'], operation.get('attendees'),
+                              operation.get('timezone') or calendar_client.timezone())
+        return events.insert(calendarId='primary', body=body)
+    if action not in ('update', 'delete'):
+        raise ValueError(f"unknown action {action!r}; use create, update or delete")
+    if not operation.get('event_id'):
+        raise ValueError(f"{action} requires event_id")
+    if action == 'delete':
+        return events.delete(calendarId='primary', eventId=operation['event_id'])
+    body = event_patch_body(operation.get('title'), operation.get('description'), operation.get('start_time'),
+                            operation.get('end_time'), operation.get('attendees'), operation.get('timezone'))
+    return events.patch(calendarId='primary', eventId=operation['event_id'], body=body)
+
+@ell.tool()
+def batch_update_meetings(operations: list):
+    """
+    Create, update and delete many meetings on Google Calendar in one call.
+
+    Prefer this over repeated schedule_meeting, update_meeting or delete_meeting calls,
+    e.g. to reschedule a series of meetings or clear a week.
+
+    Args:
+    operations (list): The changes to make. Each is an object with an "action" of:
+        - "create": with "title", "start_time", "end_time" and optional "description", "attendees", "timezone"
+        - "update": with "event_id" and any of "title", "description", "start_time", "end_time", "attendees", "timezone"
+        - "delete": with "event_id"
+        Times are in ISO format and attendees are comma-separated email addresses.
+
+    Returns:
+    str: The result of each operation.
+    """
+    if not ENABLE_CALENDAR:
+        return "Calendar functionality is not enabled. Please set ENABLE_CALENDAR=true in your environment or .env file to use this feature."
+    if not operations:
+        return "Error: No operations given."
+
+    try:
+        service = get_calendar_service()
+        if not service:
+            return "Failed to initialize calendar service. Please check your credentials."
+
+        lines = [None] * len(operations)
+        failed = 0
+        requests = []
+        positions = []
+        for index, operation in enumerate(operations):
+            try:
+                requests.append(_batch_request(service, operation))
+                positions.append(index)
+            except ValueError as error:
+                lines[index] = f"{index + 1}. failed: {error}"
+                failed += 1
+
+        for index, (response, error) in zip(positions, execute_batch(service, requests)):
+            action = operations[index]['action']
+            if error is not None:
+                lines[index] = f"{index + 1}. {action} failed: {error}"
+                failed += 1
+            elif action == 'delete':
+                lines[index] = f"{index + 1}. deleted {operations[index]['event_id']}"
+            else:
+                lines[index] = f"{index + 1}. {action}d {response.get('summary', '')!r} (ID: {response.get('id')})"
+        if requests:
+            calendar_client.mark_stale()
+
+        return f"Batch complete: {len(operations) - failed} succeeded, {failed} failed.\n" + "\n".join(lines)
+    except HttpError as error:
+        return f"An error occurred: {error}"
+
+# The freebusy API accepts at most this many calendars per query.
+FREEBUSY_MAX_CALENDARS = 50
+
+def query_busy_intervals(service, calendar_ids, time_min: datetime.datetime, time_max: datetime.datetime):
+    """
+    Fetch busy intervals for several calendars with as few freebusy queries as possible.
+
+    Returns (busy intervals of all calendars, {calendar id: error reason} for calendars that could not be read).
+    """
+    busy = []
+    errors = {}
+    for offset in range(0, len(calendar_ids), FREEBUSY_MAX_CALENDARS):
+        body = {
+            "timeMin": time_min.isoformat(),
+            "timeMax": time_max.isoformat(),
+            "items": [{"id": calendar_id} for calendar_id in calendar_ids[offset:offset + FREEBUSY_MAX_CALENDARS]]
+        }
+        response = service.freebusy().query(body=body).execute()
+        for calendar_id, calendar in response.get('calendars', {}).items():
+            if calendar.get('errors'):
+                errors[calendar_id] = ", ".join(error.get('reason', 'unknown') for error in calendar['errors'])
+            busy.extend((parse_time(slot['start']), parse_time(slot['end'])) for slot in calendar.get('busy', []))
+    return busy, errors
+
 @ell.tool()
-def find_free_time(duration_minutes: int, start_date: str, end_date: str, timezone: str = None):
+def find_free_time(duration_minutes: int, start_date: str, end_date: str, timezone: str = None, attendees: str = None,
+                   working_hours_start: str = None, working_hours_end: str = None, buffer_minutes: int = 0,
+                   weekdays_only: bool = False, max_slots: int = 20):
     """
     Find available time slots for a meeting of specified duration within a given date range.
     
@@ -238,9 +524,15 @@ def find_free_time(duration_minutes: int, start_date: str, end_date: str, timezo
     start_date (str): The start date of the range to search in ISO format (e.g., '2023-06-01').
     end_date (str): The end date of the range to search in ISO format (e.g., '2023-06-07').
     timezone (str, optional): The timezone to use for the search. If not provided, the user's default timezone will be used.
+    attendees (str, optional): Comma-separated email addresses of other people who must also be free.
+    working_hours_start (str, optional): Earliest meeting start each day, e.g. '09:00'.
+    working_hours_end (str, optional): Latest meeting end each day, e.g. '17:00'.
+    buffer_minutes (int, optional): Minutes to keep free before and after existing events.
+    weekdays_only (bool, optional): Whether to skip Saturdays and Sundays.
+    max_slots (int, optional): The maximum number of slots to return (default: 20).
     
     Returns:
-    str: A list of available time slots.
+    str: A list of available time slots, each at least duration_minutes long.
     """
     if not ENABLE_CALENDAR:
         return "Calendar functionality is not enabled. Please set ENABLE_CALENDAR=true in your environment or .env file to use this feature."
@@ -251,48 +543,39 @@ def find_free_time(duration_minutes: int, start_date: str, end_date: str, timezo
             return "Failed to initialize calendar service. Please check your credentials."
 
         if not timezone:
-            timezone = get_user_timezone()
+            timezone = calendar_client.timezone()
 
         tz = pytz.timezone(timezone)
-        start_datetime = tz.localize(datetime.datetime.fromisoformat(start_date))
-        end_datetime = tz.localize(datetime.datetime.fromisoformat(end_date))
-
-        body = {
-            "timeMin": start_datetime.isoformat(),
-            "timeMax": end_datetime.isoformat(),
-            "timeZone": timezone,
-            "items": [{"id": "primary"}]
-        }
-
-        free_busy_request = service.freebusy().query(body=body).execute()
-        busy_slots = free_busy_request[u'calendars'][u'primary'][u'busy']
-
-        available_slots = []
-        current_slot = start_datetime
-
-        while current_slot < end_datetime:
-            slot_end = current_slot + datetime.timedelta(minutes=duration_minutes)
-            if slot_end > end_datetime:
-                break
-
-            is_free = True
-            for busy in busy_slots:
-                busy_start = datetime.datetime.fromisoformat(busy['start'].rstrip('Z'))
-                busy_end = datetime.datetime.fromisoformat(busy['end'].rstrip('Z'))
-                if (current_slot < busy_end) and (slot_end > busy_start):
-                    is_free = False
-                    current_slot = busy_end
-                    break
-
-            if is_free:
-                available_slots.append(f"{current_slot.isoformat()} - {slot_end.isoformat()}")
-                current_slot = slot_end
-            else:
-                current_slot += datetime.timedelta(minutes=15)
-
-        if available_slots:
-            return "Available time slots:\n" + "\n".join(available_slots)
+        start_datetime = parse_time(start_date, tz)
+        end_datetime = parse_time(end_date, tz)
+        day_start = datetime.time.fromisoformat(working_hours_start) if working_hours_start else None
+        day_end = datetime.time.fromisoformat(working_hours_end) if working_hours_end else None
+
+        # The user's own events come from the local store when it reaches back far enough;
+        # otherwise, and for other attendees, a freebusy query is needed.
+        busy = []
+        errors = {}
+        calendar_ids = [email.strip() for email in (attendees or '').split(',') if email.strip()]
+        if calendar_client.store().covers(start_datetime):
+            busy = get_synced_store().busy_intervals('primary', start_datetime, end_datetime)
         else:
-            return "No available time slots found in the specified range."
+            calendar_ids.insert(0, 'primary')
+        if calendar_ids:
+            queried_busy, errors = query_busy_intervals(service, calendar_ids, start_datetime, end_datetime)
+            busy.extend(queried_busy)
+        busy = merge_intervals(busy, datetime.timedelta(minutes=buffer_minutes))
+        windows = working_windows(start_datetime, end_datetime, tz, day_start, day_end, weekdays_only)
+        slots = find_free_slots(busy, windows, datetime.timedelta(minutes=duration_minutes), max_slots)
+
+        notes = [f"Could not read the calendar of {calendar_id} ({reason}); it was ignored." for calendar_id, reason in errors.items()]
+        if slots:
+            lines = [f"{start.astimezone(tz).isoformat()} - {end.astimezone(tz).isoformat()}" for start, end in slots]
+            return "\n".join(["Available time slots:", *lines, *notes])
+        else:
+            return "\n".join(["No available time slots found in the specified range.", *notes])
+    except pytz.UnknownTimeZoneError as error:
+        return f"Unknown timezone: {error}. Use an IANA name such as 'Europe/London'."
+    except ValueError as error:
+        return f"Invalid date, time or timezone: {error}"
     except HttpError as error:
-        return f"An error occurred: {error}"
\ No newline at end of file
+        return f"An error occurred: {error}"
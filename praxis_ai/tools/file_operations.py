@@ -4,29 +4,96 @@ import ell
 from pathlib import Path
 from ..workspace_manager import WorkspaceManager
 from ..utils.logging import logger
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import letter
-from io import BytesIO
-import pypdf
+from ..utils.extraction_cache import extraction_cache
+from ..utils.pdf_extraction import extract_pdf_text
+from ..utils.pdf_writer import write_pdf
+from ..utils.docx_stream import read_docx_text
+from ..utils.mime_detection import detect_mime_type, is_text_mime, WORD_MIME_TYPES
+from ..utils.file_io import resolve_in_workspace, locate_in_workspace, fast_copy, fast_move, write_if_changed, atomic_write
+from ..utils.patching import apply_patch, PatchError
+from ..utils.text_window import TextWindow
+from ..utils.file_walk import walk_files
+from ..utils.workspace_grep import grep_files
+from ..config.settings import FILE_BATCH_WORKERS, READ_MAX_BYTES, READ_PAGE_BYTES, LIST_PAGE_ENTRIES, GREP_WORKERS, GREP_MAX_RESULTS
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from itertools import islice
 import docx
 import shutil
 import mimetypes
-import magic  # New dependency for improved file type detection
 
 workspace_manager = WorkspaceManager()
 
 def get_mime_type(file_path):
     """Get the MIME type of a file."""
-    return magic.from_file(file_path, mime=True)
+    return detect_mime_type(file_path)
+
+def _extract_pdf_text(full_path: Path, start_page: int = None, end_page: int = None) -> str:
+    """Extract the text of a PDF file, served from the extraction cache when possible."""
+    kind = "pdf" if start_page is None and end_page is None else f"pdf:{start_page}-{end_page}"
+    return extraction_cache.get_or_extract(
+        full_path, kind, lambda: extract_pdf_text(full_path, start_page, end_page))
+
+def _extract_word_text(full_path: Path, start_paragraph: int = None, end_paragraph: int = None) -> str:
+    """Extract the text of a Word document, served from the extraction cache when possible."""
+    if start_paragraph is not None or end_paragraph is not None:
+        # Ranged reads stop parsing early, so they are cheap enough to skip the cache.
+        return read_docx_text(full_path, start_paragraph, end_paragraph)
+    return extraction_cache.get_or_extract(full_path, "docx-stream", lambda: read_docx_text(full_path))
+
+def _read_text_window(full_path: Path, start_line: int = None, end_line: int = None, byte_offset: int = None,
+                      byte_length: int = None, cursor: int = None):
+    """
+    Read a window of a text file through a memory map.
+
+    Returns None when no window was requested and the file is small enough to be
+    returned whole. Otherwise returns the requested lines or bytes (or, for large
+    files, the first page) followed by a footer with the cursor for the next page.
+    """
+    if all(value is None for value in (start_line, end_line, byte_offset, byte_length, cursor)):
+        if full_path.stat().st_size <= READ_MAX_BYTES:
+            return None
+
+    with TextWindow(full_path) as window:
+        if start_line is not None or end_line is not None:
+            first_line = start_line or 1
+            start = window.line_offset(first_line)
+            if end_line is None:
+                text, next_cursor = window.read_page(start, READ_PAGE_BYTES)
+                label = f"Lines from {first_line}"
+            else:
+                text, next_cursor = window.read_lines(first_line, end_line)
+                label = f"Lines {first_line}-{end_line}"
+        elif byte_offset is not None or byte_length is not None:
+            start = byte_offset or 0
+            text, next_cursor = window.read_bytes(start, byte_length or READ_PAGE_BYTES)
+            label = "Byte range"
+        else:
+            start = cursor or 0
+            text, next_cursor = window.read_page(start, READ_PAGE_BYTES)
+            label = "Page"
+        end = next_cursor if next_cursor is not None else window.size
+        footer = f"[{label}: bytes {start}-{end} of {window.size}. "
+        footer += f"Pass cursor={next_cursor} to read the next page.]" if next_cursor is not None else "End of file.]"
+    return f"{text}\n\n{footer}"
 
 @ell.tool()
-def read_file_tool(file_path: str, current_workspace: str) -> str:
+def read_file_tool(file_path: str, current_workspace: str, start_line: int = None, end_line: int = None,
+                   byte_offset: int = None, byte_length: int = None, cursor: int = None) -> str:
     """
     Read the contents of a file in the specified workspace.
 
+    Large text files are returned one page at a time, with a cursor for the next page.
+
     Args:
     file_path (str): The path to the file within the workspace.
     current_workspace (str): The name of the current workspace.
+    start_line (int, optional): For text files, the first line to read (1-based).
+    end_line (int, optional): For text files, the last line to read (inclusive).
+    byte_offset (int, optional): For text files, the byte offset to start reading from.
+    byte_length (int, optional): For text files, the number of bytes to read.
+    cursor (int, optional): For text files, the cursor returned by a previous call, to read the next page.
 
     Returns:
     str: The contents of the file, or an error message if the file cannot be read.
@@ -38,17 +105,19 @@ def read_file_tool(file_path: str, current_workspace: str) -> str:
     full_path = Path(workspace_path) / file_path
     try:
         mime_type = get_mime_type(str(full_path))
-        if mime_type.startswith('text/'):
-            with open(full_path, 'r', encoding='utf-8') as file:
-                content = file.read()
+        if is_text_mime(mime_type):
+            content = _read_text_window(full_path, start_line, end_line, byte_offset, byte_length, cursor)
+            if content is None:
+                with open(full_path, 'r', encoding='utf-8') as file:
+                    content = file.read()
         elif mime_type == 'application/pdf':
-            content = read_pdf_tool(file_path, current_workspace)
-        elif mime_type in ['application/msword', 'application/vnd.openxmlformats-officedocument.wordprocessingml.document']:
-            content = read_word_document_tool(file_path, current_workspace)
+            content = _extract_pdf_text(full_path)
+        elif mime_type in WORD_MIME_TYPES:
+            content = _extract_word_text(full_path)
         else:
             return f"Error: Unsupported file type: {mime_type}"
         return content
-    except IOError as e:
+    except Exception as e:
         error_message = f"Error reading file: {full_path}. Error: {e}"
         logger.error(error_message)
         return error_message
@@ -83,6 +152,43 @@ def write_file_tool(file_path: str, content: str, current_workspace: str) -> str
         logger.error(error_message)
         return error_message
 
+@ell.tool()
+def edit_file_tool(file_path: str, edits: str, current_workspace: str) -> str:
+    """
+    Edit part of a text file in the specified workspace without rewriting the whole file.
+
+    Args:
+    file_path (str): The path to the file within the workspace.
+    edits (str): Either a unified diff with @@ hunk headers, or one or more blocks made of a
+        "<<<<<<< SEARCH" line, the existing lines, a "=======" line, the replacement lines and a
+        ">>>>>>> REPLACE" line. Each search text must match exactly one location in the file.
+    current_workspace (str): The name of the current workspace.
+
+    Returns:
+    str: A success message, or an error message if any edit does not apply. The file is left unchanged on error.
+    """
+    workspace_path = workspace_manager.get_workspace_path(current_workspace)
+    if not workspace_path:
+        return f"Error: No valid workspace path for workspace: {current_workspace}"
+
+    full_path = Path(workspace_path) / file_path
+    try:
+        with open(full_path, 'r', encoding='utf-8', newline='') as file:
+            content = file.read()
+        patched, applied = apply_patch(content, edits)
+        atomic_write(full_path, patched.encode('utf-8'))
+        success_message = f"File edited successfully: {full_path} ({applied} edit(s) applied)"
+        logger.info(success_message)
+        return success_message
+    except PatchError as e:
+        error_message = f"Error editing file: {full_path}. {e}. No changes were written."
+        logger.error(error_message)
+        return error_message
+    except (IOError, UnicodeDecodeError) as e:
+        error_message = f"Error editing file: {full_path}. Error: {e}"
+        logger.error(error_message)
+        return error_message
+
 @ell.tool()
 def create_folder_structure_tool(project_name: str, folder_structure: dict, code_blocks: list, current_workspace: str) -> str:
     """
@@ -111,30 +217,64 @@ def create_folder_structure_tool(project_name: str, folder_structure: dict, code
         logger.error(error_message)
         return error_message
 
-    def create_folders_and_files(current_path: Path, structure: dict, code_blocks: list):
+    results = _materialize_project(project_path, folder_structure, code_blocks)
+    summary = (f"Folder structure created for project '{project_name}' in workspace '{current_workspace}': "
+               f"{len(results['created'])} created, {len(results['updated'])} updated, "
+               f"{len(results['unchanged'])} unchanged")
+    if results["missing"]:
+        summary += f", {len(results['missing'])} without content ({', '.join(results['missing'])})"
+    if results["failed"]:
+        summary += f", {len(results['failed'])} failed ({', '.join(results['failed'])})"
+    return summary + "."
+
+def _materialize_project(project_path: Path, folder_structure: dict, code_blocks: list) -> dict:
+    """
+    Create the folders and files of a project, writing files concurrently.
+
+    Files whose content on disk already matches their code block are left untouched.
+    Returns the relative file paths grouped by outcome: created, updated, unchanged,
+    missing (no code block) and failed.
+    """
+    code_by_name = {}
+    for name, code in code_blocks:
+        code_by_name.setdefault(name, code)
+
+    results = {"created": [], "updated": [], "unchanged": [], "missing": [], "failed": []}
+    files = []
+
+    def collect(current_path: Path, structure: dict):
         for key, value in structure.items():
             path = current_path / key
             if isinstance(value, dict):
                 try:
                     path.mkdir(exist_ok=True)
                     logger.info(f"Created folder: {path}")
-                    create_folders_and_files(path, value, code_blocks)
+                    collect(path, value)
                 except OSError as e:
                     logger.error(f"Error creating folder: {path}. Error: {e}")
+            elif code_by_name.get(key):
+                files.append((path, code_by_name[key]))
             else:
-                code_content = next((code for file, code in code_blocks if file == key), None)
-                if code_content:
-                    try:
-                        with open(path, 'w', encoding='utf-8') as file:
-                            file.write(code_content)
-                        logger.info(f"Created file: {path}")
-                    except IOError as e:
-                        logger.error(f"Error creating file: {path}. Error: {e}")
-                else:
-                    logger.warning(f"Code content not found for file: {key}")
-
-    create_folders_and_files(project_path, folder_structure, code_blocks)
-    return f"Folder structure created for project '{project_name}' in workspace '{current_workspace}'"
+                logger.warning(f"Code content not found for file: {key}")
+                results["missing"].append(str(path.relative_to(project_path)))
+
+    collect(project_path, folder_structure)
+
+    def write(path: Path, code: str) -> str:
+        try:
+            status = write_if_changed(path, code)
+            if status != "unchanged":
+                logger.info(f"{status.capitalize()} file: {path}")
+            return status
+        except OSError as e:
+            logger.error(f"Error creating file: {path}. Error: {e}")
+            return "failed"
+
+    with ThreadPoolExecutor(max_workers=FILE_BATCH_WORKERS) as executor:
+        statuses = list(executor.map(lambda item: write(*item), files))
+    for (path, _), status in zip(files, statuses):
+        results[status].append(str(path.relative_to(project_path)))
+    return results
 
 @ell.tool()
 def create_pdf_tool(file_path: str, content: str, current_workspace: str) -> str:
@@ -145,38 +285,35 @@ def create_pdf_tool(file_path: str, content: str, current_workspace: str) -> str
 
     full_path = Path(workspace_path) / file_path
     try:
-        buffer = BytesIO()
-        c = canvas.Canvas(buffer, pagesize=letter)
-        text_object = c.beginText(40, 750)
-        for line in content.split('\n'):
-            text_object.textLine(line)
-        c.drawText(text_object)
-        c.save()
-
         full_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(full_path, 'wb') as file:
-            file.write(buffer.getvalue())
-        return f"PDF file created successfully: {full_path}"
+        page_count = write_pdf(full_path, [content])
+        return f"PDF file created successfully: {full_path} ({page_count} pages)"
     except Exception as e:
         error_message = f"Error creating PDF file: {full_path}. Error: {e}"
         logger.error(error_message)
         return error_message
 
 @ell.tool()
-def read_pdf_tool(file_path: str, current_workspace: str) -> str:
-    """Read the contents of a PDF file in the specified workspace."""
+def read_pdf_tool(file_path: str, current_workspace: str, start_page: int = None, end_page: int = None) -> str:
+    """
+    Read the contents of a PDF file in the specified workspace.
+
+    Args:
+    file_path (str): The path to the PDF file within the workspace.
+    current_workspace (str): The name of the current workspace.
+    start_page (int, optional): The first page to read (1-based). Defaults to the first page.
+    end_page (int, optional): The last page to read (inclusive). Defaults to the last page.
+
+    Returns:
+    str: The text of the requested pages, or an error message if the file cannot be read.
+    """
     workspace_path = workspace_manager.get_workspace_path(current_workspace)
     if not workspace_path:
         return f"Error: No valid workspace path for workspace: {current_workspace}"
 
     full_path = Path(workspace_path) / file_path
     try:
-        with open(full_path, 'rb') as file:
-            reader = pypdf.PdfReader(file)
-            content = ""
-            for page in reader.pages:
-                content += page.extract_text()
-        return content
+        return _extract_pdf_text(full_path, start_page, end_page)
     except Exception as e:
         error_message = f"Error reading PDF file: {full_path}. Error: {e}"
         logger.error(error_message)
@@ -202,17 +339,26 @@ def create_word_document_tool(file_path: str, content: str, current_workspace: s
         return error_message
 
 @ell.tool()
-def read_word_document_tool(file_path: str, current_workspace: str) -> str:
-    """Read the contents of a Word document in the specified workspace."""
+def read_word_document_tool(file_path: str, current_workspace: str, start_paragraph: int = None, end_paragraph: int = None) -> str:
+    """
+    Read the contents of a Word document in the specified workspace, including table text.
+
+    Args:
+    file_path (str): The path to the Word document within the workspace.
+    current_workspace (str): The name of the current workspace.
+    start_paragraph (int, optional): The first paragraph to read (1-based). Table rows count as paragraphs.
+    end_paragraph (int, optional): The last paragraph to read (inclusive).
+
+    Returns:
+    str: The text of the document, with table cells separated by " | ", or an error message.
+    """
     workspace_path = workspace_manager.get_workspace_path(current_workspace)
     if not workspace_path:
         return f"Error: No valid workspace path for workspace: {current_workspace}"
 
     full_path = Path(workspace_path) / file_path
     try:
-        doc = docx.Document(full_path)
-        content = "\n".join([paragraph.text for paragraph in doc.paragraphs])
-        return content
+        return _extract_word_text(full_path, start_paragraph, end_paragraph)
     except Exception as e:
         error_message = f"Error reading Word document: {full_path}. Error: {e}"
         logger.error(error_message)
@@ -237,16 +383,33 @@ def create_markdown_file_tool(file_path: str, content: str, current_workspace: s
         return error_message
 
 @ell.tool()
-def read_markdown_file_tool(file_path: str, current_workspace: str) -> str:
-    """Read the contents of a Markdown file in the specified workspace."""
+def read_markdown_file_tool(file_path: str, current_workspace: str, start_line: int = None, end_line: int = None,
+                            cursor: int = None) -> str:
+    """
+    Read the contents of a Markdown file in the specified workspace.
+
+    Large files are returned one page at a time, with a cursor for the next page.
+
+    Args:
+    file_path (str): The path to the Markdown file within the workspace.
+    current_workspace (str): The name of the current workspace.
+    start_line (int, optional): The first line to read (1-based).
+    end_line (int, optional): The last line to read (inclusive).
+    cursor (int, optional): The cursor returned by a previous call, to read the next page.
+
+    Returns:
+    str: The contents of the file, or an error message if the file cannot be read.
+    """
     workspace_path = workspace_manager.get_workspace_path(current_workspace)
     if not workspace_path:
         return f"Error: No valid workspace path for workspace: {current_workspace}"
 
     full_path = Path(workspace_path) / file_path
     try:
-        with open(full_path, 'r', encoding='utf-8') as file:
-            content = file.read()
+        content = _read_text_window(full_path, start_line, end_line, cursor=cursor)
+        if content is None:
+            with open(full_path, 'r', encoding='utf-8') as file:
+                content = file.read()
         return content
     except Exception as e:
         error_message = f"Error reading Markdown file: {full_path}. Error: {e}"
@@ -309,8 +472,27 @@ def delete_file_tool(file_path: str, current_workspace: str) -> str:
         return error_message
 
 @ell.tool()
-def list_files_tool(directory_path: str, current_workspace: str) -> str:
-    """List files in a directory within the specified workspace."""
+def list_files_tool(directory_path: str, current_workspace: str, recursive: bool = False, pattern: str = None,
+                    ignore: list = None, max_depth: int = None, limit: int = LIST_PAGE_ENTRIES, cursor: int = None) -> str:
+    """
+    List files in a directory within the specified workspace.
+
+    Each entry is "path<TAB>size in bytes<TAB>modified time". Paths matched by
+    .gitignore files are skipped, as is the .git directory.
+
+    Args:
+    directory_path (str): The directory to list, relative to the workspace.
+    current_workspace (str): The name of the current workspace.
+    recursive (bool, optional): Whether to include files in subdirectories.
+    pattern (str, optional): Only list files matching this glob, e.g. "*.py" or "src/**/*.ts".
+    ignore (list, optional): Extra gitignore-style patterns to skip, e.g. ["node_modules/", "*.log"].
+    max_depth (int, optional): When recursive, how many directory levels to descend.
+    limit (int, optional): The maximum number of entries to return.
+    cursor (int, optional): The cursor returned by a previous call, to list the next page.
+
+    Returns:
+    str: The matching files, or an error message if the directory cannot be listed.
+    """
     workspace_path = workspace_manager.get_workspace_path(current_workspace)
     if not workspace_path:
         return f"Error: No valid workspace path for workspace: {current_workspace}"
@@ -318,9 +500,199 @@ def list_files_tool(directory_path: str, current_workspace: str) -> str:
     full_path = Path(workspace_path) / directory_path
 
     try:
-        files = [f.name for f in full_path.iterdir() if f.is_file()]
-        return f"Files in {full_path}:\n" + "\n".join(files)
+        if not full_path.is_dir():
+            raise NotADirectoryError(f"Not a directory: {directory_path}")
+        start = cursor or 0
+        if start < 0 or limit < 1:
+            raise ValueError("cursor must be >= 0 and limit must be >= 1")
+        entries = walk_files(full_path, recursive=recursive, max_depth=max_depth, pattern=pattern, ignore=ignore)
+        page = list(islice(entries, start, start + limit + 1))
+        has_more = len(page) > limit
+        page = page[:limit]
+
+        lines = [f"{entry.path}\t{entry.size}\t{datetime.fromtimestamp(entry.mtime).isoformat(timespec='seconds')}"
+                 for entry in page]
+        header = f"Files in {full_path}"
+        header += f" (entries {start + 1}-{start + len(page)}):" if page else ": none found."
+        result = "\n".join([header] + lines)
+        if has_more:
+            result += f"\n[More entries available. Pass cursor={start + len(page)} to continue.]"
+        return result
     except Exception as e:
         error_message = f"Error listing files in directory: {full_path}. Error: {e}"
         logger.error(error_message)
-        return error_message
\ No newline at end of file
+        return error_message
+
+@ell.tool()
+def grep_workspace_tool(pattern: str, current_workspace: str, directory_path: str = ".", file_pattern: str = None,
+                        ignore_case: bool = False, context_lines: int = 0, max_results: int = GREP_MAX_RESULTS) -> str:
+    """
+    Search the text files of a workspace for a regular expression, like grep.
+
+    Args:
+    pattern (str): The regular expression to search for, e.g. "def \\w+_tool" or "TODO".
+    current_workspace (str): The name of the current workspace.
+    directory_path (str, optional): The directory to search, relative to the workspace.
+    file_pattern (str, optional): Only search files matching this glob, e.g. "*.py".
+    ignore_case (bool, optional): Whether to match case-insensitively.
+    context_lines (int, optional): The number of lines to show before and after each match.
+    max_results (int, optional): The maximum number of matching lines to return.
+
+    Returns:
+    str: Matching lines as "path:line: text", or an error message if the search fails.
+    """
+    workspace_path = workspace_manager.get_workspace_path(current_workspace)
+    if not workspace_path:
+        return f"Error: No valid workspace path for workspace: {current_workspace}"
+
+    full_path = Path(workspace_path) / directory_path
+
+    try:
+        if not full_path.is_dir():
+            raise NotADirectoryError(f"Not a directory: {directory_path}")
+        matches, scanned, truncated = grep_files(
+            full_path, pattern, file_pattern=file_pattern, ignore_case=ignore_case,
+            context_lines=context_lines, max_results=max_results, workers=GREP_WORKERS)
+    except re.error as e:
+        return f"Error: Invalid regular expression {pattern!r}: {e}"
+    except Exception as e:
+        error_message = f"Error searching directory: {full_path}. Error: {e}"
+        logger.error(error_message)
+        return error_message
+
+    if not matches:
+        return f"No matches for {pattern!r} in {scanned} files."
+    lines = [f"{len(matches)} matches for {pattern!r} in {len({m.path for m in matches})} files:"]
+    for match in matches:
+        if context_lines and len(lines) > 1:
+            lines.append("--")
+        lines.extend(f"{match.path}-{number}- {text}" for number, text in match.before)
+        lines.append(f"{match.path}:{match.line_number}: {match.line}")
+        lines.extend(f"{match.path}-{number}- {text}" for number, text in match.after)
+    if truncated:
+        lines.append(f"[Stopped after {max_results} matches. Narrow the pattern or raise max_results to see more.]")
+    return "\n".join(lines)
+
+BATCH_ACTIONS = ("copy", "move", "delete")
+
+def _validate_batch(workspace_path: str, operations: list):
+    """Resolve and check every batch operation, returning (planned operations, errors)."""
+    root = Path(workspace_path).resolve()
+    planned = []
+    errors = []
+    written = {}
+    read = {}
+    for index, operation in enumerate(operations, 1):
+        if not isinstance(operation, dict):
+            errors.append(f"{index}. operation must be an object, got {type(operation).__name__}")
+            continue
+        action = operation.get("action")
+        source_path = operation.get("source_path")
+        destination_path = operation.get("destination_path")
+        if action not in BATCH_ACTIONS:
+            errors.append(f"{index}. unknown action {action!r}; expected one of {', '.join(BATCH_ACTIONS)}")
+            continue
+        if not source_path or (action != "delete" and not destination_path):
+            errors.append(f"{index}. {action} requires source_path" + ("" if action == "delete" else " and destination_path"))
+            continue
+        try:
+            # Deleting or moving a symlink acts on the link, so its target is left unresolved.
+            if action == "copy":
+                source = resolve_in_workspace(workspace_path, source_path)
+            else:
+                source = locate_in_workspace(workspace_path, source_path)
+            destination = resolve_in_workspace(workspace_path, destination_path) if action != "delete" else None
+        except ValueError as e:
+            errors.append(f"{index}. {e}")
+            continue
+        if not source.is_file() and not (action != "copy" and source.is_symlink()):
+            errors.append(f"{index}. source file does not exist: {source_path}")
+            continue
+        if destination is not None and destination == source:
+            errors.append(f"{index}. source and destination are the same file: {source_path}")
+            continue
+        if destination is not None:
+            existing = next((parent for parent in destination.parents if parent.exists()), None)
+            if existing is not None and not existing.is_dir():
+                errors.append(f"{index}. destination parent is not a directory: {existing.relative_to(root)}")
+                continue
+
+        # Operations run concurrently, so a path that is written (created, moved or
+        # deleted) by one operation must not be touched by any other.
+        targets = [destination] if destination is not None else []
+        if action != "copy":
+            targets.append(source)
+        conflict = next((path for path in targets if path in written or path in read), None)
+        if conflict is None and action == "copy" and source in written:
+            conflict = source
+        if conflict is not None:
+            other = written.get(conflict) or read.get(conflict)
+            errors.append(f"{index}. conflicts with operation {other} on {conflict.relative_to(root)}")
+            continue
+        for path in targets:
+            written[path] = index
+        if action == "copy":
+            read.setdefault(source, index)
+        planned.append((index, action, source, destination))
+    return planned, errors
+
+def _run_batch_operation(action: str, source: Path, destination: Path) -> str:
+    if action == "copy":
+        fast_copy(source, destination)
+    elif action == "move":
+        fast_move(source, destination)
+    else:
+        source.unlink()
+    return action
+
+@ell.tool()
+def batch_file_operations_tool(operations: list, current_workspace: str) -> str:
+    """
+    Copy, move and delete many files within the specified workspace in one call.
+
+    All operations are validated before any of them runs; if one is invalid, nothing is changed.
+    Valid batches run concurrently.
+
+    Args:
+    operations (list): A list of objects, each with an "action" ("copy", "move" or "delete"),
+        a "source_path", and a "destination_path" for copy and move.
+    current_workspace (str): The name of the current workspace.
+
+    Returns:
+    str: A summary with the outcome of each operation, or the validation errors.
+    """
+    workspace_path = workspace_manager.get_workspace_path(current_workspace)
+    if not workspace_path:
+        return f"Error: No valid workspace path for workspace: {current_workspace}"
+    if not operations:
+        return "Error: No operations provided."
+
+    planned, errors = _validate_batch(workspace_path, operations)
+    if errors:
+        error_message = f"Error: Batch rejected, {len(errors)} invalid operation(s). No files were changed.\n" + "\n".join(errors)
+        logger.error(error_message)
+        return error_message
+
+    root = Path(workspace_path).resolve()
+    for parent in {destination.parent for _, _, _, destination in planned if destination is not None}:
+        parent.mkdir(parents=True, exist_ok=True)
+
+    with ThreadPoolExecutor(max_workers=FILE_BATCH_WORKERS) as executor:
+        futures = [(index, action, source, destination, executor.submit(_run_batch_operation, action, source, destination))
+                   for index, action, source, destination in planned]
+
+    lines = []
+    failed = 0
+    for index, action, source, destination, future in futures:
+        target = f"{source.relative_to(root)}" + (f" -> {destination.relative_to(root)}" if destination is not None else "")
+        try:
+            future.result()
+            lines.append(f"{index}. [ok] {action} {target}")
+        except Exception as e:
+            failed += 1
+            lines.append(f"{index}. [error] {action} {target}: {e}")
+            logger.error(f"Batch {action} failed for {target}. Error: {e}")
+
+    summary = f"Batch complete: {len(planned) - failed} succeeded, {failed} failed."
+    logger.info(summary)
+    return summary + "\n" + "\n".join(lines)
@@ -0,0 +1,158 @@
+# tools/web_fetch.py
+
+import ell
+import codecs
+import hashlib
+import threading
+import time
+import requests
+from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from requests.adapters import HTTPAdapter
+from urllib.parse import urldefrag, urlsplit
+from ..utils.logging import logger
+from ..utils.disk_cache import DiskCache
+from ..config.settings import (
+    PRAXIS_NAME, PRAXIS_VERSION, FETCH_CACHE_PATH, FETCH_CACHE_MAX_BYTES, FETCH_CACHE_TTL, FETCH_CONCURRENCY,
+    FETCH_TIMEOUT, FETCH_MAX_BYTES, FETCH_MAX_CHARS
+)
+
+fetch_cache = DiskCache(FETCH_CACHE_PATH, FETCH_CACHE_MAX_BYTES, FETCH_CACHE_TTL)
+
+# Elements that never hold a page's main content.
+_BOILERPLATE_TAGS = ["script", "style", "noscript", "template", "svg", "iframe", "form", "nav", "header", "footer", "aside"]
+_TEXT_TYPES = ("text/", "application/json", "application/xml", "application/xhtml+xml")
+
+_session = None
+_session_lock = threading.Lock()
+
+def get_session() -> requests.Session:
+    """Return the shared HTTP session, which keeps a pool of connections per host."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=FETCH_CONCURRENCY, pool_maxsize=FETCH_CONCURRENCY)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                session.headers["User-Agent"] = f"{PRAXIS_NAME.replace(' ', '')}/{PRAXIS_VERSION}"
+                _session = session
+    return _session
+
+def extract_main_text(html: bytes):
+    """Return the title and readable main text of an HTML page."""
+    soup = BeautifulSoup(html, "html.parser")
+    title = soup.title.get_text(" ", strip=True) if soup.title else ""
+    for element in soup(_BOILERPLATE_TAGS):
+        element.decompose()
+    root = soup.find("main") or soup.find("article") or soup.body or soup
+    lines = (" ".join(line.split()) for line in root.get_text("\n").splitlines())
+    text = "\n".join(line for line in lines if line)
+    return title, text
+
+def _read_capped(response: requests.Response) -> bytes:
+    chunks = []
+    size = 0
+    for chunk in response.iter_content(chunk_size=64 * 1024):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= FETCH_MAX_BYTES:
+            break
+    return b"".join(chunks)[:FETCH_MAX_BYTES]
+
+def _charset(response) -> str:
+    # requests assumes ISO-8859-1 for text/* without a charset; UTF-8 is the far likelier encoding.
+    if "charset=" not in response.headers.get("Content-Type", "").lower() or not response.encoding:
+        return "utf-8"
+    try:
+        codecs.lookup(response.encoding)
+    except LookupError:
+        return "utf-8"
+    return response.encoding
+
+def fetch_page(url: str) -> dict:
+    """
+    Fetch a URL and extract its text, using the on-disk cache.
+
+    Cached pages with an ETag or Last-Modified header are revalidated with a
+    conditional GET, and a 304 response serves the cached text. Pages without
+    validators are served from the cache until they expire.
+    """
+    url, _ = urldefrag(url.strip())
+    if urlsplit(url).scheme not in ("http", "https"):
+        raise ValueError(f"Only http and https URLs can be fetched: {url}")
+    key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    cached = fetch_cache.get(key)
+    headers = {}
+    if cached is not None:
+        if not cached.get("etag") and not cached.get("last_modified"):
+            return cached
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    with get_session().get(url, headers=headers, timeout=FETCH_TIMEOUT, stream=True) as response:
+        if response.status_code == 304 and cached is not None:
+            logger.info(f"Fetch cache revalidated: {url}")
+            fetch_cache.set(key, cached)
+            return cached
+        response.raise_for_status()
+        content_type = response.headers.get("Content-Type", "").split(";")[0].strip().lower()
+        if content_type and not content_type.startswith(_TEXT_TYPES):
+            raise ValueError(f"Unsupported content type: {content_type}")
+        body = _read_capped(response)
+        if content_type in ("text/html", "application/xhtml+xml") or not content_type:
+            title, text = extract_main_text(body)
+        else:
+            title, text = "", body.decode(_charset(response), errors="replace")
+        page = {
+            "url": response.url,
+            "title": title,
+            "text": text,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+    fetch_cache.set(key, page)
+    return page
+
+def _format_page(page: dict, max_chars: int) -> str:
+    text = page["text"]
+    if len(text) > max_chars:
+        text = text[:max_chars].rsplit("\n", 1)[0] + f"\n[Truncated: showing {max_chars} of {len(page['text'])} characters.]"
+    heading = f"## {page['title']}\nURL: {page['url']}" if page["title"] else f"## {page['url']}"
+    return f"{heading}\n\n{text}"
+
+@ell.tool()
+def fetch_urls_tool(urls: list, max_chars_per_page: int = FETCH_MAX_CHARS) -> str:
+    """
+    Fetch web pages and return their main text, without navigation, scripts or other boilerplate.
+
+    Use this to read the full content of pages found with web_search.
+
+    Args:
+    urls (list): The URLs to fetch, e.g. ["https://example.com/article"].
+    max_chars_per_page (int, optional): The maximum number of characters to return per page.
+
+    Returns:
+    str: The title, URL and text of each page, or an error message for pages that could not be fetched.
+    """
+    urls = [url for url in dict.fromkeys(u.strip() for u in urls) if url]
+    if not urls:
+        return "Error: No URLs given."
+
+    start_time = time.time()
+    sections = []
+    with ThreadPoolExecutor(max_workers=min(len(urls), FETCH_CONCURRENCY)) as executor:
+        futures = [executor.submit(copy_context().run, fetch_page, url) for url in urls]
+        for url, future in zip(urls, futures):
+            try:
+                sections.append(_format_page(future.result(), max_chars_per_page))
+            except Exception as e:
+                error_message = f"Error fetching URL: {url}. Error: {e}"
+                logger.error(error_message)
+                sections.append(error_message)
+    logger.info(f"Fetched {len(urls)} URLs in {time.time() - start_time:.2f} seconds")
+    return "\n\n".join(sections)
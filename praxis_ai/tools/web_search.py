@@ -3,23 +3,130 @@
 import ell
 from tavily import TavilyClient
 from ..utils.logging import logger
-from ..config.settings import TAVILY_API_KEY
+from ..utils.disk_cache import DiskCache
+from ..utils.search_results import compact_results, render_results
+from ..config.settings import (
+    TAVILY_API_KEY, SEARCH_CACHE_PATH, SEARCH_CACHE_MAX_BYTES, SEARCH_CACHE_TTL, SEARCH_CACHE_NEWS_TTL,
+    SEARCH_CONCURRENCY, SEARCH_SNIPPET_TOKENS, SEARCH_SNIPPET_SIMILARITY
+)
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
-from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from requests.adapters import HTTPAdapter
+import hashlib
+import json
+import os
+import re
+import requests
+import threading
 import time
 
 console = Console()
 
-@lru_cache(maxsize=100)
+_tavily_client = None
+_tavily_client_lock = threading.Lock()
+
+def get_tavily_client():
+    """Return the shared Tavily client, whose HTTP session keeps connections open between searches."""
+    global _tavily_client
+    if _tavily_client is None:
+        with _tavily_client_lock:
+            if _tavily_client is None:
+                # The CLI may ask for the key after this module was imported.
+                api_key = TAVILY_API_KEY or os.getenv("TAVILY_API_KEY")
+                session = requests.Session()
+                session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=SEARCH_CONCURRENCY))
+                try:
+                    _tavily_client = TavilyClient(api_key=api_key, session=session)
+                except TypeError:  # tavily-python releases without session support
+                    _tavily_client = TavilyClient(api_key=api_key)
+    return _tavily_client
+
+search_cache = DiskCache(SEARCH_CACHE_PATH, SEARCH_CACHE_MAX_BYTES, SEARCH_CACHE_TTL)
+
+# Queries mentioning any of these are about current events and expire sooner.
+_TIME_SENSITIVE = re.compile(
+    r"\b(news|latest|today|tonight|yesterday|breaking|current|currently|now|live|this (week|month)|price|stock|weather|score)\b")
+
+def normalize_query(query: str) -> str:
+    return " ".join(query.lower().split())
+
+def search_cache_key(query: str, **params) -> str:
+    """Cache key for a search: the normalized query plus parameters, independent of their order."""
+    identity = json.dumps({"query": normalize_query(query), **params}, sort_keys=True)
+    return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+def search_ttl(query: str) -> int:
+    return SEARCH_CACHE_NEWS_TTL if _TIME_SENSITIVE.search(normalize_query(query)) else SEARCH_CACHE_TTL
+
 def cached_search(query: str, num_results: int, search_depth: str):
-    tavily_client = TavilyClient(api_key=TAVILY_API_KEY)
-    return tavily_client.search(
+    """Search with Tavily, serving repeated queries from the shared on-disk cache."""
+    key = search_cache_key(query, max_results=num_results, search_depth=search_depth)
+    response = search_cache.get(key)
+    if response is not None:
+        logger.info(f"Search cache hit for query: {query}")
+        return response
+    response = get_tavily_client().search(
         query=query,
         max_results=num_results,
         search_depth=search_depth
     )
+    search_cache.set(key, response, ttl=search_ttl(query))
+    return response
+
+# Query parameters that only track where a visitor came from.
+_TRACKING_PARAMS = {"fbclid", "gclid", "msclkid", "mc_cid", "mc_eid", "ref", "ref_src"}
+
+def canonical_url(url: str) -> str:
+    """Normalize a URL so that links to the same page compare equal."""
+    parts = urlsplit(url.strip())
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    if parts.port and parts.port not in (80, 443):
+        host += f":{parts.port}"
+    query = urlencode(sorted(
+        (name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not name.lower().startswith("utm_") and name.lower() not in _TRACKING_PARAMS
+    ))
+    scheme = "https" if parts.scheme in ("http", "https") else parts.scheme
+    return urlunsplit((scheme, host, parts.path.rstrip("/") or "/", query, ""))
+
+def search_with_retries(query: str, num_results: int, search_depth: str, retries: int = 3):
+    """Run ``cached_search``, retrying failed attempts after a short pause."""
+    for attempt in range(retries):
+        try:
+            return cached_search(query, num_results, search_depth)
+        except Exception as e:
+            if attempt == retries - 1:
+                raise
+            logger.warning(f"Search attempt {attempt + 1} for {query!r} failed. Retrying... Error: {str(e)}")
+            time.sleep(1)
+
+def merge_results(responses):
+    """
+    Merge (query, response) pairs into one result list, deduplicated by canonical URL.
+
+    Results keep the order of the queries and, within a query, Tavily's ranking.
+    Each result lists every query that returned it.
+    """
+    merged = {}
+    for query, response in responses:
+        for result in response['results']:
+            key = canonical_url(result['url'])
+            if key in merged:
+                merged[key]["queries"].append(query)
+                continue
+            merged[key] = {
+                "title": result['title'],
+                "url": result['url'],
+                "snippet": result['content'],
+                "queries": [query],
+            }
+    return list(merged.values())
 
 def format_search_results(results):
     table = Table(title="Search Results", show_header=True, header_style="bold magenta")
@@ -36,14 +143,17 @@ def format_search_results(results):
 
     return table
 
-def summarize_results(results):
-    summary = "Summary of search results:\n"
-    for i, result in enumerate(results, 1):
-        summary += f"{i}. {result['title']}\n"
-    return summary
+def _present(results, output_format: str, header: str, errors=()) -> str:
+    """Compact results and render them for the model: plain text, or JSON when ``output_format`` is 'json'."""
+    results = compact_results(results, SEARCH_SNIPPET_TOKENS, SEARCH_SNIPPET_SIMILARITY)
+    if output_format == "json":
+        return json.dumps({"results": results, "errors": list(errors)}, ensure_ascii=False, separators=(",", ":"))
+    lines = [header.format(count=len(results)), render_results(results), *errors]
+    return "\n".join(line for line in lines if line)
 
 @ell.tool()
-def web_search(query: str, num_results: int = 5, search_depth: str = "basic", retries: int = 3):
+def web_search(query: str, num_results: int = 5, search_depth: str = "basic", retries: int = 3,
+               output_format: str = "text"):
     """
     Perform a web search using the Tavily API and return formatted search results.
     
@@ -52,40 +162,72 @@ def web_search(query: str, num_results: int = 5, search_depth: str = "basic", re
     num_results (int): Number of results to return (default: 5).
     search_depth (str): Depth of search, 'basic' or 'advanced' (default: 'basic').
     retries (int): Number of retries in case of failure (default: 3).
+    output_format (str): 'text' for a numbered list or 'json' (default: 'text').
     
     Returns:
-    str: Formatted search results and summary.
+    str: The search results, each with title, URL and a trimmed snippet.
     """
-    for attempt in range(retries):
-        try:
-            start_time = time.time()
-            response = cached_search(query, num_results, search_depth)
-            end_time = time.time()
+    if output_format not in ("text", "json"):
+        return f"Error: Unknown output format: {output_format}. Use 'text' or 'json'."
+    start_time = time.time()
+    try:
+        response = search_with_retries(query, num_results, search_depth, retries)
+    except Exception as e:
+        error_message = f"Error performing web search after {retries} attempts: {str(e)}"
+        logger.error(error_message)
+        return error_message
+
+    results = [
+        {
+            "title": result['title'],
+            "url": result['url'],
+            "snippet": result['content']
+        }
+        for result in response['results']
+    ]
 
-            results = [
-                {
-                    "title": result['title'],
-                    "url": result['url'],
-                    "snippet": result['content']
-                }
-                for result in response['results']
-            ]
+    console.print(Panel(format_search_results(results), title=f"Web Search Results for: {query}", expand=False))
+    console.print(f"Search completed in {time.time() - start_time:.2f} seconds.")
 
-            table = format_search_results(results)
-            summary = summarize_results(results)
+    return _present(results, output_format, f"{{count}} results for {query!r}:")
 
-            console.print(Panel(table, title=f"Web Search Results for: {query}", expand=False))
-            console.print(f"Search completed in {end_time - start_time:.2f} seconds.")
+@ell.tool()
+def multi_web_search(queries: list, num_results: int = 5, search_depth: str = "basic", output_format: str = "text"):
+    """
+    Run several web searches at once and return their merged results, without duplicates.
 
-            return f"{summary}\n\nDetailed results:\n{table}"
+    Use this instead of repeated web_search calls when researching a topic from several angles.
 
-        except Exception as e:
-            if attempt < retries - 1:
-                logger.warning(f"Search attempt {attempt + 1} failed. Retrying... Error: {str(e)}")
-                time.sleep(1)  # Wait for 1 second before retrying
-            else:
-                error_message = f"Error performing web search after {retries} attempts: {str(e)}"
-                logger.error(error_message)
-                return error_message
-
-    return "Web search failed after multiple attempts."
\ No newline at end of file
+    Args:
+    queries (list): The search queries, e.g. ["rust async runtimes", "tokio vs async-std benchmarks"].
+    num_results (int): Number of results per query (default: 5).
+    search_depth (str): Depth of search, 'basic' or 'advanced' (default: 'basic').
+    output_format (str): 'text' for a numbered list or 'json' (default: 'text').
+
+    Returns:
+    str: The merged search results, noting results found by more than one query.
+    """
+    if output_format not in ("text", "json"):
+        return f"Error: Unknown output format: {output_format}. Use 'text' or 'json'."
+    queries = [query for query in dict.fromkeys(q.strip() for q in queries) if query]
+    if not queries:
+        return "Error: No search queries given."
+
+    start_time = time.time()
+    responses = []
+    failures = []
+    with ThreadPoolExecutor(max_workers=min(len(queries), SEARCH_CONCURRENCY)) as executor:
+        # Each search runs in a copy of this context, so its cache hits are counted on the current span.
+        futures = [executor.submit(copy_context().run, search_with_retries, query, num_results, search_depth) for query in queries]
+        for query, future in zip(queries, futures):
+            try:
+                responses.append((query, future.result()))
+            except Exception as e:
+                logger.error(f"Error performing web search for {query!r}: {str(e)}")
+                failures.append(f"Search for {query!r} failed: {str(e)}")
+
+    results = merge_results(responses)
+    console.print(Panel(format_search_results(results), title=f"Web Search Results for {len(queries)} queries", expand=False))
+    console.print(f"Searches completed in {time.time() - start_time:.2f} seconds.")
+
+    return _present(results, output_format, f"{{count}} unique results for {len(queries)} queries:", failures)
@@ -0,0 +1,185 @@
+# utils/calendar_store.py
+
+import datetime
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import List, Optional
+import pytz
+from googleapiclient.errors import HttpError
+from .logging import logger
+from .scheduling import Interval, parse_time
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    calendar_id TEXT NOT NULL,
+    id TEXT NOT NULL,
+    start_ts REAL NOT NULL,
+    end_ts REAL NOT NULL,
+    search_text TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (calendar_id, id)
+);
+CREATE INDEX IF NOT EXISTS events_by_time ON events (calendar_id, start_ts);
+CREATE TABLE IF NOT EXISTS sync_state (
+    calendar_id TEXT PRIMARY KEY,
+    sync_token TEXT,
+    time_zone TEXT,
+    synced_at REAL NOT NULL,
+    stale INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+def event_bounds(event: dict, tz) -> Interval:
+    """Return an event's start and end as aware datetimes. All-day events span whole days in ``tz``."""
+    bounds = []
+    for field in ("start", "end"):
+        value = event[field]
+        if "dateTime" in value:
+            bounds.append(parse_time(value["dateTime"], tz))
+        else:
+            bounds.append(parse_time(value["date"] + "T00:00:00", tz))
+    return bounds[0], bounds[1]
+
+def is_busy(event: dict) -> bool:
+    """Whether an event blocks time, as the freebusy API would report it."""
+    if event.get("transparency") == "transparent":
+        return False
+    return not any(attendee.get("self") and attendee.get("responseStatus") == "declined"
+                   for attendee in event.get("attendees", []))
+
+class CalendarStore:
+    """
+    Local SQLite mirror of one account's calendar events.
+
+    ``sync`` keeps the mirror current with the Calendar API's incremental sync:
+    the first sync lists every event and stores the returned ``nextSyncToken``,
+    and later syncs fetch only what changed since. When the API rejects an
+    expired token (HTTP 410), the calendar is cleared and fully resynced.
+    """
+
+    def __init__(self, path: str, past_days: int = 30):
+        self.path = path
+        self.past_days = past_days
+        self._local = threading.local()
+        self._sync_lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(_SCHEMA)
+            self._local.connection = connection
+        return connection
+
+    def _state(self, calendar_id: str):
+        return self._connection().execute(
+            "SELECT sync_token, time_zone, synced_at, stale FROM sync_state WHERE calendar_id = ?", (calendar_id,)).fetchone()
+
+    def needs_sync(self, calendar_id: str, max_age: float) -> bool:
+        """Whether the calendar was never synced, was marked stale, or was last synced over ``max_age`` seconds ago."""
+        state = self._state(calendar_id)
+        return state is None or bool(state[3]) or time.time() - state[2] >= max_age
+
+    def mark_stale(self, calendar_id: str):
+        """Force the next ``needs_sync`` check to return True, e.g. after changing events through the API."""
+        self._connection().execute("UPDATE sync_state SET stale = 1 WHERE calendar_id = ?", (calendar_id,))
+
+    def sync(self, service, calendar_id: str = "primary") -> int:
+        """Bring the mirror up to date and return the number of events added, changed or removed."""
+        with self._sync_lock:
+            state = self._state(calendar_id)
+            sync_token = state[0] if state else None
+            try:
+                return self._sync(service, calendar_id, sync_token)
+            except HttpError as error:
+                if sync_token is None or error.resp.status != 410:
+                    raise
+                logger.info(f"Calendar sync token for {calendar_id} expired; running a full sync")
+                return self._sync(service, calendar_id, None)
+
+    def _sync(self, service, calendar_id: str, sync_token: Optional[str]) -> int:
+        params = {"calendarId": calendar_id, "singleEvents": True, "maxResults": 2500}
+        if sync_token:
+            params["syncToken"] = sync_token
+        else:
+            time_min = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(days=self.past_days)
+            params["timeMin"] = time_min.isoformat()
+
+        pages = []
+        page_token = None
+        while True:
+            response = service.events().list(pageToken=page_token, **params).execute()
+            pages.append(response)
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                break
+
+        time_zone = pages[0].get("timeZone") or "UTC"
+        tz = pytz.timezone(time_zone)
+        changed = 0
+        connection = self._connection()
+        with connection:
+            connection.execute("BEGIN")
+            if not sync_token:
+                connection.execute("DELETE FROM events WHERE calendar_id = ?", (calendar_id,))
+            for response in pages:
+                for event in response.get("items", []):
+                    changed += 1
+                    if event.get("status") == "cancelled":
+                        connection.execute("DELETE FROM events WHERE calendar_id = ? AND id = ?", (calendar_id, event["id"]))
+                        continue
+                    start, end = event_bounds(event, tz)
+                    search_text = " ".join([
+                        event.get("summary", ""), event.get("description", ""), event.get("location", ""),
+                        *(attendee.get("email", "") for attendee in event.get("attendees", [])),
+                    ]).lower()
+                    connection.execute(
+                        "INSERT OR REPLACE INTO events (calendar_id, id, start_ts, end_ts, search_text, data) VALUES (?, ?, ?, ?, ?, ?)",
+                        (calendar_id, event["id"], start.timestamp(), end.timestamp(), search_text, json.dumps(event)))
+            connection.execute(
+                "INSERT OR REPLACE INTO sync_state (calendar_id, sync_token, time_zone, synced_at, stale) VALUES (?, ?, ?, ?, 0)",
+                (calendar_id, pages[-1].get("nextSyncToken"), time_zone, time.time()))
+        return changed
+
+    def covers(self, time_min: Optional[datetime.datetime]) -> bool:
+        """Whether the mirror holds every event ending after ``time_min``; it reaches back only ``past_days`` days."""
+        lower_bound = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(days=self.past_days)
+        return time_min is not None and time_min >= lower_bound
+
+    def list_events(self, calendar_id: str, time_min: datetime.datetime, time_max: Optional[datetime.datetime] = None,
+                    limit: Optional[int] = None) -> List[dict]:
+        """Return the events overlapping ``[time_min, time_max)``, ordered by start time."""
+        query = "SELECT data FROM events WHERE calendar_id = ? AND end_ts > ?"
+        params = [calendar_id, time_min.timestamp()]
+        if time_max is not None:
+            query += " AND start_ts < ?"
+            params.append(time_max.timestamp())
+        query += " ORDER BY start_ts LIMIT ?"
+        params.append(-1 if limit is None else limit)
+        return [json.loads(row[0]) for row in self._connection().execute(query, params)]
+
+    def search(self, calendar_id: str, text: str, time_min: Optional[datetime.datetime] = None,
+               limit: int = 10) -> List[dict]:
+        """Return events whose title, description, location or attendees contain every word of ``text``."""
+        query = "SELECT data FROM events WHERE calendar_id = ?"
+        params: list = [calendar_id]
+        for word in text.lower().split():
+            query += " AND instr(search_text, ?) > 0"
+            params.append(word)
+        if time_min is not None:
+            query += " AND end_ts > ?"
+            params.append(time_min.timestamp())
+        query += " ORDER BY start_ts LIMIT ?"
+        params.append(limit)
+        return [json.loads(row[0]) for row in self._connection().execute(query, params)]
+
+    def busy_intervals(self, calendar_id: str, time_min: datetime.datetime, time_max: datetime.datetime) -> List[Interval]:
+        """Return the busy intervals of the calendar between ``time_min`` and ``time_max``."""
+        state = self._state(calendar_id)
+        tz = pytz.timezone(state[1] if state and state[1] else "UTC")
+        return [event_bounds(event, tz) for event in self.list_events(calendar_id, time_min, time_max) if is_busy(event)]
@@ -0,0 +1,131 @@
+# utils/disk_cache.py
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Optional
+from .logging import logger
+from .tracing import record_cache
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at);
+CREATE TABLE IF NOT EXISTS stats (
+    name TEXT PRIMARY KEY,
+    count INTEGER NOT NULL
+);
+"""
+
+class DiskCache:
+    """SQLite-backed key/value cache with per-entry expiry.
+
+    Values are stored as JSON. The database runs in WAL mode, so any number of
+    threads and processes can share one cache file. Once the stored values
+    exceed ``max_bytes``, expired and then least recently used entries are
+    evicted. Hit and miss counts are kept in the database, so ``stats()``
+    reports the hit rate across every process using the cache.
+    """
+
+    def __init__(self, path: str, max_bytes: int, default_ttl: float):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self._local = threading.local()
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(_SCHEMA)
+            self._local.connection = connection
+        return connection
+
+    def _count(self, connection: sqlite3.Connection, name: str):
+        connection.execute(
+            "INSERT INTO stats (name, count) VALUES (?, 1) ON CONFLICT(name) DO UPDATE SET count = count + 1", (name,))
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for ``key``, or None if it is missing or expired."""
+        try:
+            connection = self._connection()
+            now = time.time()
+            row = connection.execute(
+                "SELECT value FROM entries WHERE key = ? AND expires_at > ?", (key, now)).fetchone()
+            if row is None:
+                self._count(connection, "misses")
+                record_cache(False)
+                return None
+            connection.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+            self._count(connection, "hits")
+            record_cache(True)
+            return json.loads(row[0])
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning(f"Error reading cache entry from {self.path}: {e}")
+            return None
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        """Store a JSON-serializable value for ``ttl`` seconds (default: ``default_ttl``)."""
+        data = json.dumps(value)
+        now = time.time()
+        expires_at = now + (self.default_ttl if ttl is None else ttl)
+        try:
+            connection = self._connection()
+            connection.execute(
+                "INSERT OR REPLACE INTO entries (key, value, size, expires_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (key, data, len(data), expires_at, now))
+            self._evict(connection, now)
+        except sqlite3.Error as e:
+            logger.warning(f"Error writing cache entry to {self.path}: {e}")
+
+    def _evict(self, connection: sqlite3.Connection, now: float):
+        total = connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        connection.execute("DELETE FROM entries WHERE expires_at <= ?", (now,))
+        total = connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        target = self.max_bytes * 0.9
+        evicted = []
+        for key, size in connection.execute("SELECT key, size FROM entries ORDER BY accessed_at"):
+            if total <= target:
+                break
+            evicted.append((key,))
+            total -= size
+        connection.executemany("DELETE FROM entries WHERE key = ?", evicted)
+
+    def delete(self, key: str):
+        try:
+            self._connection().execute("DELETE FROM entries WHERE key = ?", (key,))
+        except sqlite3.Error as e:
+            logger.warning(f"Error deleting cache entry from {self.path}: {e}")
+
+    def clear(self):
+        """Remove every entry and reset the statistics."""
+        connection = self._connection()
+        connection.execute("DELETE FROM entries")
+        connection.execute("DELETE FROM stats")
+
+    def stats(self) -> dict:
+        """Return hit/miss counts, hit rate, entry count and stored bytes."""
+        connection = self._connection()
+        counts = dict(connection.execute("SELECT name, count FROM stats").fetchall())
+        entries, size = connection.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        hits, misses = counts.get("hits", 0), counts.get("misses", 0)
+        lookups = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "entries": entries,
+            "bytes": size,
+        }
@@ -0,0 +1,93 @@
+# utils/docx_stream.py
+
+import zipfile
+from itertools import islice
+from typing import Iterator, Optional, Tuple
+from xml.etree.ElementTree import iterparse
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_PARAGRAPH = _W + "p"
+_TABLE = _W + "tbl"
+_ROW = _W + "tr"
+_CELL = _W + "tc"
+
+def _paragraph_text(paragraph) -> str:
+    parts = []
+    for node in paragraph.iter():
+        if node.tag == _W + "t":
+            parts.append(node.text or "")
+        elif node.tag == _W + "tab":
+            parts.append("\t")
+        elif node.tag in (_W + "br", _W + "cr"):
+            parts.append("\n")
+    return "".join(parts)
+
+def iter_docx_blocks(file_path) -> Iterator[Tuple[str, str]]:
+    """
+    Yield the blocks of a .docx file in document order.
+
+    Each block is ``("paragraph", text)`` or ``("table_row", text)``, where the
+    cells of a table row are joined with " | ". ``word/document.xml`` is parsed
+    incrementally and finished elements are discarded, so memory use does not
+    grow with the size of the document.
+    """
+    with zipfile.ZipFile(file_path) as archive, archive.open("word/document.xml") as document:
+        parents = []
+        cells = []  # Paragraph texts of each open table cell
+        rows = []  # Cell texts of each open table row
+        paragraph_depth = 0
+        for event, element in iterparse(document, events=("start", "end")):
+            tag = element.tag
+            if event == "start":
+                parents.append(element)
+                if tag == _PARAGRAPH:
+                    paragraph_depth += 1
+                elif tag == _ROW:
+                    rows.append([])
+                elif tag == _CELL:
+                    cells.append([])
+                continue
+
+            parents.pop()
+            finished = False
+            if tag == _PARAGRAPH:
+                paragraph_depth -= 1
+                # Paragraphs nested in text boxes are part of their enclosing paragraph's text.
+                if paragraph_depth == 0:
+                    text = _paragraph_text(element)
+                    if cells:
+                        cells[-1].append(text)
+                    else:
+                        yield "paragraph", text
+                    finished = True
+            elif tag == _CELL:
+                cell_text = "\n".join(cells.pop())
+                if rows:
+                    rows[-1].append(cell_text)
+            elif tag == _ROW:
+                row_text = " | ".join(rows.pop())
+                if cells:
+                    # Nested table: fold the row into the enclosing cell.
+                    cells[-1].append(row_text)
+                else:
+                    yield "table_row", row_text
+                    finished = True
+
+            if finished and parents:
+                parents[-1].remove(element)
+
+def read_docx_text(file_path, start_paragraph: Optional[int] = None, end_paragraph: Optional[int] = None) -> str:
+    """
+    Return the text of a .docx file, optionally limited to a range of blocks.
+
+    ``start_paragraph`` and ``end_paragraph`` are 1-based and inclusive, and count
+    paragraphs and table rows alike. Parsing stops once the range has been read.
+    """
+    start = (start_paragraph or 1) - 1
+    if start < 0 or (end_paragraph is not None and end_paragraph <= start):
+        raise ValueError("start_paragraph must be >= 1 and end_paragraph must not be before it")
+    blocks = iter_docx_blocks(file_path)
+    try:
+        return "\n".join(text for _, text in islice(blocks, start, end_paragraph))
+    finally:
+        blocks.close()
@@ -0,0 +1,156 @@
+# utils/extraction_cache.py
+
+import os
+import hashlib
+import tempfile
+import threading
+from pathlib import Path
+from typing import Callable, Optional
+from ..config.settings import EXTRACTION_CACHE_DIR, EXTRACTION_CACHE_MAX_BYTES
+from .logging import logger
+from .tracing import record_cache
+
+class ExtractionCache:
+    """On-disk cache for text extracted from documents (PDF, Word, ...).
+
+    Entries are keyed by the resolved path, size and modification time of the
+    source file, so any change to the file invalidates its cached text. The
+    cache directory is shared between processes; writes are atomic and the
+    least recently used entries are evicted once the total size exceeds
+    ``max_bytes``.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._total_bytes: Optional[int] = None
+
+    def _key(self, file_path, kind: str) -> Optional[str]:
+        try:
+            path = Path(file_path).resolve()
+            stat = path.stat()
+        except OSError:
+            return None
+        identity = f"{kind}\0{path}\0{stat.st_size}\0{stat.st_mtime_ns}"
+        return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.txt"
+
+    def get(self, file_path, kind: str) -> Optional[str]:
+        """Return the cached text for a file, or None on a miss."""
+        key = self._key(file_path, kind)
+        return None if key is None else self._get_entry(key)
+
+    def _get_entry(self, key: str) -> Optional[str]:
+        entry = self._entry_path(key)
+        try:
+            with open(entry, "r", encoding="utf-8") as f:
+                text = f.read()
+            os.utime(entry)  # Refresh the entry's position in the LRU order
+            record_cache(True)
+            return text
+        except FileNotFoundError:
+            record_cache(False)
+            return None
+        except OSError as e:
+            logger.warning(f"Error reading extraction cache entry {entry}: {e}")
+            return None
+
+    def put(self, file_path, kind: str, text: str):
+        """Store extracted text for a file."""
+        key = self._key(file_path, kind)
+        if key is not None:
+            self._put_entry(key, text)
+
+    def _put_entry(self, key: str, text: str):
+        entry = self._entry_path(key)
+        data = text.encode("utf-8")
+        if len(data) > self.max_bytes:
+            return
+        try:
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=entry.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, entry)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.warning(f"Error writing extraction cache entry {entry}: {e}")
+            return
+
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = self._scan_size()
+            else:
+                self._total_bytes += len(data)
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def get_or_extract(self, file_path, kind: str, extractor: Callable[[], str]) -> str:
+        """Return cached text for a file, running ``extractor`` on a miss."""
+        # Key on the file as it was before extracting: if it changes meanwhile, the
+        # text is stored under the old identity and never served for the new content.
+        key = self._key(file_path, kind)
+        if key is None:
+            return extractor()
+        text = self._get_entry(key)
+        if text is None:
+            text = extractor()
+            self._put_entry(key, text)
+        return text
+
+    def clear(self):
+        """Remove every entry from the cache."""
+        with self._lock:
+            for entry in self._entries():
+                try:
+                    entry.unlink()
+                except OSError:
+                    pass
+            self._total_bytes = 0
+
+    def _entries(self):
+        if not self.cache_dir.exists():
+            return []
+        return list(self.cache_dir.glob("*/*.txt"))
+
+    def _scan_size(self) -> int:
+        total = 0
+        for entry in self._entries():
+            try:
+                total += entry.stat().st_size
+            except OSError:
+                pass
+        return total
+
+    def _evict(self):
+        # Other processes share the directory, so rescan rather than trusting the running total.
+        entries = []
+        for entry in self._entries():
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry))
+        entries.sort()
+
+        # Evict down to a low-water mark so the next few writes don't trigger another scan.
+        target = int(self.max_bytes * 0.9)
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in entries:
+            if total <= target:
+                break
+            try:
+                entry.unlink()
+                total -= size
+            except OSError:
+                pass
+        self._total_bytes = total
+        logger.info(f"Extraction cache evicted entries; size is now {total} bytes")
+
+extraction_cache = ExtractionCache(EXTRACTION_CACHE_DIR, EXTRACTION_CACHE_MAX_BYTES)
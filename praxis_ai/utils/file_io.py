@@ -0,0 +1,135 @@
+# utils/file_io.py
+
+import os
+import errno
+import hashlib
+import shutil
+import stat
+import tempfile
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# ioctl request number for FICLONE (share extents with another file) on Linux.
+_FICLONE = 0x40049409
+_COPY_CHUNK_BYTES = 1024 * 1024
+_UNSUPPORTED_ERRNOS = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTTY, errno.EBADF, errno.EPERM}
+
+def resolve_in_workspace(workspace_path, relative_path: str) -> Path:
+    """Resolve a path inside a workspace, refusing paths that escape it."""
+    root = Path(workspace_path).resolve()
+    full_path = (root / relative_path).resolve()
+    if full_path != root and root not in full_path.parents:
+        raise ValueError(f"Path is outside the workspace: {relative_path}")
+    return full_path
+
+def locate_in_workspace(workspace_path, relative_path: str) -> Path:
+    """
+    Like ``resolve_in_workspace``, but leave the final component unresolved.
+
+    A symlink then names the link itself rather than its target, which is what
+    deleting or moving it should act on. Only the parent directory must lie
+    inside the workspace; the link may point anywhere.
+    """
+    root = Path(workspace_path).resolve()
+    candidate = Path(os.path.abspath(root / relative_path))
+    parent = candidate.parent.resolve()
+    if parent != root and root not in parent.parents:
+        raise ValueError(f"Path is outside the workspace: {relative_path}")
+    return parent / candidate.name
+
+def _try_reflink(source_file, destination_file) -> bool:
+    if fcntl is None or not hasattr(os, "uname") or os.uname().sysname != "Linux":
+        return False
+    try:
+        fcntl.ioctl(destination_file.fileno(), _FICLONE, source_file.fileno())
+        return True
+    except OSError:
+        return False
+
+def _try_copy_file_range(source_file, destination_file, size: int) -> bool:
+    if not hasattr(os, "copy_file_range"):
+        return False
+    copied = 0
+    while copied < size:
+        try:
+            sent = os.copy_file_range(source_file.fileno(), destination_file.fileno(), size - copied)
+        except OSError as e:
+            if copied == 0 and e.errno in _UNSUPPORTED_ERRNOS:
+                return False
+            raise
+        if sent == 0:
+            break
+        copied += sent
+    return True
+
+def fast_copy(source, destination):
+    """
+    Copy a file's contents and metadata.
+
+    Tries a copy-on-write reflink first, then an in-kernel ``copy_file_range``,
+    and finally falls back to a buffered user-space copy.
+    """
+    size = os.stat(source).st_size
+    with open(source, "rb") as source_file, open(destination, "wb") as destination_file:
+        if not _try_reflink(source_file, destination_file) and not _try_copy_file_range(source_file, destination_file, size):
+            shutil.copyfileobj(source_file, destination_file, _COPY_CHUNK_BYTES)
+    shutil.copystat(source, destination)
+
+def fast_move(source, destination):
+    """Move a file with an atomic rename, falling back to copy-and-delete across filesystems."""
+    try:
+        os.replace(source, destination)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(os.fspath(source), os.fspath(destination))
+
+def _file_digest(path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(_COPY_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def write_if_changed(path, content: str) -> str:
+    """
+    Write text to a file unless it already holds exactly that content.
+
+    Returns "created", "updated" or "unchanged". Existing files are only hashed
+    when their size matches the new content.
+    """
+    data = content.encode("utf-8")
+    try:
+        size = os.stat(path).st_size
+    except FileNotFoundError:
+        status = "created"
+    else:
+        if size == len(data) and _file_digest(path) == hashlib.sha256(data).hexdigest():
+            return "unchanged"
+        status = "updated"
+    with open(path, "wb") as file:
+        file.write(data)
+    return status
+
+def atomic_write(path, data: bytes):
+    """Replace a file's contents atomically via a temporary file in the same directory, keeping its permissions."""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(data)
+        try:
+            os.chmod(tmp_path, stat.S_IMODE(os.stat(path).st_mode))
+        except FileNotFoundError:
+            pass
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,146 @@
+# utils/file_walk.py
+
+import os
+import re
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+ALWAYS_IGNORED = {".git"}
+
+class FileEntry(NamedTuple):
+    path: str  # Relative to the walk root, with "/" separators
+    size: int
+    mtime: float
+
+def translate_glob(pattern: str) -> str:
+    """Translate a gitignore-style glob (supporting ``**``) into a regular expression body."""
+    result = []
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if pattern.startswith("**/", i):
+            result.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("**", i):
+            result.append(".*")
+            i += 2
+        elif char == "*":
+            result.append("[^/]*")
+            i += 1
+        elif char == "?":
+            result.append("[^/]")
+            i += 1
+        elif char == "[":
+            end = pattern.find("]", i + 1)
+            if end == -1:
+                result.append(re.escape(char))
+                i += 1
+            else:
+                body = pattern[i + 1:end]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                result.append(f"[{body}]")
+                i = end + 1
+        else:
+            result.append(re.escape(char))
+            i += 1
+    return "".join(result)
+
+def compile_glob(pattern: str):
+    """Compile a glob. Patterns without a "/" match a name at any depth."""
+    pattern = pattern.strip()
+    anchored = "/" in pattern.rstrip("/")
+    body = translate_glob(pattern.strip("/"))
+    return re.compile(("^" if anchored else "^(?:.*/)?") + body + "$")
+
+class IgnoreRules:
+    """Matcher for gitignore-style patterns, relative to a base directory."""
+
+    def __init__(self, patterns: Iterable[str], base: str = ""):
+        self.base = base
+        self.rules: List[Tuple[re.Pattern, bool, bool]] = []
+        for line in patterns:
+            line = line.rstrip("\n").rstrip()
+            if not line or line.startswith("#"):
+                continue
+            negate = line.startswith("!")
+            if negate:
+                line = line[1:]
+            directory_only = line.endswith("/")
+            self.rules.append((compile_glob(line), negate, directory_only))
+
+    @classmethod
+    def from_file(cls, path: str, base: str = "") -> Optional["IgnoreRules"]:
+        try:
+            with open(path, "r", encoding="utf-8", errors="replace") as file:
+                return cls(file.readlines(), base)
+        except OSError:
+            return None
+
+    def match(self, relative_path: str, is_dir: bool) -> Optional[bool]:
+        """Return True if ignored, False if explicitly re-included, or None if no rule applies."""
+        if self.base:
+            if not relative_path.startswith(self.base + "/"):
+                return None
+            relative_path = relative_path[len(self.base) + 1:]
+        result = None
+        for regex, negate, directory_only in self.rules:
+            if directory_only and not is_dir:
+                continue
+            if regex.match(relative_path):
+                result = not negate
+        return result
+
+def _is_ignored(rule_sets: List[IgnoreRules], relative_path: str, is_dir: bool) -> bool:
+    ignored = False
+    for rules in rule_sets:
+        verdict = rules.match(relative_path, is_dir)
+        if verdict is not None:
+            ignored = verdict
+    return ignored
+
+def walk_files(root, recursive: bool = True, max_depth: Optional[int] = None, pattern: Optional[str] = None,
+               ignore: Optional[Iterable[str]] = None, respect_gitignore: bool = True) -> Iterator[FileEntry]:
+    """
+    Yield the files under ``root`` in a stable, sorted order using ``os.scandir``.
+
+    Args:
+    root: The directory to walk.
+    recursive (bool): Whether to descend into subdirectories.
+    max_depth (int, optional): How many directory levels below ``root`` to descend.
+    pattern (str, optional): Only yield files matching this glob (e.g. "*.py" or "src/**/*.ts").
+    ignore (iterable, optional): Extra gitignore-style patterns to skip.
+    respect_gitignore (bool): Whether to honor .gitignore files found during the walk.
+    """
+    root = os.fspath(root)
+    matcher = compile_glob(pattern) if pattern else None
+    base_rules = [IgnoreRules(ignore)] if ignore else []
+
+    def walk(directory: str, relative_dir: str, depth: int, rule_sets: List[IgnoreRules]):
+        if respect_gitignore:
+            rules = IgnoreRules.from_file(os.path.join(directory, ".gitignore"), relative_dir)
+            if rules is not None:
+                rule_sets = rule_sets + [rules]
+        try:
+            with os.scandir(directory) as iterator:
+                entries = sorted(iterator, key=lambda entry: entry.name)
+        except OSError:
+            return
+        for entry in entries:
+            relative_path = f"{relative_dir}/{entry.name}" if relative_dir else entry.name
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                continue
+            if entry.name in ALWAYS_IGNORED or _is_ignored(rule_sets, relative_path, is_dir):
+                continue
+            if is_dir:
+                if recursive and (max_depth is None or depth < max_depth):
+                    yield from walk(entry.path, relative_path, depth + 1, rule_sets)
+            elif matcher is None or matcher.match(relative_path):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                yield FileEntry(relative_path, stat.st_size, stat.st_mtime)
+
+    yield from walk(root, "", 0, base_rules)
@@ -1,14 +1,112 @@
 # utils/logging.py
 
+import atexit
+import contextvars
+import copy
+import json
 import logging
-from ..config.settings import LOG_LEVEL, LOG_FILE
+import os
+import queue
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Optional
+from ..config.settings import LOG_LEVEL, LOG_FILE, LOG_MAX_BYTES, LOG_BACKUP_COUNT, LOG_FORMAT
+from .tracing import current_span
 
+TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 
-# Configure logging
-logging.basicConfig(
-    level=getattr(logging, LOG_LEVEL),
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    filename=LOG_FILE
-)
+_log_context: contextvars.ContextVar[dict] = contextvars.ContextVar("praxis_log_context", default={})
 
-logger = logging.getLogger("PraxisAI")
\ No newline at end of file
+@contextmanager
+def log_context(**ids):
+    """Attach correlation ids (e.g. objective_id, task_id, workspace) to every record logged inside the block."""
+    token = _log_context.set({**_log_context.get(), **{key: value for key, value in ids.items() if value is not None}})
+    try:
+        yield
+    finally:
+        _log_context.reset(token)
+
+class ContextFilter(logging.Filter):
+    """
+    Copy the correlation ids and the active trace span onto each record.
+
+    It runs on the thread that logs, before the record is queued, because
+    context variables are not visible to the background writer.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        context = _log_context.get()
+        span = current_span()
+        if span is not None:
+            context = {"trace_id": span.trace_id, "span_id": span.span_id, **context}
+        record.context = context
+        return True
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line: time, level, logger, message and correlation ids."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            **getattr(record, "context", {}),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+class _ContextTextFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        line = super().format(record)
+        context = getattr(record, "context", None)
+        if context:
+            line += " [" + " ".join(f"{key}={value}" for key, value in context.items()) + "]"
+        return line
+
+class _PreservingQueueHandler(QueueHandler):
+    """Queue a copy of each record with its message and traceback rendered, but not yet formatted."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+def start_logging(target: Optional[logging.Logger] = None, log_file: str = LOG_FILE, level: str = LOG_LEVEL,
+                  log_format: str = LOG_FORMAT, max_bytes: int = LOG_MAX_BYTES,
+                  backup_count: int = LOG_BACKUP_COUNT) -> QueueListener:
+    """
+    Route ``target``'s records (the root logger by default) through a queue to
+    a size-rotated file written by a background thread.
+
+    Logging calls only add the record to the queue, so they never wait for
+    disk. Returns the started listener; stopping it flushes the queue.
+    """
+    target = target or logging.getLogger()
+    os.makedirs(os.path.dirname(log_file), exist_ok=True)
+    file_handler = RotatingFileHandler(log_file, maxBytes=max_bytes, backupCount=backup_count,
+                                       encoding="utf-8", delay=True)
+    file_handler.setFormatter(JsonFormatter() if log_format == "json" else _ContextTextFormatter(TEXT_FORMAT))
+
+    records = queue.SimpleQueue()
+    queue_handler = _PreservingQueueHandler(records)
+    queue_handler.addFilter(ContextFilter())
+    target.addHandler(queue_handler)
+    target.setLevel(getattr(logging, level, logging.INFO))
+
+    listener = QueueListener(records, file_handler, respect_handler_level=True)
+    listener.start()
+    return listener
+
+listener = start_logging()
+atexit.register(listener.stop)
+
+logger = logging.getLogger("PraxisAI")
@@ -0,0 +1,220 @@
+# utils/metrics.py
+
+import bisect
+import math
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Sequence, Tuple
+from .logging import logger
+from .tracing import Span
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _label_text(names: Sequence[str], values: Sequence, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+class _Metric:
+    type = ""
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.label_names = tuple(labels)
+        self._values: Dict[Tuple, object] = {}
+        self._lock = threading.Lock()
+        if not self.label_names:
+            self._values[()] = self._zero()
+
+    def _zero(self):
+        return 0
+
+    def _key(self, labels: dict) -> Tuple:
+        return tuple(str(labels.get(name, "")) for name in self.label_names)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            return [f"{self.name}{_label_text(self.label_names, key)} {_format_value(value)}"
+                    for key, value in sorted(self._values.items())]
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.type}", *self._samples()]
+        return "\n".join(lines)
+
+class Counter(_Metric):
+    type = "counter"
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def set_total(self, value: float, **labels):
+        """Mirror a running total kept elsewhere, e.g. a cache's persisted hit count, from a collector."""
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+class Gauge(_Metric):
+    type = "gauge"
+
+    def set(self, value: float, **labels):
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels):
+        self.inc(-amount, **labels)
+
+    @contextmanager
+    def track_in_progress(self, **labels):
+        """Increment the gauge while the enclosed block runs."""
+        self.inc(**labels)
+        try:
+            yield
+        finally:
+            self.dec(**labels)
+
+class Histogram(_Metric):
+    type = "histogram"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = (), buckets: Sequence[float] = ()):
+        self.buckets = sorted(buckets)
+        super().__init__(name, help, labels)
+
+    def _zero(self):
+        return [[0] * (len(self.buckets) + 1), 0.0, 0]
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = self._zero()
+            state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted((key, ([*counts], total, count)) for key, (counts, total, count) in self._values.items())
+        lines = []
+        for key, (counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip([*self.buckets, math.inf], counts):
+                cumulative += bucket_count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_label_text(self.label_names, key, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_label_text(self.label_names, key)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_label_text(self.label_names, key)} {count}")
+        return lines
+
+class Registry:
+    """A set of metrics rendered together in the Prometheus text exposition format."""
+
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+        self._collectors: List[Callable[[], None]] = []
+
+    def _add(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def counter(self, name: str, help: str, labels: Sequence[str] = ()) -> Counter:
+        return self._add(Counter(name, help, labels))
+
+    def gauge(self, name: str, help: str, labels: Sequence[str] = ()) -> Gauge:
+        return self._add(Gauge(name, help, labels))
+
+    def histogram(self, name: str, help: str, labels: Sequence[str] = (), buckets: Sequence[float] = ()) -> Histogram:
+        return self._add(Histogram(name, help, labels, buckets))
+
+    def on_collect(self, collector: Callable[[], None]):
+        """Run ``collector`` before every render, e.g. to copy values that are expensive to track live into gauges."""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        for collector in self._collectors:
+            collector()
+        return "\n".join(metric.render() for metric in self._metrics) + "\n"
+
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+ROUND_BUCKETS = (1, 2, 3, 5, 8, 13, 20, 30)
+
+registry = Registry()
+
+objective_duration = registry.histogram(
+    "praxis_objective_duration_seconds", "Time to process an API objective or refine request.", ["endpoint"], LATENCY_BUCKETS)
+orchestrator_rounds = registry.histogram(
+    "praxis_orchestrator_rounds", "Orchestrator calls per objective.", [], ROUND_BUCKETS)
+objectives_in_progress = registry.gauge(
+    "praxis_objectives_in_progress", "Objectives and refine requests currently being processed.")
+llm_duration = registry.histogram(
+    "praxis_llm_call_duration_seconds", "Latency of chat, orchestrator, sub-agent and refiner calls.",
+    ["stage", "model"], LATENCY_BUCKETS)
+llm_tokens = registry.counter(
+    "praxis_llm_tokens_total", "Tokens used by LLM calls.", ["stage", "model", "type"])
+tool_duration = registry.histogram(
+    "praxis_tool_duration_seconds", "Latency of tool executions.", ["tool"], LATENCY_BUCKETS)
+span_errors = registry.counter(
+    "praxis_errors_total", "Traced operations that failed.", ["kind", "name"])
+cache_lookups = registry.counter(
+    "praxis_span_cache_lookups_total", "Cache lookups made during traced operations.", ["kind", "result"])
+cache_hits = registry.counter("praxis_cache_hits_total", "Hits recorded by an on-disk cache, across processes.", ["cache"])
+cache_misses = registry.counter("praxis_cache_misses_total", "Misses recorded by an on-disk cache, across processes.", ["cache"])
+cache_hit_ratio = registry.gauge("praxis_cache_hit_ratio", "Hit rate of an on-disk cache.", ["cache"])
+cache_entries = registry.gauge("praxis_cache_entries", "Entries stored in an on-disk cache.", ["cache"])
+cache_bytes = registry.gauge("praxis_cache_bytes", "Bytes stored in an on-disk cache.", ["cache"])
+
+def observe_span(span: Span):
+    """Span listener that feeds finished spans into the metrics above."""
+    seconds = span.duration_ms / 1000
+    attributes = span.attributes
+    if span.kind == "objective":
+        objective_duration.observe(seconds, endpoint=span.name)
+        if "rounds" in attributes:
+            orchestrator_rounds.observe(attributes["rounds"])
+    elif span.kind == "llm":
+        model = attributes.get("model", "unknown")
+        llm_duration.observe(seconds, stage=span.name, model=model)
+        for token_type in ("prompt", "completion", "cached_prompt"):
+            tokens = attributes.get(f"{token_type}_tokens")
+            if tokens:
+                llm_tokens.inc(tokens, stage=span.name, model=model, type=token_type)
+    elif span.kind == "tool":
+        tool_duration.observe(seconds, tool=span.name)
+    if span.error:
+        span_errors.inc(kind=span.kind, name=span.name)
+    for result, attribute in (("hit", "cache_hits"), ("miss", "cache_misses")):
+        if attributes.get(attribute):
+            cache_lookups.inc(attributes[attribute], kind=span.kind, result=result)
+
+def watch_cache(name: str, cache):
+    """Report a ``DiskCache``'s statistics whenever metrics are collected."""
+    def collect():
+        try:
+            stats = cache.stats()
+        except sqlite3.Error as e:
+            logger.warning(f"Error reading statistics of the {name} cache: {e}")
+            return
+        cache_hits.set_total(stats["hits"], cache=name)
+        cache_misses.set_total(stats["misses"], cache=name)
+        cache_hit_ratio.set(stats["hit_rate"], cache=name)
+        cache_entries.set(stats["entries"], cache=name)
+        cache_bytes.set(stats["bytes"], cache=name)
+    registry.on_collect(collect)
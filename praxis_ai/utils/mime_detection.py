@@ -0,0 +1,109 @@
+# utils/mime_detection.py
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Tuple
+import magic
+
+# Number of leading bytes handed to libmagic when the extension is not known.
+SNIFF_BYTES = 8192
+_CACHE_SIZE = 4096
+
+WORD_MIME_TYPES = ('application/msword', 'application/vnd.openxmlformats-officedocument.wordprocessingml.document')
+
+KNOWN_MIME_TYPES = {
+    '.txt': 'text/plain',
+    '.log': 'text/plain',
+    '.ini': 'text/plain',
+    '.cfg': 'text/plain',
+    '.md': 'text/markdown',
+    '.markdown': 'text/markdown',
+    '.rst': 'text/x-rst',
+    '.csv': 'text/csv',
+    '.tsv': 'text/tab-separated-values',
+    '.html': 'text/html',
+    '.htm': 'text/html',
+    '.css': 'text/css',
+    '.xml': 'text/xml',
+    '.yaml': 'text/yaml',
+    '.yml': 'text/yaml',
+    '.toml': 'text/x-toml',
+    '.py': 'text/x-python',
+    '.js': 'text/javascript',
+    '.jsx': 'text/javascript',
+    '.ts': 'text/x-typescript',
+    '.tsx': 'text/x-typescript',
+    '.java': 'text/x-java',
+    '.c': 'text/x-c',
+    '.h': 'text/x-c',
+    '.cpp': 'text/x-c++',
+    '.hpp': 'text/x-c++',
+    '.go': 'text/x-go',
+    '.rs': 'text/x-rust',
+    '.rb': 'text/x-ruby',
+    '.sh': 'text/x-shellscript',
+    '.sql': 'text/x-sql',
+    '.json': 'application/json',
+    '.pdf': 'application/pdf',
+    '.doc': 'application/msword',
+    '.docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.gif': 'image/gif',
+    '.zip': 'application/zip',
+    '.gz': 'application/gzip',
+}
+
+# Non-text/* types whose content is still plain text.
+TEXT_APPLICATION_TYPES = {
+    'application/json',
+    'application/xml',
+    'application/javascript',
+    'application/x-yaml',
+    'application/x-sh',
+}
+
+_sniff_cache: "OrderedDict[str, Tuple[int, int, str]]" = OrderedDict()
+_sniff_lock = threading.Lock()
+
+def is_text_mime(mime_type: str) -> bool:
+    """Return True if files of this MIME type can be read as text."""
+    return mime_type.startswith('text/') or mime_type in TEXT_APPLICATION_TYPES
+
+def detect_mime_type(file_path) -> str:
+    """
+    Get the MIME type of a file.
+
+    Known extensions are trusted without touching the file. Other files are
+    identified by sniffing their first ``SNIFF_BYTES`` bytes with libmagic, and
+    the result is cached until the file's size or modification time changes.
+    """
+    path = os.fspath(file_path)
+    extension = os.path.splitext(path)[1].lower()
+    if extension in KNOWN_MIME_TYPES:
+        return KNOWN_MIME_TYPES[extension]
+
+    stat = os.stat(path)
+    with _sniff_lock:
+        cached = _sniff_cache.get(path)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            _sniff_cache.move_to_end(path)
+            return cached[2]
+
+    with open(path, 'rb') as file:
+        head = file.read(SNIFF_BYTES)
+    mime_type = magic.from_buffer(head, mime=True) if head else 'text/plain'
+
+    with _sniff_lock:
+        _sniff_cache[path] = (stat.st_mtime_ns, stat.st_size, mime_type)
+        _sniff_cache.move_to_end(path)
+        if len(_sniff_cache) > _CACHE_SIZE:
+            _sniff_cache.popitem(last=False)
+    return mime_type
+
+def clear_mime_cache():
+    """Forget all cached sniffing results."""
+    with _sniff_lock:
+        _sniff_cache.clear()
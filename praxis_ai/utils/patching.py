@@ -0,0 +1,161 @@
+# utils/patching.py
+
+import re
+from typing import List, Optional, Tuple
+
+class PatchError(Exception):
+    """Raised when an edit cannot be applied cleanly."""
+    pass
+
+_HUNK_HEADER = re.compile(r'^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@')
+_LINE_WITH_ENDING = re.compile(r'[^\n]*\n|[^\n]+')
+
+def _split_lines(text: str) -> List[str]:
+    """Split on ``\n`` and ``\r\n`` only; ``str.splitlines`` also breaks on form feeds, U+2028 and friends."""
+    lines = text.split("\n")
+    if lines[-1] == "":
+        lines.pop()
+    return [line[:-1] if line.endswith("\r") else line for line in lines]
+
+def _split_lines_keepends(text: str) -> List[str]:
+    return _LINE_WITH_ENDING.findall(text)
+
+def is_search_replace(edits: str) -> bool:
+    return any(line.rstrip() == "<<<<<<< SEARCH" for line in _split_lines(edits))
+
+def parse_search_replace(edits: str) -> List[Tuple[str, str]]:
+    """Parse ``<<<<<<< SEARCH`` / ``=======`` / ``>>>>>>> REPLACE`` blocks into (search, replace) pairs."""
+    blocks = []
+    lines = _split_lines_keepends(edits)
+    i = 0
+    while i < len(lines):
+        if lines[i].rstrip() != "<<<<<<< SEARCH":
+            i += 1
+            continue
+        search, replace = [], []
+        i += 1
+        while i < len(lines) and lines[i].rstrip() != "=======":
+            search.append(lines[i])
+            i += 1
+        if i == len(lines):
+            raise PatchError(f"Edit {len(blocks) + 1}: missing '=======' separator")
+        i += 1
+        while i < len(lines) and lines[i].rstrip() != ">>>>>>> REPLACE":
+            replace.append(lines[i])
+            i += 1
+        if i == len(lines):
+            raise PatchError(f"Edit {len(blocks) + 1}: missing '>>>>>>> REPLACE' marker")
+        blocks.append(("".join(search), "".join(replace)))
+        i += 1
+    return blocks
+
+def apply_search_replace(content: str, edits: str) -> Tuple[str, int]:
+    """Apply search/replace blocks in order. Each search text must match exactly once."""
+    blocks = parse_search_replace(edits)
+    if not blocks:
+        raise PatchError("No search/replace blocks found")
+    newline = "\r\n" if "\r\n" in content else "\n"
+    for number, (search, replace) in enumerate(blocks, 1):
+        if newline != "\n":
+            search = search.replace("\r\n", "\n").replace("\n", newline)
+            replace = replace.replace("\r\n", "\n").replace("\n", newline)
+        if not search:
+            raise PatchError(f"Edit {number}: search text is empty")
+        count = content.count(search)
+        if count == 0 and search.endswith(newline) and content.endswith(search[:-len(newline)]):
+            # The last line of the file has no trailing newline.
+            search = search[:-len(newline)]
+            replace = replace[:-len(newline)] if replace.endswith(newline) else replace
+            count = content.count(search)
+        if count == 0:
+            raise PatchError(f"Edit {number}: search text not found in file")
+        if count > 1:
+            raise PatchError(f"Edit {number}: search text matches {count} locations; include more surrounding lines")
+        content = content.replace(search, replace, 1)
+    return content, len(blocks)
+
+def _parse_hunks(diff: str) -> List[Tuple[int, List[str], List[str]]]:
+    hunks = []
+    current = None
+    old_left = new_left = 0
+    for line in _split_lines(diff):
+        match = _HUNK_HEADER.match(line)
+        if match:
+            current = (int(match.group(1)), [], [])
+            hunks.append(current)
+            old_left = 1 if match.group(2) is None else int(match.group(2))
+            new_left = 1 if match.group(4) is None else int(match.group(4))
+            continue
+        # "--- "/"+++ " are file headers only once the hunk's counted lines are used up;
+        # inside a hunk they are removed "-- ..." or added "++ ..." lines.
+        if current is None or (old_left <= 0 and new_left <= 0 and line.startswith(("--- ", "+++ "))):
+            continue
+        if line.startswith("\\"):
+            continue  # "\ No newline at end of file"
+        tag, text = (line[0], line[1:]) if line else (" ", "")
+        if tag == " ":
+            current[1].append(text)
+            current[2].append(text)
+            old_left -= 1
+            new_left -= 1
+        elif tag == "-":
+            current[1].append(text)
+            old_left -= 1
+        elif tag == "+":
+            current[2].append(text)
+            new_left -= 1
+        else:
+            raise PatchError(f"Unexpected line in hunk {len(hunks)}: {line!r}")
+    return hunks
+
+def _find_block(lines: List[str], block: List[str], expected: int, lower: int) -> Optional[int]:
+    """Find ``block`` in ``lines`` at or after ``lower``, searching outward from ``expected``."""
+    last = len(lines) - len(block)
+    expected = min(max(expected, lower), max(last, lower))
+    for normalize in (lambda s: s, lambda s: s.rstrip()):
+        wanted = [normalize(line) for line in block]
+        for distance in range(0, max(last - lower, 0) + 1):
+            for position in (expected - distance, expected + distance):
+                if lower <= position <= last and [normalize(line) for line in lines[position:position + len(block)]] == wanted:
+                    return position
+    return None
+
+def apply_unified_diff(content: str, diff: str) -> Tuple[str, int]:
+    """
+    Apply a unified diff to ``content``.
+
+    Hunks are located by their context and removed lines, starting at the line
+    number in the hunk header and searching outward, so diffs with slightly
+    wrong line numbers still apply. A hunk that matches nowhere raises PatchError.
+    """
+    hunks = _parse_hunks(diff)
+    if not hunks:
+        raise PatchError("No hunks found in diff")
+    newline = "\r\n" if "\r\n" in content else "\n"
+    ends_with_newline = content.endswith(("\n", "\r\n")) or not content
+    lines = _split_lines(content)
+
+    result: List[str] = []
+    position = 0
+    for number, (old_start, old_lines, new_lines) in enumerate(hunks, 1):
+        if old_lines:
+            found = _find_block(lines, old_lines, old_start - 1, position)
+            if found is None:
+                raise PatchError(f"Hunk {number} (starting at line {old_start}) does not match the file")
+        else:
+            found = max(min(old_start, len(lines)), position)
+        result.extend(lines[position:found])
+        result.extend(new_lines)
+        position = found + len(old_lines)
+    result.extend(lines[position:])
+
+    patched = newline.join(result)
+    if result and ends_with_newline:
+        patched += newline
+    return patched, len(hunks)
+
+def apply_patch(content: str, edits: str) -> Tuple[str, int]:
+    """Apply either search/replace blocks or a unified diff, returning (new content, edits applied)."""
+    if is_search_replace(edits):
+        return apply_search_replace(content, edits)
+    return apply_unified_diff(content, edits)
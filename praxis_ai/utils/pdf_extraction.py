@@ -0,0 +1,64 @@
+# utils/pdf_extraction.py
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, Optional, Tuple
+import pypdf
+from ..config.settings import PDF_PARALLEL_MIN_PAGES, PDF_EXTRACTION_WORKERS
+
+def resolve_page_range(num_pages: int, start_page: Optional[int] = None, end_page: Optional[int] = None) -> Tuple[int, int]:
+    """Convert 1-based, inclusive page numbers into a 0-based, half-open range."""
+    if num_pages == 0 and start_page is None and end_page is None:
+        return 0, 0
+    start = 1 if start_page is None else start_page
+    end = num_pages if end_page is None else min(end_page, num_pages)
+    if start < 1 or start > num_pages:
+        raise ValueError(f"start_page {start} is out of range; the document has {num_pages} pages")
+    if end < start:
+        raise ValueError(f"end_page {end} is before start_page {start}")
+    return start - 1, end
+
+def _extract_page_span(file_path: str, start: int, stop: int) -> List[str]:
+    # Runs in a worker process, so it opens its own reader.
+    with open(file_path, 'rb') as file:
+        reader = pypdf.PdfReader(file)
+        return [reader.pages[i].extract_text() or "" for i in range(start, stop)]
+
+def _split_span(start: int, stop: int, parts: int) -> List[Tuple[int, int]]:
+    size = max(1, -(-(stop - start) // parts))
+    return [(i, min(i + size, stop)) for i in range(start, stop, size)]
+
+def iter_pdf_pages(file_path, start_page: Optional[int] = None, end_page: Optional[int] = None,
+                   workers: Optional[int] = None) -> Iterator[Tuple[int, str]]:
+    """
+    Yield ``(page_number, text)`` for the requested pages of a PDF, in order.
+
+    Only the requested pages are parsed. Ranges of at least
+    ``PDF_PARALLEL_MIN_PAGES`` pages are spread across a process pool, and pages
+    are yielded as soon as the chunk containing them has been extracted.
+    """
+    workers = PDF_EXTRACTION_WORKERS if workers is None else workers
+    with open(file_path, 'rb') as file:
+        reader = pypdf.PdfReader(file)
+        start, stop = resolve_page_range(len(reader.pages), start_page, end_page)
+        if workers <= 1 or stop - start < PDF_PARALLEL_MIN_PAGES:
+            for i in range(start, stop):
+                yield i + 1, reader.pages[i].extract_text() or ""
+            return
+
+    # Several chunks per worker keeps the pool busy when pages vary in cost.
+    spans = _split_span(start, stop, workers * 2)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_extract_page_span, str(file_path), span_start, span_stop)
+                   for span_start, span_stop in spans]
+        try:
+            for (span_start, _), future in zip(spans, futures):
+                for offset, text in enumerate(future.result()):
+                    yield span_start + offset + 1, text
+        finally:
+            for future in futures:
+                future.cancel()
+
+def extract_pdf_text(file_path, start_page: Optional[int] = None, end_page: Optional[int] = None,
+                     workers: Optional[int] = None) -> str:
+    """Extract the text of the requested pages of a PDF, joined with newlines."""
+    return "\n".join(text for _, text in iter_pdf_pages(file_path, start_page, end_page, workers))
@@ -0,0 +1,137 @@
+# utils/pdf_writer.py
+
+import zlib
+from typing import Iterable, List
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.utils import simpleSplit
+
+# Longest unterminated line kept in memory before it is wrapped and flushed.
+_MAX_PENDING_CHARS = 8192
+
+def _escape_pdf_text(line: str) -> bytes:
+    data = line.encode("cp1252", errors="replace")
+    return data.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)").replace(b"\r", b"\\r")
+
+class StreamingPdfWriter:
+    """
+    Write plain text to a paginated PDF without holding the document in memory.
+
+    Text is wrapped to the page width and flushed to the target file one page at
+    a time, so memory use is bounded by a single page regardless of how much
+    content is written. Use it as a context manager, or call ``close()`` to
+    finish the document.
+    """
+
+    def __init__(self, file_path, pagesize=letter, margin: float = 40, font_name: str = "Helvetica",
+                 font_size: float = 11, leading: float = None):
+        self.page_width, self.page_height = pagesize
+        self.margin = margin
+        self.font_name = font_name
+        self.font_size = font_size
+        self.leading = leading or font_size * 1.2
+        self.text_width = self.page_width - 2 * margin
+        self.lines_per_page = max(1, int((self.page_height - 2 * margin) / self.leading))
+
+        self._file = open(file_path, "wb")
+        self._offsets: List[int] = []
+        self._page_lines: List[str] = []
+        self._pending = ""
+        self.page_count = 0
+        self._closed = False
+
+        self._file.write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+        # Objects 1-3 are the catalog, the page tree (written last) and the font.
+        self._write_object(1, b"<< /Type /Catalog /Pages 2 0 R >>")
+        self._offsets.append(0)
+        self._write_object(3, f"<< /Type /Font /Subtype /Type1 /BaseFont /{font_name} "
+                              f"/Encoding /WinAnsiEncoding >>".encode("ascii"))
+
+    def _write_object(self, number: int, body: bytes):
+        if number == len(self._offsets) + 1:
+            self._offsets.append(self._file.tell())
+        else:
+            self._offsets[number - 1] = self._file.tell()
+        self._file.write(f"{number} 0 obj\n".encode("ascii") + body + b"\nendobj\n")
+
+    def write(self, text: str):
+        """Append text to the document. Chunks may split lines anywhere."""
+        lines = (self._pending + text.replace("\t", "    ")).split("\n")
+        self._pending = lines.pop()
+        for line in lines:
+            self._add_line(line)
+        if len(self._pending) > _MAX_PENDING_CHARS:
+            wrapped = self._wrap(self._pending)
+            self._pending = wrapped.pop()
+            for line in wrapped:
+                self._append_wrapped(line)
+
+    def _wrap(self, line: str) -> List[str]:
+        return simpleSplit(line, self.font_name, self.font_size, self.text_width) or [""]
+
+    def _add_line(self, line: str):
+        for wrapped in self._wrap(line):
+            self._append_wrapped(wrapped)
+
+    def _append_wrapped(self, line: str):
+        self._page_lines.append(line)
+        if len(self._page_lines) >= self.lines_per_page:
+            self._flush_page()
+
+    def _flush_page(self):
+        top = self.page_height - self.margin - self.font_size
+        parts = [f"BT /F1 {self.font_size:g} Tf {self.leading:g} TL {self.margin:g} {top:g} Td\n".encode("ascii")]
+        for line in self._page_lines:
+            parts.append(b"(" + _escape_pdf_text(line) + b") Tj T*\n")
+        parts.append(b"ET")
+        stream = zlib.compress(b"".join(parts))
+        self._page_lines = []
+
+        content_number = 4 + 2 * self.page_count
+        self._write_object(content_number, f"<< /Length {len(stream)} /Filter /FlateDecode >>\nstream\n".encode("ascii")
+                           + stream + b"\nendstream")
+        self._write_object(content_number + 1, (
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {self.page_width:g} {self.page_height:g}] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {content_number} 0 R >>").encode("ascii"))
+        self.page_count += 1
+
+    def close(self) -> int:
+        """Flush the remaining text, write the page tree and trailer, and close the file."""
+        if self._closed:
+            return self.page_count
+        try:
+            if self._pending:
+                self._add_line(self._pending)
+                self._pending = ""
+            if self._page_lines or self.page_count == 0:
+                self._flush_page()
+
+            kids = " ".join(f"{5 + 2 * i} 0 R" for i in range(self.page_count))
+            self._write_object(2, f"<< /Type /Pages /Kids [{kids}] /Count {self.page_count} >>".encode("ascii"))
+
+            xref_offset = self._file.tell()
+            xref = [f"xref\n0 {len(self._offsets) + 1}\n0000000000 65535 f \n"]
+            xref.extend(f"{offset:010d} 00000 n \n" for offset in self._offsets)
+            xref.append(f"trailer\n<< /Size {len(self._offsets) + 1} /Root 1 0 R >>\n"
+                        f"startxref\n{xref_offset}\n%%EOF\n")
+            self._file.write("".join(xref).encode("ascii"))
+        finally:
+            self._file.close()
+            self._closed = True
+        return self.page_count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self._file.close()
+            self._closed = True
+
+def write_pdf(file_path, chunks: Iterable[str], **options) -> int:
+    """Write an iterable of text chunks to a paginated PDF and return the page count."""
+    with StreamingPdfWriter(file_path, **options) as writer:
+        for chunk in chunks:
+            writer.write(chunk)
+        return writer.close()
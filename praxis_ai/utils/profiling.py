@@ -0,0 +1,115 @@
+# utils/profiling.py
+
+import cProfile
+import os
+import pstats
+import random
+import re
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from typing import List, Optional
+from ..config.settings import PROFILE_DIR, PROFILE_TOP_N
+from .logging import logger
+
+# cProfile and tracemalloc are process-wide hooks, so only one profile runs at a time.
+_active = threading.Lock()
+
+class ProfileResult:
+    """What a ``profile`` block recorded: where the report was saved, and the hottest functions and allocations."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.skipped = False
+        self.duration: float = 0.0
+        self.stats_path: Optional[str] = None
+        self.report_path: Optional[str] = None
+        self.functions: List[dict] = []
+        self.allocations: List[dict] = []
+
+def should_sample(rate: float) -> bool:
+    """Whether to profile this turn or objective, given the fraction of them to profile."""
+    return rate >= 1 or (rate > 0 and random.random() < rate)
+
+def _top_functions(profiler: cProfile.Profile, top: int) -> List[dict]:
+    stats = pstats.Stats(profiler)
+    rows = sorted(stats.stats.items(), key=lambda item: item[1][2], reverse=True)[:top]
+    return [{
+        "function": f"{os.path.basename(filename)}:{line}({name})" if line else name,
+        "calls": calls,
+        "self_s": tottime,
+        "cumulative_s": cumtime,
+    } for (filename, line, name), (_, calls, tottime, cumtime, _) in rows]
+
+def _top_allocations(snapshot: tracemalloc.Snapshot, top: int) -> List[dict]:
+    snapshot = snapshot.filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)])
+    return [{
+        "location": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+        "size_kb": stat.size / 1024,
+        "count": stat.count,
+    } for stat in snapshot.statistics("lineno")[:top]]
+
+def format_report(result: ProfileResult) -> str:
+    """Plain-text summary of a profile: hottest functions by self time, then largest allocations."""
+    lines = [f"Profile '{result.name}': {result.duration:.3f}s"]
+    if result.functions:
+        lines.append(f"{'self s':>9} {'cum s':>9} {'calls':>8}  function")
+        lines.extend(f"{row['self_s']:9.4f} {row['cumulative_s']:9.4f} {row['calls']:8d}  {row['function']}"
+                     for row in result.functions)
+    if result.allocations:
+        lines.append(f"{'KiB':>10} {'blocks':>8}  location")
+        lines.extend(f"{row['size_kb']:10.1f} {row['count']:8d}  {row['location']}" for row in result.allocations)
+    return "\n".join(lines)
+
+@contextmanager
+def profile(name: str, memory: bool = False, output_dir: Optional[str] = None, top: int = PROFILE_TOP_N):
+    """
+    Profile the enclosed block with cProfile and, if ``memory``, tracemalloc.
+
+    On exit the raw stats are saved to ``output_dir`` (PROFILE_DIR by default)
+    as ``<time>-<name>.prof``, readable with ``pstats`` or snakeviz, next to a
+    ``.txt`` report, and the yielded ``ProfileResult`` is filled in. cProfile
+    only sees the calling thread, so work done in thread pools shows up as
+    waits. If another profile is already running the block runs unprofiled
+    and ``skipped`` is set.
+    """
+    result = ProfileResult(name)
+    output_dir = output_dir or PROFILE_DIR
+    if not _active.acquire(blocking=False):
+        result.skipped = True
+        yield result
+        return
+
+    started_tracemalloc = memory and not tracemalloc.is_tracing()
+    profiler = cProfile.Profile()
+    try:
+        if started_tracemalloc:
+            tracemalloc.start()
+        start = time.perf_counter()
+        profiler.enable()
+        try:
+            yield result
+        finally:
+            profiler.disable()
+            result.duration = time.perf_counter() - start
+            snapshot = tracemalloc.take_snapshot() if memory and tracemalloc.is_tracing() else None
+            if started_tracemalloc:
+                tracemalloc.stop()
+
+        result.functions = _top_functions(profiler, top)
+        if snapshot is not None:
+            result.allocations = _top_allocations(snapshot, top)
+        try:
+            os.makedirs(output_dir, exist_ok=True)
+            safe_name = re.sub(r"[^\w.-]+", "_", name)
+            stem = os.path.join(output_dir, f"{datetime.now():%Y%m%d-%H%M%S-%f}-{safe_name}")
+            profiler.dump_stats(stem + ".prof")
+            with open(stem + ".txt", "w", encoding="utf-8") as f:
+                f.write(format_report(result) + "\n")
+            result.stats_path, result.report_path = stem + ".prof", stem + ".txt"
+        except OSError as e:
+            logger.warning(f"Error saving profile '{name}' to {output_dir}: {e}")
+    finally:
+        _active.release()
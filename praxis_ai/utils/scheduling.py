@@ -0,0 +1,87 @@
+# utils/scheduling.py
+
+import datetime
+from typing import Iterable, List, Optional, Tuple
+
+Interval = Tuple[datetime.datetime, datetime.datetime]
+
+def _localize(tz, naive: datetime.datetime) -> datetime.datetime:
+    return tz.localize(naive) if hasattr(tz, "localize") else naive.replace(tzinfo=tz)
+
+def parse_time(value: str, default_tz: datetime.tzinfo = datetime.timezone.utc) -> datetime.datetime:
+    """Parse an RFC 3339 / ISO 8601 timestamp into an aware datetime."""
+    if value.endswith(("Z", "z")):
+        value = value[:-1] + "+00:00"
+    parsed = datetime.datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = _localize(default_tz, parsed)
+    return parsed
+
+def merge_intervals(intervals: Iterable[Interval], buffer: datetime.timedelta = datetime.timedelta(0)) -> List[Interval]:
+    """Sort intervals and merge those that overlap or touch, after widening each by ``buffer`` on both sides."""
+    merged: List[Interval] = []
+    for start, end in sorted((start - buffer, end + buffer) for start, end in intervals):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+def working_windows(range_start: datetime.datetime, range_end: datetime.datetime, tz,
+                    day_start: Optional[datetime.time] = None, day_end: Optional[datetime.time] = None,
+                    weekdays_only: bool = False) -> List[Interval]:
+    """
+    Split a range into the windows in which meetings may be placed.
+
+    Without working hours the whole range is one window (minus weekends if
+    ``weekdays_only``). Each day's window is localized in ``tz``, so daylight
+    saving changes are respected.
+    """
+    if day_start is None and day_end is None and not weekdays_only:
+        return [(range_start, range_end)] if range_start < range_end else []
+    day_start = day_start or datetime.time(0, 0)
+    windows = []
+    day = range_start.astimezone(tz).date()
+    last_day = range_end.astimezone(tz).date()
+    while day <= last_day:
+        if not weekdays_only or day.weekday() < 5:
+            start = _localize(tz, datetime.datetime.combine(day, day_start))
+            if day_end is None:
+                end = _localize(tz, datetime.datetime.combine(day + datetime.timedelta(days=1), datetime.time(0, 0)))
+            else:
+                end = _localize(tz, datetime.datetime.combine(day, day_end))
+            start, end = max(start, range_start), min(end, range_end)
+            if start < end:
+                windows.append((start, end))
+        day += datetime.timedelta(days=1)
+    return windows
+
+def find_free_slots(busy: List[Interval], windows: List[Interval], duration: datetime.timedelta,
+                    max_slots: Optional[int] = None) -> List[Interval]:
+    """
+    Return the free gaps of at least ``duration`` inside ``windows``.
+
+    ``busy`` must be sorted and merged (see ``merge_intervals``) and ``windows``
+    sorted. Both lists are walked once, so the cost is linear in their lengths.
+    """
+    free: List[Interval] = []
+    first_busy = 0
+    for window_start, window_end in windows:
+        while first_busy < len(busy) and busy[first_busy][1] <= window_start:
+            first_busy += 1
+        cursor = window_start
+        index = first_busy
+        while index < len(busy) and busy[index][0] < window_end:
+            busy_start, busy_end = busy[index]
+            if busy_start - cursor >= duration:
+                free.append((cursor, busy_start))
+                if max_slots is not None and len(free) >= max_slots:
+                    return free
+            cursor = max(cursor, busy_end)
+            index += 1
+        if window_end - cursor >= duration:
+            free.append((cursor, window_end))
+            if max_slots is not None and len(free) >= max_slots:
+                return free
+    return free
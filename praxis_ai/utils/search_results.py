@@ -0,0 +1,76 @@
+# utils/search_results.py
+
+import re
+from typing import List
+
+_WORD = re.compile(r"\w+")
+_SENTENCE_END = re.compile(r"[.!?](?=\s)")
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count for English text (about four characters per token)."""
+    return (len(text) + 3) // 4
+
+def trim_to_tokens(text: str, max_tokens: int) -> str:
+    """Shorten text to about ``max_tokens``, preferring to cut at a sentence, then a word, boundary."""
+    text = " ".join(text.split())
+    max_chars = max_tokens * 4
+    if len(text) <= max_chars:
+        return text
+    cut = text[:max_chars]
+    sentence_ends = [match.end() for match in _SENTENCE_END.finditer(cut + " ")]
+    if sentence_ends and sentence_ends[-1] >= max_chars // 2:
+        return cut[:sentence_ends[-1]]
+    space = cut.rfind(" ")
+    return (cut[:space] if space >= max_chars // 2 else cut).rstrip(",;:") + "..."
+
+def _word_set(text: str) -> frozenset:
+    return frozenset(word.lower() for word in _WORD.findall(text))
+
+def similarity(a: frozenset, b: frozenset) -> float:
+    """Jaccard similarity of two word sets."""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+def dedupe_snippets(results: List[dict], threshold: float) -> List[dict]:
+    """
+    Drop results whose snippet is nearly identical to that of an earlier result.
+
+    Syndicated and mirrored pages often repeat the same text under different
+    URLs. The first result is kept, and any ``queries`` of the dropped ones are
+    merged into it.
+    """
+    kept = []
+    word_sets = []
+    for result in results:
+        words = _word_set(result["snippet"])
+        duplicate_of = next((i for i, seen in enumerate(word_sets) if similarity(words, seen) >= threshold), None)
+        if duplicate_of is None:
+            result = dict(result)
+            if "queries" in result:
+                result["queries"] = list(result["queries"])
+            kept.append(result)
+            word_sets.append(words)
+        elif "queries" in result:
+            merged = kept[duplicate_of].setdefault("queries", [])
+            merged.extend(query for query in result["queries"] if query not in merged)
+    return kept
+
+def compact_results(results: List[dict], snippet_tokens: int, similarity_threshold: float) -> List[dict]:
+    """Deduplicate near-identical results and trim each snippet to ``snippet_tokens``."""
+    compacted = dedupe_snippets(results, similarity_threshold)
+    for result in compacted:
+        result["snippet"] = trim_to_tokens(result["snippet"], snippet_tokens)
+    return compacted
+
+def render_results(results: List[dict]) -> str:
+    """Render results for a model as a compact numbered list."""
+    blocks = []
+    for i, result in enumerate(results, 1):
+        lines = [f"{i}. {result['title']}", f"   {result['url']}"]
+        if len(result.get("queries", ())) > 1:
+            lines.append(f"   Found by: {'; '.join(result['queries'])}")
+        if result["snippet"]:
+            lines.append(f"   {result['snippet']}")
+        blocks.append("\n".join(lines))
+    return "\n".join(blocks)
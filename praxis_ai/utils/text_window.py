@@ -0,0 +1,115 @@
+# utils/text_window.py
+
+import mmap
+import os
+import threading
+from array import array
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+_INDEX_CACHE_SIZE = 32
+
+class _LineIndex:
+    """Byte offsets of line starts, extended only as far as callers need."""
+
+    def __init__(self):
+        self.offsets = array('Q', [0])
+        self.scan_position = 0
+        self.complete = False
+        self.lock = threading.Lock()
+
+    def ensure(self, data, line_count: int):
+        with self.lock:
+            while len(self.offsets) <= line_count and not self.complete:
+                newline = data.find(b'\n', self.scan_position)
+                if newline == -1:
+                    self.complete = True
+                    break
+                self.scan_position = newline + 1
+                if self.scan_position < len(data):
+                    self.offsets.append(self.scan_position)
+                else:
+                    self.complete = True
+
+_index_cache: "OrderedDict[Tuple[str, int, int], _LineIndex]" = OrderedDict()
+_index_cache_lock = threading.Lock()
+
+def _line_index(path: str, stat: os.stat_result) -> _LineIndex:
+    key = (path, stat.st_size, stat.st_mtime_ns)
+    with _index_cache_lock:
+        index = _index_cache.get(key)
+        if index is None:
+            index = _index_cache[key] = _LineIndex()
+        _index_cache.move_to_end(key)
+        if len(_index_cache) > _INDEX_CACHE_SIZE:
+            _index_cache.popitem(last=False)
+        return index
+
+class TextWindow:
+    """
+    Read windows of a large text file through a memory map.
+
+    Only the requested bytes are touched. Line-based reads use a newline offset
+    index that is built lazily, up to the last requested line, and shared
+    between readers of the same unchanged file.
+    """
+
+    def __init__(self, file_path):
+        self.path = os.path.abspath(file_path)
+        self._file = open(self.path, 'rb')
+        stat = os.fstat(self._file.fileno())
+        self.size = stat.st_size
+        self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else b''
+        self._index = _line_index(self.path, stat)
+
+    def close(self):
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _decode(self, start: int, end: int) -> str:
+        return self._data[start:end].decode('utf-8', errors='replace')
+
+    def read_bytes(self, offset: int, length: int) -> Tuple[str, Optional[int]]:
+        """Return the text in ``[offset, offset + length)`` and the offset after it, or None at end of file."""
+        if offset < 0 or length <= 0:
+            raise ValueError("byte_offset must be >= 0 and byte_length must be > 0")
+        end = min(offset + length, self.size)
+        return self._decode(min(offset, self.size), end), (end if end < self.size else None)
+
+    def line_offset(self, line: int) -> int:
+        """Return the byte offset at which ``line`` (1-based) starts."""
+        if line < 1:
+            raise ValueError("start_line must be >= 1")
+        self._index.ensure(self._data, line)
+        offsets = self._index.offsets
+        if line > len(offsets):
+            raise ValueError(f"start_line {line} is past the end of the file ({len(offsets)} lines)")
+        return offsets[line - 1]
+
+    def read_lines(self, start_line: int, end_line: int) -> Tuple[str, Optional[int]]:
+        """Return lines ``start_line`` to ``end_line`` (1-based, inclusive) and the byte offset after them."""
+        if end_line < start_line:
+            raise ValueError("end_line must not be before start_line")
+        start = self.line_offset(start_line)
+        self._index.ensure(self._data, end_line)
+        offsets = self._index.offsets
+        end = offsets[end_line] if end_line < len(offsets) else self.size
+        return self._decode(start, end), (end if end < self.size else None)
+
+    def read_page(self, cursor: int, page_bytes: int) -> Tuple[str, Optional[int]]:
+        """Return about ``page_bytes`` of whole lines starting at ``cursor``, and the cursor for the next page."""
+        if cursor < 0 or cursor > self.size:
+            raise ValueError(f"cursor {cursor} is outside the file (0-{self.size})")
+        end = min(cursor + page_bytes, self.size)
+        if end < self.size:
+            newline = self._data.rfind(b'\n', cursor, end)
+            if newline != -1:
+                end = newline + 1
+        return self._decode(cursor, end), (end if end < self.size else None)
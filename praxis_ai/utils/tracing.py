@@ -0,0 +1,249 @@
+# utils/tracing.py
+
+import contextvars
+import functools
+import json
+import logging
+import math
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from ..config.settings import TRACING_ENABLED, TRACE_FILE, TRACE_MAX_BYTES
+
+# utils/logging imports this module, so the shared logger is looked up by name.
+logger = logging.getLogger("PraxisAI")
+
+_current_span: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar("praxis_current_span", default=None)
+
+class Span:
+    """One timed unit of work: a turn or objective, an LLM call, or a tool execution."""
+
+    __slots__ = ("name", "kind", "trace_id", "span_id", "parent_id", "start", "end", "error", "attributes",
+                 "_started", "_lock")
+
+    def __init__(self, name: str, kind: str, parent: Optional["Span"] = None, **attributes):
+        self.name = name
+        self.kind = kind
+        self.trace_id = parent.trace_id if parent else uuid.uuid4().hex
+        self.span_id = uuid.uuid4().hex[:16]
+        self.parent_id = parent.span_id if parent else None
+        self.start = time.time()
+        self.end: Optional[float] = None
+        self.error: Optional[str] = None
+        self.attributes: Dict[str, Any] = dict(attributes)
+        self._started = time.perf_counter()
+        self._lock = threading.Lock()
+
+    @property
+    def duration_ms(self) -> Optional[float]:
+        return None if self.end is None else (self.end - self.start) * 1000
+
+    def set(self, **attributes):
+        with self._lock:
+            self.attributes.update(attributes)
+
+    def increment(self, name: str, amount: int = 1):
+        with self._lock:
+            self.attributes[name] = self.attributes.get(name, 0) + amount
+
+    def finish(self):
+        self.end = self.start + (time.perf_counter() - self._started)
+
+    def to_dict(self) -> dict:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "kind": self.kind,
+            "start": self.start,
+            "end": self.end,
+            "duration_ms": self.duration_ms,
+            "status": "error" if self.error else "ok",
+            "error": self.error,
+            "attributes": self.attributes,
+        }
+
+class JsonLinesExporter:
+    """Append finished spans to a JSON lines file, moving it to ``<path>.1`` once it exceeds ``max_bytes``."""
+
+    def __init__(self, path: str, max_bytes: int):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._file = None
+        self._size = 0
+
+    def _open(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._file = open(self.path, "a", encoding="utf-8")
+        self._size = self._file.tell()
+
+    def export(self, span: Span):
+        line = json.dumps(span.to_dict(), default=str, separators=(",", ":")) + "\n"
+        with self._lock:
+            if self._file is None:
+                self._open()
+            if self._size and self._size + len(line) > self.max_bytes:
+                self._file.close()
+                os.replace(self.path, self.path + ".1")
+                self._open()
+            self._file.write(line)
+            self._file.flush()
+            self._size += len(line)
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+exporter = JsonLinesExporter(TRACE_FILE, TRACE_MAX_BYTES)
+
+# Called with every finished span, after it is exported.
+span_listeners: List[Callable[[Span], None]] = []
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+@contextmanager
+def span(name: str, kind: str = "stage", **attributes):
+    """
+    Time the enclosed block as a span nested under the current one.
+
+    Exceptions are recorded on the span and re-raised. When tracing is
+    disabled the block still runs and a span is still yielded, but nothing is
+    exported.
+    """
+    current = Span(name, kind, _current_span.get(), **attributes)
+    token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        current.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        _current_span.reset(token)
+        current.finish()
+        if TRACING_ENABLED:
+            try:
+                exporter.export(current)
+            except OSError:
+                pass
+        for listener in span_listeners:
+            # A failing listener must not mask the block's own exception or starve the others.
+            try:
+                listener(current)
+            except Exception as e:
+                logger.error(f"Span listener {getattr(listener, '__name__', listener)!s} failed. Error: {e}")
+
+def traced(name: Optional[str] = None, kind: str = "stage"):
+    """Decorator that runs each call of the function inside a span."""
+    def decorator(func):
+        span_name = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(span_name, kind):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def record_cache(hit: bool):
+    """Count a cache hit or miss on the current span."""
+    current = _current_span.get()
+    if current is not None:
+        current.increment("cache_hits" if hit else "cache_misses")
+
+def record_usage(model: Optional[str], usage: Optional[dict]):
+    """Add an LLM call's model and token usage to the current span."""
+    current = _current_span.get()
+    if current is None:
+        return
+    if model:
+        current.set(model=model)
+    if not usage:
+        return
+    current.increment("prompt_tokens", usage.get("prompt_tokens") or usage.get("input_tokens") or 0)
+    current.increment("completion_tokens", usage.get("completion_tokens") or usage.get("output_tokens") or 0)
+    cached = (usage.get("prompt_tokens_details") or {}).get("cached_tokens")
+    if cached:
+        current.increment("cached_prompt_tokens", cached)
+
+def _usage_dict(usage) -> Optional[dict]:
+    if usage is None or isinstance(usage, dict):
+        return usage
+    if hasattr(usage, "model_dump"):
+        return usage.model_dump()
+    return vars(usage)
+
+def instrument_ell():
+    """
+    Wrap the ``call`` method of every registered ell provider so that each LLM
+    request reports its model and token usage to the current span. Safe to
+    call more than once.
+    """
+    import ell
+
+    for provider in set(ell.config.providers.values()):
+        call = provider.call
+        if getattr(call, "__praxis_traced__", False):
+            continue
+
+        def traced_call(ell_call, *args, _call=call, **kwargs):
+            result, final_api_params, metadata = _call(ell_call, *args, **kwargs)
+            record_usage(final_api_params.get("model", ell_call.model), _usage_dict((metadata or {}).get("usage")))
+            return result, final_api_params, metadata
+
+        traced_call.__praxis_traced__ = True
+        provider.call = traced_call
+
+def read_spans(path: str = TRACE_FILE) -> Iterable[dict]:
+    """Yield the spans stored in a JSON lines trace file, skipping malformed lines."""
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+def summarize_spans(spans: Iterable[dict], since: Optional[float] = None) -> List[dict]:
+    """
+    Group spans by kind and name and return per-stage latency percentiles
+    (in milliseconds), error counts and token totals, slowest p95 first.
+    """
+    groups: Dict[tuple, dict] = {}
+    for record in spans:
+        if record.get("duration_ms") is None or (since is not None and record.get("start", 0) < since):
+            continue
+        group = groups.setdefault((record.get("kind"), record.get("name")), {
+            "durations": [], "errors": 0, "prompt_tokens": 0, "completion_tokens": 0})
+        group["durations"].append(record["duration_ms"])
+        group["errors"] += record.get("status") == "error"
+        attributes = record.get("attributes") or {}
+        group["prompt_tokens"] += attributes.get("prompt_tokens", 0)
+        group["completion_tokens"] += attributes.get("completion_tokens", 0)
+
+    rows = []
+    for (kind, name), group in groups.items():
+        durations = sorted(group.pop("durations"))
+        rows.append({
+            "kind": kind,
+            "name": name,
+            "count": len(durations),
+            "p50": percentile(durations, 0.50),
+            "p95": percentile(durations, 0.95),
+            "p99": percentile(durations, 0.99),
+            "max": durations[-1],
+            **group,
+        })
+    rows.sort(key=lambda row: row["p95"], reverse=True)
+    return rows
@@ -0,0 +1,131 @@
+# utils/workspace_grep.py
+
+import mmap
+import os
+import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+from .file_walk import walk_files
+from .mime_detection import detect_mime_type, is_text_mime
+
+MAX_LINE_CHARS = 300
+_COUNT_CHUNK_BYTES = 1024 * 1024
+
+class GrepMatch(NamedTuple):
+    path: str  # Relative to the search root
+    line_number: int
+    line: str
+    before: List[Tuple[int, str]]
+    after: List[Tuple[int, str]]
+
+def _count_newlines(data, start: int, end: int) -> int:
+    """Count newlines in ``data[start:end]`` a chunk at a time, so the gap between sparse matches is never copied whole."""
+    count = 0
+    for chunk_start in range(start, end, _COUNT_CHUNK_BYTES):
+        count += data[chunk_start:min(chunk_start + _COUNT_CHUNK_BYTES, end)].count(b"\n")
+    return count
+
+def _decode_line(data, start: int, end: int) -> str:
+    text = data[start:end].rstrip(b"\r").decode("utf-8", errors="replace")
+    return text if len(text) <= MAX_LINE_CHARS else text[:MAX_LINE_CHARS] + "..."
+
+def _context(data, line_start: int, line_end: int, line_number: int, lines: int):
+    before = []
+    position = line_start
+    while len(before) < lines and position > 0:
+        start = data.rfind(b"\n", 0, position - 1) + 1
+        before.append((line_number - len(before) - 1, _decode_line(data, start, position - 1)))
+        position = start
+    before.reverse()
+
+    after = []
+    position = line_end + 1
+    while len(after) < lines and position < len(data):
+        end = data.find(b"\n", position)
+        end = len(data) if end == -1 else end
+        after.append((line_number + len(after) + 1, _decode_line(data, position, end)))
+        position = end + 1
+    return before, after
+
+def grep_file(path, relative_path: str, regex: "re.Pattern[bytes]", context_lines: int = 0,
+              max_matches: Optional[int] = None) -> List[GrepMatch]:
+    """Return the lines of a file matching ``regex``, scanning it through a memory map."""
+    matches = []
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return matches
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            position = 0
+            counted_to = 0
+            line_number = 1
+            while max_matches is None or len(matches) < max_matches:
+                match = regex.search(data, position)
+                if match is None:
+                    break
+                line_start = data.rfind(b"\n", 0, match.start()) + 1
+                line_end = data.find(b"\n", match.start())
+                line_end = len(data) if line_end == -1 else line_end
+                line_number += _count_newlines(data, counted_to, line_start)
+                counted_to = line_start
+                before, after = _context(data, line_start, line_end, line_number, context_lines)
+                matches.append(GrepMatch(relative_path, line_number, _decode_line(data, line_start, line_end), before, after))
+                # Report each line once, however many times it matches.
+                position = line_end + 1
+                if position >= len(data):
+                    break
+    return matches
+
+def _grep_text_file(full_path: str, relative_path: str, regex, context_lines: int, max_matches: int) -> List[GrepMatch]:
+    if not is_text_mime(detect_mime_type(full_path)):
+        return []
+    try:
+        return grep_file(full_path, relative_path, regex, context_lines, max_matches)
+    except OSError:
+        return []
+
+def grep_files(root, pattern: str, file_pattern: Optional[str] = None, ignore: Optional[Iterable[str]] = None,
+               ignore_case: bool = False, context_lines: int = 0, max_results: int = 100,
+               workers: int = 8) -> Tuple[List[GrepMatch], int, bool]:
+    """
+    Search the text files under ``root`` for a regular expression.
+
+    Files are scanned concurrently, but results are returned in walk order.
+    Binary files (by MIME type) and ignored paths are skipped, and no new files
+    are scheduled once ``max_results`` matches have been found.
+
+    Returns (matches, number of files scanned, whether the search stopped at ``max_results``).
+    """
+    flags = re.MULTILINE | (re.IGNORECASE if ignore_case else 0)
+    regex = re.compile(pattern.encode("utf-8"), flags)
+    root = os.fspath(root)
+    files = walk_files(root, pattern=file_pattern, ignore=ignore)
+
+    matches: List[GrepMatch] = []
+    scanned = 0
+    truncated = False
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+
+        def schedule():
+            for entry in files:
+                pending.append(executor.submit(_grep_text_file, os.path.join(root, entry.path), entry.path,
+                                               regex, context_lines, max_results))
+                if len(pending) >= workers * 4:
+                    break
+
+        schedule()
+        while pending:
+            found = pending.popleft().result()
+            scanned += 1
+            matches.extend(found)
+            if len(matches) >= max_results:
+                truncated = True
+                break
+            if len(pending) < workers * 2:
+                schedule()
+        for future in pending:
+            future.cancel()
+
+    del matches[max_results:]
+    return matches, scanned, truncated
@@ -0,0 +1,32 @@
+# tests/conftest.py
+
+import atexit
+import os
+import shutil
+import tempfile
+
+# Keep caches, logs and profiles written during the suite out of the developer's home directory.
+_state_dir = tempfile.mkdtemp(prefix="praxis-tests-")
+atexit.register(shutil.rmtree, _state_dir, ignore_errors=True)
+os.environ.setdefault("PRAXIS_CACHE_DIR", os.path.join(_state_dir, "cache"))
+os.environ.setdefault("PRAXIS_LOG_DIR", os.path.join(_state_dir, "logs"))
+os.environ.setdefault("PRAXIS_PROFILE_DIR", os.path.join(_state_dir, "profiles"))
+
+# Placeholder keys so the default OpenAI and Tavily clients can be built; the suite never calls the real services.
+os.environ.setdefault("OPENAI_API_KEY", "test-openai-key")
+os.environ.setdefault("TAVILY_API_KEY", "test-tavily-key")
+os.environ.setdefault("PRAXIS_TRACING", "false")
+
+import pytest
+from praxis_ai.testing import FakeLLM, fake_models, fake_search
+
+@pytest.fixture
+def fake_llm():
+    """Answer every model call with a deterministic ``FakeLLM`` that completes objectives after two rounds."""
+    with fake_models(FakeLLM(rounds=2)) as llm:
+        yield llm
+
+@pytest.fixture
+def fake_tavily():
+    with fake_search() as client:
+        yield client
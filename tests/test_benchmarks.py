@@ -0,0 +1,20 @@
+# tests/test_benchmarks.py
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+def test_quick_orchestrator_benchmark_runs(tmp_path):
+    output = tmp_path / "results.json"
+    env = {**os.environ, "PRAXIS_CACHE_DIR": str(tmp_path / "cache"), "PRAXIS_LOG_DIR": str(tmp_path / "logs")}
+    completed = subprocess.run(
+        [sys.executable, "-m", "benchmarks.run", "--quick", "--only", "orchestrator_loop", "--output", str(output)],
+        cwd=ROOT, env=env, capture_output=True, text=True, timeout=300)
+
+    assert completed.returncode == 0, completed.stderr
+    results = json.loads(output.read_text())["results"]
+    assert results["orchestrator_loop.per_round"]["rounds"] == 5
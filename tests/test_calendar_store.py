@@ -0,0 +1,88 @@
+# tests/test_calendar_store.py
+
+import datetime
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
+from praxis_ai.utils.calendar_store import CalendarStore
+
+UTC = datetime.timezone.utc
+
+def event(event_id, start, end, summary="Meeting", **extra):
+    return {"id": event_id, "summary": summary, "start": {"dateTime": start}, "end": {"dateTime": end}, **extra}
+
+class FakeEvents:
+    """Serves events().list() from a queue of responses keyed by sync token."""
+
+    def __init__(self, responses):
+        self.responses = responses
+        self.calls = []
+
+    def events(self):
+        return self
+
+    def list(self, **params):
+        self.calls.append(params)
+        key = params.get("syncToken") or "full"
+        pages = self.responses[key]
+        if isinstance(pages, Exception):
+            raise pages
+        page = pages[int(params["pageToken"] or 0)]
+        return type("Request", (), {"execute": lambda self: page})()
+
+@pytest.fixture
+def store(tmp_path):
+    return CalendarStore(str(tmp_path / "account.sqlite3"))
+
+def test_full_then_incremental_sync(store):
+    service = FakeEvents({
+        "full": [
+            {"items": [event("a", "2030-01-01T09:00:00Z", "2030-01-01T10:00:00Z", "Design review")], "nextPageToken": "1",
+             "timeZone": "Europe/Berlin"},
+            {"items": [event("b", "2030-01-02T09:00:00Z", "2030-01-02T10:00:00Z", "Standup")], "nextSyncToken": "t1"},
+        ],
+        "t1": [{"items": [{"id": "a", "status": "cancelled"},
+                          event("c", "2030-01-03T09:00:00Z", "2030-01-03T10:00:00Z", "Retro")], "nextSyncToken": "t2"}],
+    })
+    assert store.needs_sync("primary", 60)
+    assert store.sync(service) == 2
+    assert "timeMin" in service.calls[0] and "syncToken" not in service.calls[0]
+    assert not store.needs_sync("primary", 60)
+
+    store.mark_stale("primary")
+    assert store.needs_sync("primary", 60)
+    assert store.sync(service) == 2
+    assert service.calls[-1]["syncToken"] == "t1" and "timeMin" not in service.calls[-1]
+
+    now = datetime.datetime(2029, 1, 1, tzinfo=UTC)
+    assert [e["id"] for e in store.list_events("primary", now)] == ["b", "c"]
+    assert [e["id"] for e in store.search("primary", "RETRO")] == ["c"]
+
+def test_expired_sync_token_triggers_full_resync(store):
+    service = FakeEvents({
+        "full": [{"items": [event("a", "2030-01-01T09:00:00Z", "2030-01-01T10:00:00Z")], "nextSyncToken": "t1"}],
+        "t1": HttpError(httplib2.Response({"status": 410}), b"Gone"),
+    })
+    store.sync(service)
+    service.responses["full"] = [{"items": [event("z", "2030-02-01T09:00:00Z", "2030-02-01T10:00:00Z")], "nextSyncToken": "t9"}]
+    store.mark_stale("primary")
+    store.sync(service)
+
+    assert [call.get("syncToken") for call in service.calls] == [None, "t1", None]
+    assert [e["id"] for e in store.list_events("primary", datetime.datetime(2029, 1, 1, tzinfo=UTC))] == ["z"]
+
+def test_busy_intervals_skip_free_and_declined_events(store):
+    service = FakeEvents({"full": [{"timeZone": "Europe/Berlin", "nextSyncToken": "t1", "items": [
+        event("busy", "2030-01-01T09:00:00Z", "2030-01-01T10:00:00Z"),
+        event("free", "2030-01-01T11:00:00Z", "2030-01-01T12:00:00Z", transparency="transparent"),
+        event("declined", "2030-01-01T13:00:00Z", "2030-01-01T14:00:00Z",
+              attendees=[{"email": "me@example.com", "self": True, "responseStatus": "declined"}]),
+        {"id": "holiday", "start": {"date": "2030-01-02"}, "end": {"date": "2030-01-03"}},
+    ]}]})
+    store.sync(service)
+
+    busy = store.busy_intervals("primary", datetime.datetime(2030, 1, 1, tzinfo=UTC), datetime.datetime(2030, 1, 5, tzinfo=UTC))
+    assert busy == [
+        (datetime.datetime(2030, 1, 1, 9, tzinfo=UTC), datetime.datetime(2030, 1, 1, 10, tzinfo=UTC)),
+        (datetime.datetime(2030, 1, 1, 23, tzinfo=UTC), datetime.datetime(2030, 1, 2, 23, tzinfo=UTC)),
+    ]
@@ -0,0 +1,285 @@
+# tests/test_calendar_tools.py
+
+import datetime
+import pytest
+from praxis_ai.tools import calendar_tools
+from praxis_ai.tools.calendar_tools import CalendarClient
+from praxis_ai.utils.calendar_store import CalendarStore
+
+class FakeCredentials:
+    def __init__(self, expires_in):
+        self.expiry = datetime.datetime.utcnow() + datetime.timedelta(seconds=expires_in)
+        self.refresh_token = "refresh"
+        self.refreshes = 0
+
+    @property
+    def valid(self):
+        return self.expiry > datetime.datetime.utcnow()
+
+    def refresh(self, request):
+        self.refreshes += 1
+        self.expiry = datetime.datetime.utcnow() + datetime.timedelta(hours=1)
+
+    def to_json(self):
+        return '{"token": "refreshed"}'
+
+class FakeRequest:
+    def __init__(self, result, calls, name):
+        self.result, self.calls, self.name = result, calls, name
+
+    def execute(self):
+        self.calls.append(self.name)
+        return self.result
+
+class FakeService:
+    def __init__(self):
+        self.calls = []
+
+    def settings(self):
+        return self
+
+    def get(self, setting):
+        return FakeRequest({"value": "Europe/Berlin"}, self.calls, f"settings.get:{setting}")
+
+@pytest.fixture
+def fakes(tmp_path, monkeypatch):
+    token_file = tmp_path / "token.json"
+    token_file.write_text("{}")
+    state = {"creds": FakeCredentials(expires_in=3600), "builds": 0, "service": FakeService()}
+
+    def build(name, version, credentials, cache_discovery=True):
+        state["builds"] += 1
+        return state["service"]
+
+    monkeypatch.setattr(calendar_tools.Credentials, "from_authorized_user_file", lambda path, scopes: state["creds"])
+    monkeypatch.setattr(calendar_tools, "build", build)
+    state["token_file"] = token_file
+    return state
+
+def test_service_is_built_once(fakes):
+    client = CalendarClient(str(fakes["token_file"]))
+    assert client.service() is client.service()
+    assert fakes["builds"] == 1
+    assert fakes["creds"].refreshes == 0
+
+def test_credentials_are_refreshed_before_expiry(fakes):
+    fakes["creds"] = FakeCredentials(expires_in=60)
+    client = CalendarClient(str(fakes["token_file"]), refresh_margin=300)
+
+    client.service()
+    client.service()
+    assert fakes["creds"].refreshes == 1
+    assert fakes["token_file"].read_text() == '{"token": "refreshed"}'
+    assert fakes["builds"] == 1
+
+def test_timezone_is_cached(fakes):
+    client = CalendarClient(str(fakes["token_file"]), timezone_ttl=3600)
+    assert client.timezone() == "Europe/Berlin"
+    assert client.timezone() == "Europe/Berlin"
+    assert fakes["service"].calls == ["settings.get:timezone"]
+
+    expired = CalendarClient(str(fakes["token_file"]), timezone_ttl=0)
+    expired.timezone()
+    expired.timezone()
+    assert len(fakes["service"].calls) == 3
+
+class FakeFreeBusyService:
+    def __init__(self, calendars, events=()):
+        self.calendars = calendars
+        self.event_items = list(events)
+        self.queries = []
+
+    def freebusy(self):
+        return self
+
+    def events(self):
+        return self
+
+    def query(self, body):
+        self.queries.append(body)
+        ids = [item["id"] for item in body["items"]]
+        return FakeRequest({"calendars": {i: self.calendars[i] for i in ids}}, [], "freebusy.query")
+
+    def list(self, **params):
+        return FakeRequest({"items": self.event_items, "nextSyncToken": "token", "timeZone": "UTC"}, [], "events.list")
+
+class FakeCalendarClient:
+    def __init__(self, service, store, timezone="UTC"):
+        self._service = service
+        self._store = store
+        self._timezone = timezone
+
+    def service(self):
+        return self._service
+
+    def store(self):
+        return self._store
+
+    def timezone(self):
+        return self._timezone
+
+    def mark_stale(self):
+        self.stale = True
+
+def test_find_free_time_intersects_attendees(tmp_path, monkeypatch):
+    service = FakeFreeBusyService({
+        "ana@example.com": {"busy": [{"start": "2099-03-04T10:00:00Z", "end": "2099-03-04T12:00:00Z"}]},
+        "bo@example.com": {"errors": [{"domain": "global", "reason": "notFound"}]},
+    }, events=[{"id": "e1", "start": {"dateTime": "2099-03-04T09:00:00Z"}, "end": {"dateTime": "2099-03-04T10:00:00Z"}}])
+    monkeypatch.setattr(calendar_tools, "ENABLE_CALENDAR", True)
+    monkeypatch.setattr(calendar_tools, "calendar_client",
+                        FakeCalendarClient(service, CalendarStore(str(tmp_path / "store.sqlite3"))))
+
+    result = calendar_tools.find_free_time(60, "2099-03-04", "2099-03-05", attendees="ana@example.com, bo@example.com",
+                                           working_hours_start="09:00", working_hours_end="17:00", buffer_minutes=15)
+    assert result.splitlines() == [
+        "Available time slots:",
+        "2099-03-04T12:15:00+00:00 - 2099-03-04T17:00:00+00:00",
+        "Could not read the calendar of bo@example.com (notFound); it was ignored.",
+    ]
+    assert len(service.queries) == 1
+    assert [item["id"] for item in service.queries[0]["items"]] == ["ana@example.com", "bo@example.com"]
+
+def test_find_free_time_queries_own_calendar_before_the_mirror(tmp_path, monkeypatch):
+    service = FakeFreeBusyService({
+        "primary": {"busy": [{"start": "2020-01-06T09:00:00Z", "end": "2020-01-06T16:00:00Z"}]},
+        "ana@example.com": {"busy": []},
+    })
+    monkeypatch.setattr(calendar_tools, "ENABLE_CALENDAR", True)
+    monkeypatch.setattr(calendar_tools, "calendar_client",
+                        FakeCalendarClient(service, CalendarStore(str(tmp_path / "store.sqlite3"), past_days=30)))
+
+    result = calendar_tools.find_free_time(60, "2020-01-06", "2020-01-07", attendees="ana@example.com",
+                                           working_hours_start="09:00", working_hours_end="17:00")
+    assert result.splitlines() == ["Available time slots:", "2020-01-06T16:00:00+00:00 - 2020-01-06T17:00:00+00:00"]
+    assert [item["id"] for item in service.queries[0]["items"]] == ["primary", "ana@example.com"]
+
+def test_find_free_time_reports_unknown_timezone(tmp_path, monkeypatch):
+    monkeypatch.setattr(calendar_tools, "ENABLE_CALENDAR", True)
+    monkeypatch.setattr(calendar_tools, "calendar_client",
+                        FakeCalendarClient(FakeFreeBusyService({}), CalendarStore(str(tmp_path / "store.sqlite3"))))
+
+    result = calendar_tools.find_free_time(30, "2024-03-04", "2024-03-05", timezone="Europe/Londn")
+    assert result.startswith("Unknown timezone: 'Europe/Londn'")
+
+def test_meetings_are_served_from_the_local_store(tmp_path, monkeypatch):
+    service = FakeFreeBusyService({}, events=[
+        {"id": "e1", "summary": "Design review", "start": {"dateTime": "2099-03-04T09:00:00Z"},
+         "end": {"dateTime": "2099-03-04T10:00:00Z"}, "attendees": [{"email": "ana@example.com"}]},
+    ])
+    lists = []
+    original_list = service.list
+    monkeypatch.setattr(service, "list", lambda **params: lists.append(params) or original_list(**params))
+    store = CalendarStore(str(tmp_path / "store.sqlite3"))
+    monkeypatch.setattr(calendar_tools, "ENABLE_CALENDAR", True)
+    monkeypatch.setattr(calendar_tools, "calendar_client", FakeCalendarClient(service, store))
+
+    assert "Design review (ID: e1)" in calendar_tools.list_upcoming_meetings()
+    assert "Design review" in calendar_tools.search_meetings("ana@example")
+    assert calendar_tools.search_meetings("retro") == "No meetings found matching 'retro'."
+    assert len(lists) == 1
+
+def test_windows_older_than_the_mirror_query_the_api(tmp_path, monkeypatch):
+    service = FakeFreeBusyService({}, events=[
+        {"id": "old", "summary": "Kickoff", "start": {"dateTime": "2020-01-06T09:00:00Z"},
+         "end": {"dateTime": "2020-01-06T10:00:00Z"}},
+    ])
+    lists = []
+    original_list = service.list
+    monkeypatch.setattr(service, "list", lambda **params: lists.append(params) or original_list(**params))
+    monkeypatch.setattr(calendar_tools, "ENABLE_CALENDAR", True)
+    monkeypatch.setattr(calendar_tools, "calendar_client",
+                        FakeCalendarClient(service, CalendarStore(str(tmp_path / "store.sqlite3"), past_days=30)))
+
+    assert "Kickoff (ID: old)" in calendar_tools.list_upcoming_meetings(time_min="2020-01-01T00:00:00Z")
+    assert "Kickoff" in calendar_tools.search_meetings("kickoff", include_past=True)
+    assert lists[0]["timeMin"] == "2020-01-01T00:00:00+00:00"
+    assert lists[1]["q"] == "kickoff" and "timeMin" not in lists[1]
+    assert all("syncToken" not in params for params in lists)
+
+class FakeBatchService:
+    def __init__(self, fail_ids=()):
+        self.fail_ids = set(fail_ids)
+        self.batches = []
+
+    def events(self):
+        return self
+
+    def insert(self, calendarId, body):
+        return ("insert", None, body)
+
+    def patch(self, calendarId, eventId, body):
+        return ("patch", eventId, body)
+
+    def delete(self, calendarId, eventId):
+        return ("delete", eventId, None)
+
+    def new_batch_http_request(self, callback):
+        service = self
+
+        class Batch:
+            def __init__(self):
+                self.requests = []
+
+            def add(self, request, request_id):
+                self.requests.append((request_id, request))
+
+            def execute(self):
+                service.batches.append(len(self.requests))
+                for request_id, (method, event_id, body) in self.requests:
+                    if event_id in service.fail_ids:
+                        callback(request_id, None, RuntimeError("notFound"))
+                    elif method == "delete":
+                        callback(request_id, "", None)
+                    else:
+                        callback(request_id, {"id": event_id or "new", "summary": (body or {}).get("summary", "")}, None)
+
+        return Batch()
+
+def test_batch_update_meetings_reports_each_item(monkeypatch):
+    service = FakeBatchService(fail_ids={"gone"})
+    monkeypatch.setattr(calendar_tools, "ENABLE_CALENDAR", True)
+    monkeypatch.setattr(calendar_tools, "calendar_client", FakeCalendarClient(service, store=None))
+
+    result = calendar_tools.batch_update_meetings([
+        {"action": "create", "title": "Sync", "start_time": "2030-01-01T09:00:00", "end_time": "2030-01-01T09:30:00"},
+        {"action": "update", "event_id": "e1", "start_time": "2030-01-02T10:00:00", "end_time": "2030-01-02T10:30:00"},
+        {"action": "delete", "event_id": "gone"},
+        {"action": "update", "event_id": "e2"},
+        {"action": "move"},
+    ])
+    assert result.splitlines() == [
+        "Batch complete: 2 succeeded, 3 failed.",
+        "1. created 'Sync' (ID: new)",
+        "2. updated '' (ID: e1)",
+        "3. delete failed: notFound",
+        "4. failed: No changes given.",
+        "5. failed: unknown action 'move'; use create, update or delete",
+    ]
+
+def test_batches_are_split_into_chunks(monkeypatch):
+    service = FakeBatchService()
+    monkeypatch.setattr(calendar_tools, "ENABLE_CALENDAR", True)
+    monkeypatch.setattr(calendar_tools, "calendar_client", FakeCalendarClient(service, store=None))
+
+    result = calendar_tools.batch_update_meetings([{"action": "delete", "event_id": f"e{i}"} for i in range(120)])
+    assert result.startswith("Batch complete: 120 succeeded, 0 failed.")
+    assert service.batches == [50, 50, 20]
+
+def test_update_meeting_patches_only_changed_fields(monkeypatch):
+    calls = []
+
+    class Service(FakeBatchService):
+        def patch(self, calendarId, eventId, body):
+            calls.append((eventId, body))
+            return FakeRequest({"id": eventId}, [], "patch")
+
+    monkeypatch.setattr(calendar_tools, "ENABLE_CALENDAR", True)
+    monkeypatch.setattr(calendar_tools, "calendar_client", FakeCalendarClient(Service(), store=None, timezone="Asia/Tokyo"))
+
+    assert calendar_tools.update_meeting("e1", title="Renamed").startswith("Meeting updated successfully")
+    calendar_tools.update_meeting("e1", start_time="2030-01-01T09:00:00")
+    calendar_tools.update_meeting("e1", timezone="Europe/Paris")
+    assert calls == [("e1", {"summary": "Renamed"}),
+                     ("e1", {"start": {"dateTime": "2030-01-01T09:00:00"}}),
+                     ("e1", {"start": {"timeZone": "Europe/Paris"}, "end": {"timeZone": "Europe/Paris"}})]
@@ -0,0 +1,41 @@
+# tests/test_disk_cache.py
+
+import time
+from praxis_ai.utils.disk_cache import DiskCache
+
+def test_set_get_and_expiry(tmp_path):
+    cache = DiskCache(str(tmp_path / "cache.sqlite3"), max_bytes=1024 * 1024, default_ttl=60)
+    cache.set("a", {"results": [1, 2]})
+    cache.set("b", "short-lived", ttl=0.05)
+
+    assert cache.get("a") == {"results": [1, 2]}
+    assert cache.get("b") == "short-lived"
+    time.sleep(0.1)
+    assert cache.get("b") is None
+    assert cache.get("missing") is None
+
+def test_stats_are_shared_between_instances(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    first = DiskCache(path, max_bytes=1024 * 1024, default_ttl=60)
+    second = DiskCache(path, max_bytes=1024 * 1024, default_ttl=60)
+
+    first.set("key", "value")
+    assert second.get("key") == "value"
+    assert first.get("other") is None
+
+    stats = second.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+    assert stats["hit_rate"] == 0.5
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = DiskCache(str(tmp_path / "cache.sqlite3"), max_bytes=250, default_ttl=60)
+    for key in ("a", "b", "c"):
+        cache.set(key, "x" * 100)
+        time.sleep(0.01)
+        if key == "b":
+            cache.get("a")  # "b" is now the least recently used entry
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert cache.stats()["bytes"] <= 250
@@ -0,0 +1,43 @@
+# tests/test_docx_stream.py
+
+import docx
+import pytest
+from praxis_ai.utils.docx_stream import iter_docx_blocks, read_docx_text
+
+@pytest.fixture
+def contract(tmp_path):
+    document = docx.Document()
+    document.add_paragraph("Introduction")
+    table = document.add_table(rows=2, cols=2)
+    table.cell(0, 0).text = "Party"
+    table.cell(0, 1).text = "Role"
+    table.cell(1, 0).text = "Acme"
+    table.cell(1, 1).text = "Supplier"
+    document.add_paragraph("Terms\tapply")
+    path = tmp_path / "contract.docx"
+    document.save(path)
+    return path
+
+def test_blocks_include_tables_in_document_order(contract):
+    assert list(iter_docx_blocks(contract)) == [
+        ("paragraph", "Introduction"),
+        ("table_row", "Party | Role"),
+        ("table_row", "Acme | Supplier"),
+        ("paragraph", "Terms\tapply"),
+    ]
+
+def test_paragraph_range(contract):
+    assert read_docx_text(contract, 2, 3) == "Party | Role\nAcme | Supplier"
+    assert read_docx_text(contract, start_paragraph=4) == "Terms\tapply"
+
+def test_matches_python_docx_paragraph_text(tmp_path):
+    document = docx.Document()
+    for i in range(200):
+        document.add_paragraph(f"Paragraph {i}")
+    path = tmp_path / "long.docx"
+    document.save(path)
+    assert read_docx_text(path) == "\n".join(p.text for p in docx.Document(path).paragraphs)
+
+def test_invalid_range(contract):
+    with pytest.raises(ValueError):
+        read_docx_text(contract, 3, 2)
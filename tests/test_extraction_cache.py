@@ -0,0 +1,67 @@
+# tests/test_extraction_cache.py
+
+import os
+import pytest
+from praxis_ai.utils.extraction_cache import ExtractionCache
+
+@pytest.fixture
+def cache(tmp_path):
+    return ExtractionCache(str(tmp_path / "cache"), max_bytes=1024 * 1024)
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "report.pdf"
+    path.write_bytes(b"original")
+    return path
+
+def test_get_or_extract_runs_extractor_once(cache, source):
+    calls = []
+
+    def extractor():
+        calls.append(1)
+        return "extracted text"
+
+    assert cache.get_or_extract(source, "pdf", extractor) == "extracted text"
+    assert cache.get_or_extract(source, "pdf", extractor) == "extracted text"
+    assert len(calls) == 1
+
+def test_kinds_are_cached_separately(cache, source):
+    cache.put(source, "pdf", "pdf text")
+    assert cache.get(source, "docx") is None
+    assert cache.get(source, "pdf") == "pdf text"
+
+def test_modified_file_invalidates_entry(cache, source):
+    cache.put(source, "pdf", "old text")
+    source.write_bytes(b"changed contents")
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert cache.get(source, "pdf") is None
+
+def test_file_changed_during_extraction_is_not_served_stale(cache, source):
+    def extractor():
+        source.write_bytes(b"rewritten while extracting")
+        stat = source.stat()
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        return "text of the original"
+
+    assert cache.get_or_extract(source, "pdf", extractor) == "text of the original"
+    assert cache.get(source, "pdf") is None
+
+def test_missing_file_is_never_cached(cache, tmp_path):
+    missing = tmp_path / "missing.pdf"
+    cache.put(missing, "pdf", "text")
+    assert cache.get(missing, "pdf") is None
+
+def test_eviction_keeps_cache_under_limit(tmp_path):
+    cache = ExtractionCache(str(tmp_path / "cache"), max_bytes=1000)
+    sources = []
+    for i in range(5):
+        path = tmp_path / f"doc{i}.pdf"
+        path.write_bytes(str(i).encode())
+        sources.append(path)
+        cache.put(path, "pdf", "x" * 300)
+        os.utime(cache._entry_path(cache._key(path, "pdf")), (i, i))
+
+    assert cache._scan_size() <= 1000
+    assert cache.get(sources[-1], "pdf") == "x" * 300
+    assert cache.get(sources[0], "pdf") is None
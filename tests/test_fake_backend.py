@@ -0,0 +1,32 @@
+# tests/test_fake_backend.py
+
+from fastapi.testclient import TestClient
+from praxis_ai.core.chat import chat
+from praxis_ai.interfaces.api import app
+from praxis_ai.tools.web_search import multi_web_search
+
+def test_objective_loop_runs_offline(fake_llm):
+    response = TestClient(app).post("/objective", json={"objective": "Write a haiku", "file_content": "notes"})
+
+    assert response.status_code == 200
+    tasks = response.json()
+    assert [task["description"] for task in tasks] == [
+        "Sub-task 1: Work on step 1 of 'Write a haiku' using the attached file content.",
+        "Sub-task 2: Work on step 2 of 'Write a haiku' using the attached file content.",
+    ]
+    roles = [fake_llm.role_of(request["messages"]) for request in fake_llm.requests]
+    assert roles == ["orchestrator", "sub_agent", "orchestrator", "sub_agent", "orchestrator"]
+    assert all(request["stream"] for request in fake_llm.requests)
+
+def test_chat_with_tools_uses_non_streaming_completions(fake_llm):
+    response = chat("hello there", [], None)
+
+    assert response.text == "You said: hello there"
+    assert "tools" in fake_llm.requests[0] and not fake_llm.requests[0].get("stream")
+
+def test_search_stub_serves_tools(fake_tavily):
+    result = multi_web_search(["alpha", "beta"], num_results=2)
+
+    assert result.startswith("4 unique results for 2 queries:")
+    assert "https://example.com/alpha/1" in result
+    assert sorted(fake_tavily.queries) == ["alpha", "beta"]
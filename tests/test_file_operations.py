@@ -0,0 +1,178 @@
+# tests/test_file_operations.py
+
+import pytest
+from praxis_ai.tools import file_operations
+from praxis_ai.tools.file_operations import (
+    batch_file_operations_tool, create_folder_structure_tool, edit_file_tool, grep_workspace_tool, list_files_tool,
+    read_file_tool,
+)
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    monkeypatch.setattr(file_operations.workspace_manager, "get_workspace_path", lambda title=None: str(tmp_path))
+    return tmp_path
+
+def test_batch_operations_run_and_report_each_item(workspace):
+    for name in ("a.txt", "b.txt", "c.txt"):
+        (workspace / name).write_text(f"content of {name}")
+
+    result = batch_file_operations_tool([
+        {"action": "copy", "source_path": "a.txt", "destination_path": "backup/a.txt"},
+        {"action": "move", "source_path": "b.txt", "destination_path": "archive/b.txt"},
+        {"action": "delete", "source_path": "c.txt"},
+    ], "test")
+
+    assert result.startswith("Batch complete: 3 succeeded, 0 failed.")
+    assert (workspace / "a.txt").read_text() == "content of a.txt"
+    assert (workspace / "backup" / "a.txt").read_text() == "content of a.txt"
+    assert (workspace / "archive" / "b.txt").read_text() == "content of b.txt"
+    assert not (workspace / "b.txt").exists()
+    assert not (workspace / "c.txt").exists()
+
+def test_invalid_batch_changes_nothing(workspace):
+    (workspace / "a.txt").write_text("a")
+    (workspace / "b.txt").write_text("b")
+
+    result = batch_file_operations_tool([
+        {"action": "delete", "source_path": "a.txt"},
+        {"action": "move", "source_path": "missing.txt", "destination_path": "x.txt"},
+        {"action": "copy", "source_path": "b.txt", "destination_path": "../outside.txt"},
+        {"action": "rename", "source_path": "b.txt"},
+    ], "test")
+
+    assert result.startswith("Error: Batch rejected, 3 invalid operation(s)")
+    assert (workspace / "a.txt").exists()
+    assert not (workspace.parent / "outside.txt").exists()
+
+def test_conflicting_operations_are_rejected(workspace):
+    (workspace / "a.txt").write_text("a")
+    (workspace / "b.txt").write_text("b")
+
+    result = batch_file_operations_tool([
+        {"action": "copy", "source_path": "a.txt", "destination_path": "same.txt"},
+        {"action": "copy", "source_path": "b.txt", "destination_path": "same.txt"},
+        {"action": "copy", "source_path": "a.txt", "destination_path": "a2.txt"},
+        {"action": "delete", "source_path": "a.txt"},
+    ], "test")
+
+    assert "2. conflicts with operation 1 on same.txt" in result
+    assert "4. conflicts with operation 1 on a.txt" in result
+    assert not (workspace / "same.txt").exists()
+
+def test_batch_delete_and_move_act_on_symlinks_not_their_targets(workspace, tmp_path_factory):
+    outside = tmp_path_factory.mktemp("outside") / "target.txt"
+    outside.write_text("outside")
+    (workspace / "inside.txt").write_text("inside")
+    (workspace / "out_link").symlink_to(outside)
+    (workspace / "in_link").symlink_to(workspace / "inside.txt")
+
+    result = batch_file_operations_tool([
+        {"action": "delete", "source_path": "out_link"},
+        {"action": "move", "source_path": "in_link", "destination_path": "links/in_link"},
+    ], "test")
+
+    assert result.startswith("Batch complete: 2 succeeded, 0 failed.")
+    assert not (workspace / "out_link").is_symlink()
+    assert outside.read_text() == "outside"
+    assert (workspace / "links" / "in_link").is_symlink()
+    assert (workspace / "inside.txt").read_text() == "inside"
+
+def test_batch_rejects_destination_under_a_file(workspace):
+    (workspace / "a.txt").write_text("a")
+    (workspace / "blocker").write_text("not a directory")
+
+    result = batch_file_operations_tool([
+        {"action": "copy", "source_path": "a.txt", "destination_path": "blocker/a.txt"},
+    ], "test")
+
+    assert result.startswith("Error: Batch rejected, 1 invalid operation(s)")
+    assert "destination parent is not a directory: blocker" in result
+
+def test_folder_structure_only_rewrites_changed_files(workspace):
+    structure = {"src": {"main.py": None, "util.py": None}, "README.md": None, "LICENSE": None}
+    code_blocks = [("main.py", "print('v1')"), ("util.py", "X = 1"), ("README.md", "# Demo")]
+
+    result = create_folder_structure_tool("demo", structure, code_blocks, "test")
+    assert "3 created, 0 updated, 0 unchanged" in result
+    assert "1 without content (LICENSE)" in result
+    assert (workspace / "demo" / "src" / "main.py").read_text() == "print('v1')"
+
+    code_blocks[0] = ("main.py", "print('v2')")
+    result = create_folder_structure_tool("demo", structure, code_blocks, "test")
+    assert "0 created, 1 updated, 2 unchanged" in result
+    assert (workspace / "demo" / "src" / "main.py").read_text() == "print('v2')"
+
+def test_folder_structure_uses_first_matching_code_block(workspace):
+    create_folder_structure_tool("demo", {"a.py": None}, [("a.py", "first"), ("a.py", "second")], "test")
+    assert (workspace / "demo" / "a.py").read_text() == "first"
+
+def test_edit_file_applies_changes_in_place(workspace):
+    path = workspace / "notes.txt"
+    path.write_text("alpha\nbeta\ngamma\n")
+    path.chmod(0o640)
+
+    result = edit_file_tool("notes.txt", "<<<<<<< SEARCH\nbeta\n=======\nBETA\n>>>>>>> REPLACE\n", "test")
+    assert result.startswith("File edited successfully")
+    assert path.read_text() == "alpha\nBETA\ngamma\n"
+    assert path.stat().st_mode & 0o777 == 0o640
+
+def test_edit_file_conflict_leaves_file_untouched(workspace):
+    path = workspace / "notes.txt"
+    path.write_text("alpha\nbeta\n")
+
+    result = edit_file_tool("notes.txt", "@@ -1,2 +1,2 @@\n alpha\n-delta\n+DELTA\n", "test")
+    assert "does not match the file" in result
+    assert path.read_text() == "alpha\nbeta\n"
+    assert [p.name for p in workspace.iterdir()] == ["notes.txt"]
+
+def test_read_file_line_range_and_cursor(workspace):
+    (workspace / "app.log").write_text("".join(f"entry {i}\n" for i in range(1, 101)))
+
+    result = read_file_tool("app.log", "test", start_line=10, end_line=12)
+    assert result.startswith("entry 10\nentry 11\nentry 12\n")
+    cursor = int(result.rsplit("cursor=", 1)[1].split(" ")[0])
+
+    result = read_file_tool("app.log", "test", cursor=cursor)
+    assert result.startswith("entry 13\n")
+    assert result.endswith("End of file.]")
+
+def test_large_file_is_paged_by_default(workspace, monkeypatch):
+    monkeypatch.setattr(file_operations, "READ_MAX_BYTES", 100)
+    monkeypatch.setattr(file_operations, "READ_PAGE_BYTES", 50)
+    (workspace / "big.txt").write_text("".join(f"row {i}\n" for i in range(100)))
+
+    result = read_file_tool("big.txt", "test")
+    assert result.startswith("row 0\n")
+    assert "Pass cursor=" in result
+    assert "row 99" not in result
+
+def test_list_files_recursive_with_pagination(workspace):
+    for name in ("a.py", "b.py", "src/c.py", "src/d.txt"):
+        (workspace / name).parent.mkdir(parents=True, exist_ok=True)
+        (workspace / name).write_text("x")
+
+    result = list_files_tool(".", "test")
+    assert [line.split("\t")[0] for line in result.splitlines()[1:]] == ["a.py", "b.py"]
+
+    result = list_files_tool(".", "test", recursive=True, pattern="*.py", limit=2)
+    lines = result.splitlines()
+    assert [line.split("\t")[0] for line in lines[1:3]] == ["a.py", "b.py"]
+    assert lines[1].split("\t")[1] == "1"
+    assert lines[-1] == "[More entries available. Pass cursor=2 to continue.]"
+
+    result = list_files_tool(".", "test", recursive=True, pattern="*.py", limit=2, cursor=2)
+    assert result.splitlines()[1].startswith("src/c.py\t")
+    assert "More entries" not in result
+
+def test_grep_workspace_tool(workspace):
+    (workspace / "src").mkdir()
+    (workspace / "src" / "tools.py").write_text("def read_tool():\n    pass\n\ndef write_tool():\n    pass\n")
+    (workspace / "README.md").write_text("Call read_tool first.\n")
+
+    result = grep_workspace_tool(r"def \w+_tool", "test", file_pattern="*.py")
+    assert result.splitlines() == [
+        "2 matches for 'def \\\\w+_tool' in 1 files:",
+        "src/tools.py:1: def read_tool():",
+        "src/tools.py:4: def write_tool():",
+    ]
+    assert "Invalid regular expression" in grep_workspace_tool("(", "test")
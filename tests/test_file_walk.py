@@ -0,0 +1,48 @@
+# tests/test_file_walk.py
+
+from praxis_ai.utils.file_walk import IgnoreRules, walk_files
+
+def make_tree(root, paths):
+    for path in paths:
+        target = root / path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(path)
+
+def paths(entries):
+    return [entry.path for entry in entries]
+
+def test_walk_is_sorted_and_skips_git(tmp_path):
+    make_tree(tmp_path, ["b.txt", "a/z.py", "a/b/c.py", ".git/config"])
+    assert paths(walk_files(tmp_path)) == ["a/b/c.py", "a/z.py", "b.txt"]
+    assert paths(walk_files(tmp_path, recursive=False)) == ["b.txt"]
+    assert paths(walk_files(tmp_path, max_depth=1)) == ["a/z.py", "b.txt"]
+
+def test_walk_entries_carry_size_and_mtime(tmp_path):
+    make_tree(tmp_path, ["data.txt"])
+    entry, = walk_files(tmp_path)
+    assert entry.size == len("data.txt")
+    assert entry.mtime == (tmp_path / "data.txt").stat().st_mtime
+
+def test_walk_pattern(tmp_path):
+    make_tree(tmp_path, ["main.py", "src/app.py", "src/app.ts", "docs/index.md"])
+    assert paths(walk_files(tmp_path, pattern="*.py")) == ["main.py", "src/app.py"]
+    assert paths(walk_files(tmp_path, pattern="src/**/*.ts")) == ["src/app.ts"]
+
+def test_walk_honors_nested_gitignore_and_extra_patterns(tmp_path):
+    make_tree(tmp_path, ["keep.py", "debug.log", "important.log", "build/out.js",
+                         "pkg/cache.tmp", "pkg/mod.py", "node_modules/x/index.js"])
+    (tmp_path / ".gitignore").write_text("# comment\n*.log\n!important.log\nbuild/\n")
+    (tmp_path / "pkg" / ".gitignore").write_text("*.tmp\n")
+
+    result = paths(walk_files(tmp_path, ignore=["node_modules/"]))
+    assert result == [".gitignore", "important.log", "keep.py", "pkg/.gitignore", "pkg/mod.py"]
+    assert "debug.log" in paths(walk_files(tmp_path, respect_gitignore=False))
+
+def test_ignore_rules_anchoring():
+    rules = IgnoreRules(["/dist", "docs/*.md", "tmp/"])
+    assert rules.match("dist", is_dir=True)
+    assert rules.match("src/dist", is_dir=True) is None
+    assert rules.match("docs/a.md", is_dir=False)
+    assert rules.match("docs/sub/a.md", is_dir=False) is None
+    assert rules.match("tmp", is_dir=False) is None
+    assert rules.match("a/tmp", is_dir=True)
@@ -0,0 +1,63 @@
+# tests/test_logging.py
+
+import json
+import logging
+import threading
+import pytest
+from praxis_ai.utils.logging import log_context, start_logging
+from praxis_ai.utils.tracing import span
+
+@pytest.fixture
+def isolated_logger(request):
+    logger = logging.getLogger(f"praxis-test-{request.node.name}")
+    logger.propagate = False
+    yield logger
+    logger.handlers.clear()
+
+def test_records_are_written_as_json_with_correlation_ids(tmp_path, isolated_logger):
+    log_file = tmp_path / "logs" / "praxis.log"
+    listener = start_logging(isolated_logger, str(log_file), level="INFO", log_format="json")
+
+    isolated_logger.debug("not written")
+    with log_context(objective_id="obj-1", workspace="demo"):
+        with log_context(task_id="task-7"), span("sub_agent") as current:
+            isolated_logger.info("Processed %d files", 3)
+        try:
+            raise ValueError("bad input")
+        except ValueError:
+            isolated_logger.exception("Tool failed")
+    isolated_logger.warning("outside")
+    listener.stop()
+
+    first, second, third = [json.loads(line) for line in log_file.read_text().splitlines()]
+    assert first["message"] == "Processed 3 files" and first["level"] == "INFO"
+    assert (first["objective_id"], first["task_id"], first["workspace"]) == ("obj-1", "task-7", "demo")
+    assert (first["trace_id"], first["span_id"]) == (current.trace_id, current.span_id)
+    assert "task_id" not in second and second["objective_id"] == "obj-1"
+    assert "ValueError: bad input" in second["exception"]
+    assert third == {"time": third["time"], "level": "WARNING", "logger": isolated_logger.name, "message": "outside"}
+
+def test_logging_happens_off_the_calling_thread(tmp_path, isolated_logger, monkeypatch):
+    log_file = tmp_path / "praxis.log"
+    listener = start_logging(isolated_logger, str(log_file), level="INFO", log_format="text")
+    writer_threads = set()
+    file_handler = listener.handlers[0]
+    original_emit = file_handler.emit
+    monkeypatch.setattr(file_handler, "emit", lambda record: (writer_threads.add(threading.get_ident()), original_emit(record)))
+
+    with log_context(workspace="demo"):
+        isolated_logger.info("hello")
+    listener.stop()
+
+    assert writer_threads and threading.get_ident() not in writer_threads
+    assert log_file.read_text().strip().endswith("INFO - hello [workspace=demo]")
+
+def test_log_file_rotates_by_size(tmp_path, isolated_logger):
+    log_file = tmp_path / "praxis.log"
+    listener = start_logging(isolated_logger, str(log_file), level="INFO", max_bytes=500, backup_count=2)
+    for i in range(50):
+        isolated_logger.info("message %d with some padding to fill the file", i)
+    listener.stop()
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["praxis.log", "praxis.log.1", "praxis.log.2"]
+    assert all(path.stat().st_size <= 500 for path in tmp_path.iterdir())
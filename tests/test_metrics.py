@@ -0,0 +1,64 @@
+# tests/test_metrics.py
+
+from fastapi.testclient import TestClient
+from praxis_ai.utils import metrics
+from praxis_ai.utils.metrics import Registry
+from praxis_ai.utils.tracing import Span
+
+def test_registry_renders_prometheus_text_format():
+    registry = Registry()
+    requests = registry.counter("requests_total", "Requests handled.", ["path"])
+    in_flight = registry.gauge("in_flight", "Requests in flight.")
+    latency = registry.histogram("latency_seconds", "Request latency.", ["path"], buckets=(0.1, 1))
+
+    requests.inc(path="/a")
+    requests.inc(2, path='/b"x')
+    with in_flight.track_in_progress():
+        in_flight_during = registry.render()
+    for value in (0.05, 0.1, 0.5, 3):
+        latency.observe(value, path="/a")
+
+    assert "in_flight 1" in in_flight_during
+    assert registry.render().splitlines() == [
+        "# HELP requests_total Requests handled.",
+        "# TYPE requests_total counter",
+        'requests_total{path="/a"} 1',
+        'requests_total{path="/b\\"x"} 2',
+        "# HELP in_flight Requests in flight.",
+        "# TYPE in_flight gauge",
+        "in_flight 0",
+        "# HELP latency_seconds Request latency.",
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{path="/a",le="0.1"} 2',
+        'latency_seconds_bucket{path="/a",le="1"} 3',
+        'latency_seconds_bucket{path="/a",le="+Inf"} 4',
+        'latency_seconds_sum{path="/a"} 3.65',
+        'latency_seconds_count{path="/a"} 4',
+    ]
+
+def test_spans_feed_metrics():
+    span = Span("sub_agent", "llm", model="gpt-4o-mini", prompt_tokens=100, completion_tokens=20, cache_hits=2)
+    span.finish()
+    metrics.observe_span(span)
+    failed = Span("web_search", "tool")
+    failed.error = "Error performing web search"
+    failed.finish()
+    metrics.observe_span(failed)
+
+    text = metrics.registry.render()
+    assert 'praxis_llm_call_duration_seconds_count{stage="sub_agent",model="gpt-4o-mini"}' in text
+    assert 'praxis_llm_tokens_total{stage="sub_agent",model="gpt-4o-mini",type="prompt"}' in text
+    assert 'praxis_tool_duration_seconds_count{tool="web_search"}' in text
+    assert 'praxis_errors_total{kind="tool",name="web_search"}' in text
+    assert 'praxis_span_cache_lookups_total{kind="llm",result="hit"}' in text
+
+def test_metrics_endpoint():
+    from praxis_ai.interfaces.api import app
+
+    response = TestClient(app).get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "praxis_objectives_in_progress 0" in response.text
+    assert 'praxis_cache_hit_ratio{cache="search"}' in response.text
+    assert "# TYPE praxis_cache_hits_total counter" in response.text
+    assert 'praxis_cache_misses_total{cache="fetch"}' in response.text
@@ -0,0 +1,50 @@
+# tests/test_mime_detection.py
+
+import os
+from praxis_ai.utils import mime_detection
+from praxis_ai.utils.mime_detection import detect_mime_type, is_text_mime, clear_mime_cache
+
+def fail_if_called(*args, **kwargs):
+    raise AssertionError("libmagic should not be consulted for known extensions")
+
+def test_known_extension_skips_file_access(tmp_path, monkeypatch):
+    monkeypatch.setattr(mime_detection.magic, "from_buffer", fail_if_called)
+    # The file does not need to exist for a trusted extension.
+    assert detect_mime_type(tmp_path / "notes.MD") == "text/markdown"
+    assert detect_mime_type(tmp_path / "report.pdf") == "application/pdf"
+
+def test_unknown_extension_is_sniffed_and_cached(tmp_path, monkeypatch):
+    clear_mime_cache()
+    path = tmp_path / "script"
+    path.write_text("#!/bin/sh\necho hi\n")
+    calls = []
+    real_from_buffer = mime_detection.magic.from_buffer
+
+    def counting_from_buffer(buffer, mime=False):
+        calls.append(len(buffer))
+        return real_from_buffer(buffer, mime=mime)
+
+    monkeypatch.setattr(mime_detection.magic, "from_buffer", counting_from_buffer)
+    first = detect_mime_type(path)
+    assert detect_mime_type(path) == first
+    assert len(calls) == 1
+
+    path.write_text("#!/bin/sh\necho changed contents\n")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    detect_mime_type(path)
+    assert len(calls) == 2
+
+def test_sniffing_reads_only_the_head(tmp_path, monkeypatch):
+    clear_mime_cache()
+    path = tmp_path / "large.bin"
+    path.write_bytes(b"\x00" * (mime_detection.SNIFF_BYTES * 4))
+    sizes = []
+    monkeypatch.setattr(mime_detection.magic, "from_buffer", lambda buffer, mime=False: sizes.append(len(buffer)) or "application/octet-stream")
+    assert detect_mime_type(path) == "application/octet-stream"
+    assert sizes == [mime_detection.SNIFF_BYTES]
+
+def test_is_text_mime():
+    assert is_text_mime("text/x-python")
+    assert is_text_mime("application/json")
+    assert not is_text_mime("application/pdf")
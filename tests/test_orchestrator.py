@@ -1,10 +1,10 @@
 # tests/test_orchestrator.py
 
 import pytest
-from config.models import AgentContext
-from core.orchestrator import orchestrator
+from praxis_ai.config.models import AgentContext
+from praxis_ai.core.orchestrator import orchestrator
 
-def test_orchestrator():
+def test_orchestrator(fake_llm):
     context = AgentContext(objective="Test objective")
     response = orchestrator(context)
     
@@ -12,7 +12,7 @@ def test_orchestrator():
     assert isinstance(response.text, str)
     assert len(response.text) > 0
 
-def test_orchestrator_with_file_content():
+def test_orchestrator_with_file_content(fake_llm):
     context = AgentContext(objective="Test objective", file_content="Sample file content")
     response = orchestrator(context)
     
@@ -21,7 +21,7 @@ def test_orchestrator_with_file_content():
     assert len(response.text) > 0
     assert "file content" in response.text.lower()
 
-def test_orchestrator_task_completion():
+def test_orchestrator_task_completion(fake_llm):
     context = AgentContext(objective="Test objective", previous_results=["Task 1 completed", "Task 2 completed"])
     response = orchestrator(context)
     
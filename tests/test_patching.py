@@ -0,0 +1,74 @@
+# tests/test_patching.py
+
+import pytest
+from praxis_ai.utils.patching import apply_patch, apply_search_replace, apply_unified_diff, PatchError
+
+ORIGINAL = "".join(f"line {i}\n" for i in range(1, 21))
+
+def test_search_replace_block():
+    edits = "<<<<<<< SEARCH\nline 5\nline 6\n=======\nline five\n>>>>>>> REPLACE\n"
+    patched, applied = apply_search_replace(ORIGINAL, edits)
+    assert applied == 1
+    assert "line 4\nline five\nline 7\n" in patched
+
+def test_search_replace_rejects_missing_and_ambiguous_text():
+    with pytest.raises(PatchError, match="not found"):
+        apply_search_replace(ORIGINAL, "<<<<<<< SEARCH\nline 99\n=======\nx\n>>>>>>> REPLACE\n")
+    with pytest.raises(PatchError, match="matches 2 locations"):
+        apply_search_replace("a\nb\na\n", "<<<<<<< SEARCH\na\n=======\nc\n>>>>>>> REPLACE\n")
+
+def test_search_replace_handles_last_line_without_newline():
+    patched, _ = apply_search_replace("a\nb", "<<<<<<< SEARCH\nb\n=======\nc\n>>>>>>> REPLACE\n")
+    assert patched == "a\nc"
+
+def test_unified_diff():
+    diff = (
+        "--- a/file.txt\n"
+        "+++ b/file.txt\n"
+        "@@ -2,3 +2,3 @@\n"
+        " line 2\n"
+        "-line 3\n"
+        "+line three\n"
+        " line 4\n"
+        "@@ -18,2 +18,3 @@\n"
+        " line 18\n"
+        "+inserted\n"
+        " line 19\n"
+    )
+    patched, applied = apply_unified_diff(ORIGINAL, diff)
+    assert applied == 2
+    assert "line 2\nline three\nline 4\n" in patched
+    assert "line 18\ninserted\nline 19\n" in patched
+    assert patched.endswith("line 20\n")
+
+def test_unified_diff_tolerates_wrong_line_numbers():
+    diff = "@@ -1,2 +1,2 @@\n line 10\n-line 11\n+line eleven\n"
+    patched, _ = apply_unified_diff(ORIGINAL, diff)
+    assert "line 10\nline eleven\nline 12\n" in patched
+
+def test_unified_diff_conflict():
+    diff = "@@ -3,2 +3,2 @@\n line 3\n-not in file\n+x\n"
+    with pytest.raises(PatchError, match="Hunk 1"):
+        apply_unified_diff(ORIGINAL, diff)
+
+def test_crlf_line_endings_are_preserved():
+    content = "a\r\nb\r\nc\r\n"
+    patched, _ = apply_patch(content, "@@ -2 +2 @@\n-b\n+B\n")
+    assert patched == "a\r\nB\r\nc\r\n"
+    patched, _ = apply_patch(content, "<<<<<<< SEARCH\nb\n=======\nB\n>>>>>>> REPLACE\n")
+    assert patched == "a\r\nB\r\nc\r\n"
+
+def test_form_feed_and_unicode_separators_are_not_line_breaks():
+    content = "page one\f\nsection\u2028still section\nline 3\nline 4\n"
+    diff = "@@ -3,2 +3,2 @@\n line 3\n-line 4\n+line four\n"
+    patched, _ = apply_unified_diff(content, diff)
+    assert patched == "page one\f\nsection\u2028still section\nline 3\nline four\n"
+    patched, _ = apply_patch(content, "<<<<<<< SEARCH\nsection\u2028still section\n=======\nx\f\n>>>>>>> REPLACE\n")
+    assert patched == "page one\f\nx\f\nline 3\nline 4\n"
+
+def test_unified_diff_keeps_lines_that_look_like_file_headers():
+    content = "-- old comment\nkeep\n"
+    diff = "--- a/q.sql\n+++ b/q.sql\n@@ -1,2 +1,2 @@\n--- old comment\n+++ new counter\n keep\n"
+    patched, applied = apply_unified_diff(content, diff)
+    assert applied == 1
+    assert patched == "++ new counter\nkeep\n"
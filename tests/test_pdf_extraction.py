@@ -0,0 +1,43 @@
+# tests/test_pdf_extraction.py
+
+import pytest
+from reportlab.pdfgen import canvas
+from reportlab.lib.pagesizes import letter
+from praxis_ai.utils import pdf_extraction
+from praxis_ai.utils.pdf_extraction import extract_pdf_text, iter_pdf_pages, resolve_page_range
+
+@pytest.fixture
+def sample_pdf(tmp_path):
+    path = tmp_path / "report.pdf"
+    c = canvas.Canvas(str(path), pagesize=letter)
+    for i in range(1, 11):
+        c.drawString(40, 750, f"Page number {i}")
+        c.showPage()
+    c.save()
+    return path
+
+def test_resolve_page_range():
+    assert resolve_page_range(10) == (0, 10)
+    assert resolve_page_range(10, 4, 6) == (3, 6)
+    assert resolve_page_range(10, 9, 50) == (8, 10)
+    assert resolve_page_range(0) == (0, 0)
+    with pytest.raises(ValueError):
+        resolve_page_range(10, 11)
+    with pytest.raises(ValueError):
+        resolve_page_range(10, 5, 4)
+
+def test_page_range_extraction(sample_pdf):
+    pages = list(iter_pdf_pages(sample_pdf, 4, 6, workers=1))
+    assert [number for number, _ in pages] == [4, 5, 6]
+    assert "Page number 5" in pages[1][1]
+
+def test_full_extraction_keeps_page_order(sample_pdf):
+    text = extract_pdf_text(sample_pdf, workers=1)
+    positions = [text.index(f"Page number {i}\n" if i < 10 else "Page number 10") for i in range(1, 11)]
+    assert positions == sorted(positions)
+
+def test_parallel_extraction_matches_serial(sample_pdf, monkeypatch):
+    monkeypatch.setattr(pdf_extraction, "PDF_PARALLEL_MIN_PAGES", 2)
+    serial = list(iter_pdf_pages(sample_pdf, workers=1))
+    parallel = list(iter_pdf_pages(sample_pdf, workers=2))
+    assert parallel == serial
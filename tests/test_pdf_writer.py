@@ -0,0 +1,45 @@
+# tests/test_pdf_writer.py
+
+import pypdf
+from praxis_ai.utils.pdf_writer import StreamingPdfWriter, write_pdf
+
+def read_pages(path):
+    reader = pypdf.PdfReader(str(path))
+    return [page.extract_text() for page in reader.pages]
+
+def test_short_content_fits_on_one_page(tmp_path):
+    path = tmp_path / "short.pdf"
+    assert write_pdf(path, ["Hello (world)\nSecond line \\ done"]) == 1
+    text = read_pages(path)[0]
+    assert "Hello (world)" in text
+    assert "Second line \\ done" in text
+
+def test_long_content_is_paginated(tmp_path):
+    path = tmp_path / "long.pdf"
+    lines = [f"Line {i}" for i in range(500)]
+    page_count = write_pdf(path, ["\n".join(lines)])
+    pages = read_pages(path)
+    assert page_count == len(pages) > 1
+    assert "Line 0" in pages[0]
+    assert "Line 499" in pages[-1]
+
+def test_long_lines_are_wrapped(tmp_path):
+    path = tmp_path / "wrapped.pdf"
+    write_pdf(path, [" ".join(["word"] * 400)])
+    text = read_pages(path)[0]
+    assert len(text.splitlines()) > 1
+
+def test_chunks_may_split_lines(tmp_path):
+    path = tmp_path / "chunks.pdf"
+    chunks = (f"chunk {i} " + ("\n" if i % 10 == 9 else "") for i in range(100))
+    write_pdf(path, chunks)
+    text = "".join(read_pages(path))
+    assert "chunk 0 chunk 1" in text
+    assert "chunk 99" in text
+
+def test_empty_document_has_one_page(tmp_path):
+    path = tmp_path / "empty.pdf"
+    with StreamingPdfWriter(path) as writer:
+        pass
+    assert writer.page_count == 1
+    assert len(read_pages(path)) == 1
@@ -0,0 +1,58 @@
+# tests/test_profiling.py
+
+import os
+import pstats
+from fastapi.testclient import TestClient
+from praxis_ai.interfaces.api import app
+from praxis_ai.utils.profiling import profile, should_sample
+
+def busy_loop(n):
+    return sum(i * i for i in range(n))
+
+def test_profile_saves_stats_and_reports_hot_functions(tmp_path):
+    with profile("unit test", memory=True, output_dir=str(tmp_path), top=50) as result:
+        busy_loop(20000)
+        blocks = [bytearray(1024) for _ in range(200)]
+
+    assert result.duration > 0 and not result.skipped
+    assert any("busy_loop" in row["function"] for row in result.functions)
+    assert any("test_profiling.py" in row["location"] for row in result.allocations)
+    assert result.stats_path.endswith("-unit_test.prof")
+    assert pstats.Stats(result.stats_path).total_calls > 0
+    assert "busy_loop" in open(result.report_path).read()
+    del blocks
+
+def test_nested_profile_is_skipped(tmp_path):
+    with profile("outer", output_dir=str(tmp_path)) as outer:
+        with profile("inner", output_dir=str(tmp_path)) as inner:
+            busy_loop(100)
+
+    assert inner.skipped and inner.stats_path is None
+    assert not outer.skipped and outer.stats_path
+
+def test_sample_rate_bounds():
+    assert not any(should_sample(0.0) for _ in range(100))
+    assert all(should_sample(1.0) for _ in range(100))
+
+def test_api_profiles_objective_on_request(fake_llm, tmp_path, monkeypatch):
+    monkeypatch.setattr("praxis_ai.utils.profiling.PROFILE_DIR", str(tmp_path))
+    monkeypatch.setattr("praxis_ai.interfaces.api.ALLOW_REQUEST_PROFILING", True)
+    client = TestClient(app)
+
+    plain = client.post("/objective", json={"objective": "Write a haiku"})
+    profiled = client.post("/objective?profile=true", json={"objective": "Write a haiku"})
+
+    assert "X-Praxis-Profile" not in plain.headers
+    profile_name = profiled.headers["X-Praxis-Profile"]
+    assert os.sep not in profile_name
+    stats_path = os.path.join(str(tmp_path), profile_name)
+    assert any(filename.endswith("orchestrator.py") for filename, _, _ in pstats.Stats(stats_path).stats)
+
+def test_api_rejects_profiling_requests_unless_allowed(fake_llm, tmp_path, monkeypatch):
+    monkeypatch.setattr("praxis_ai.utils.profiling.PROFILE_DIR", str(tmp_path))
+    client = TestClient(app)
+
+    response = client.post("/objective?profile_memory=true", json={"objective": "Write a haiku"})
+    assert response.status_code == 403
+    assert "PRAXIS_ALLOW_REQUEST_PROFILING" in response.json()["detail"]
+    assert not os.listdir(tmp_path)
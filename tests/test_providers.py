@@ -0,0 +1,59 @@
+# tests/test_providers.py
+
+import os
+import subprocess
+import sys
+import ell
+import groq
+import pytest
+from praxis_ai.config.models import Task
+from praxis_ai.config.settings import SUB_AGENT_MODEL
+from praxis_ai.core import providers
+from praxis_ai.core.sub_agent import sub_agent
+
+def test_ollama_models_use_the_local_openai_compatible_endpoint(fake_llm):
+    models = providers.configure_models({"chat": ("ollama", "llama3.1"), "sub_agent": ("ollama", "qwen2.5")})
+
+    assert models == {"llama3.1": "ollama", "qwen2.5": "ollama"}
+    registered = ell.config.registry["llama3.1"]
+    assert str(registered.default_client.base_url) == "http://localhost:11434/v1/"
+    assert registered.supports_streaming is False
+
+def test_groq_client_is_bound_once_its_key_is_set(fake_llm, monkeypatch):
+    monkeypatch.delenv("GROQ_API_KEY", raising=False)
+    providers.configure_models({"chat": ("groq", "llama-3.1-8b-instant")})
+    assert ell.config.registry["llama-3.1-8b-instant"].default_client is None
+
+    monkeypatch.setenv("GROQ_API_KEY", "test-groq-key")
+    providers.configure_models({"chat": ("groq", "llama-3.1-8b-instant")})
+    assert isinstance(ell.config.registry["llama-3.1-8b-instant"].default_client, groq.Groq)
+
+def test_required_api_keys_follow_the_configured_providers():
+    assert providers.required_api_keys({"chat": ("ollama", "llama3.1"), "refiner": ("ollama", "llama3.1")}) == []
+    assert providers.required_api_keys({
+        "chat": ("groq", "llama-3.1-8b-instant"), "sub_agent": ("groq", "llama-3.1-8b-instant"),
+        "orchestrator": ("openai", "gpt-4o"), "refiner": ("ollama", "llama3.1"),
+    }) == [("GROQ_API_KEY", "Groq"), ("OPENAI_API_KEY", "OpenAI")]
+
+def test_invalid_configurations_are_rejected(fake_llm):
+    with pytest.raises(ValueError, match="Unknown model provider 'mistral'"):
+        providers.configure_models({"chat": ("mistral", "small")})
+    with pytest.raises(ValueError, match="both the groq and ollama providers"):
+        providers.configure_models({"chat": ("groq", "llama3.1"), "sub_agent": ("ollama", "llama3.1")})
+
+def test_non_openai_roles_are_not_streamed(fake_llm, monkeypatch):
+    monkeypatch.setattr(providers, "make_client", lambda provider: fake_llm.client())
+    providers.configure_models({"sub_agent": ("ollama", SUB_AGENT_MODEL)})
+
+    response = sub_agent(Task(id="1", description="Summarize the notes", status="pending"), [])
+
+    assert response.text.startswith("Completed:")
+    assert fake_llm.requests[0]["model"] == SUB_AGENT_MODEL and not fake_llm.requests[0].get("stream")
+
+def test_starts_without_openai_key_on_local_models():
+    env = {key: value for key, value in os.environ.items() if key not in ("OPENAI_API_KEY", "TAVILY_API_KEY")}
+    env["PRAXIS_MODEL_PROVIDER"] = "ollama"
+    result = subprocess.run([sys.executable, "-c", "import praxis_ai.interfaces.api, praxis_ai.cli"],
+                            env=env, capture_output=True, text=True, timeout=120)
+
+    assert result.returncode == 0, result.stderr
@@ -1,10 +1,10 @@
 # tests/test_refiner.py
 
 import pytest
-from config.models import AgentContext, Task
-from core.refiner import refiner
+from praxis_ai.config.models import AgentContext, Task
+from praxis_ai.core.refiner import refiner
 
-def test_refiner():
+def test_refiner(fake_llm):
     context = AgentContext(
         objective="Test objective",
         tasks=[
@@ -21,7 +21,7 @@ def test_refiner():
     assert "Result 1" in response.text
     assert "Result 2" in response.text
 
-def test_refiner_with_code_project():
+def test_refiner_with_code_project(fake_llm):
     context = AgentContext(
         objective="Create a Python script that calculates fibonacci numbers",
         tasks=[
@@ -0,0 +1,47 @@
+# tests/test_scheduling.py
+
+import datetime
+import time
+import pytz
+from praxis_ai.utils.scheduling import find_free_slots, merge_intervals, parse_time, working_windows
+
+UTC = datetime.timezone.utc
+
+def at(day, hour, minute=0):
+    return datetime.datetime(2024, 3, day, hour, minute, tzinfo=UTC)
+
+def test_parse_time():
+    assert parse_time("2024-03-04T09:00:00Z") == at(4, 9)
+    berlin = pytz.timezone("Europe/Berlin")
+    assert parse_time("2024-03-04T10:00:00", berlin) == at(4, 9)
+
+def test_merge_intervals_with_buffer():
+    busy = [(at(4, 11), at(4, 12)), (at(4, 9), at(4, 10)), (at(4, 9, 30), at(4, 10, 30)), (at(4, 12, 10), at(4, 13))]
+    assert merge_intervals(busy) == [(at(4, 9), at(4, 10, 30)), (at(4, 11), at(4, 12)), (at(4, 12, 10), at(4, 13))]
+    assert merge_intervals(busy, datetime.timedelta(minutes=5)) == [
+        (at(4, 8, 55), at(4, 10, 35)), (at(4, 10, 55), at(4, 13, 5))]
+
+def test_find_free_slots_in_working_hours():
+    busy = merge_intervals([(at(4, 9), at(4, 10)), (at(4, 10, 30), at(4, 16)), (at(5, 0), at(5, 23))])
+    windows = working_windows(at(4, 0), at(7, 0), UTC, datetime.time(9), datetime.time(17))
+    assert windows[0] == (at(4, 9), at(4, 17))
+    slots = find_free_slots(busy, windows, datetime.timedelta(minutes=30))
+    assert slots == [(at(4, 10), at(4, 10, 30)), (at(4, 16), at(4, 17)), (at(6, 9), at(6, 17))]
+    assert find_free_slots(busy, windows, datetime.timedelta(minutes=45), max_slots=1) == [(at(4, 16), at(4, 17))]
+
+def test_working_windows_skip_weekends_and_follow_dst():
+    berlin = pytz.timezone("Europe/Berlin")
+    windows = working_windows(at(29, 0), at(2, 0).replace(month=4), berlin, datetime.time(9), datetime.time(17),
+                              weekdays_only=True)
+    # Friday 29 March (UTC+1), then Monday 1 April after the switch to summer time (UTC+2).
+    assert windows == [(at(29, 8), at(29, 16)), (at(1, 7).replace(month=4), at(1, 15).replace(month=4))]
+
+def test_quarter_for_twenty_people_is_fast():
+    start = datetime.datetime(2024, 1, 1, tzinfo=UTC)
+    busy = [(start + datetime.timedelta(hours=h, minutes=p), start + datetime.timedelta(hours=h, minutes=p + 30))
+            for p in range(20) for h in range(0, 90 * 24, 2)]
+    began = time.perf_counter()
+    windows = working_windows(start, start + datetime.timedelta(days=90), UTC, datetime.time(9), datetime.time(17), True)
+    slots = find_free_slots(merge_intervals(busy), windows, datetime.timedelta(minutes=30))
+    assert time.perf_counter() - began < 1
+    assert slots and all(end - begin >= datetime.timedelta(minutes=30) for begin, end in slots)
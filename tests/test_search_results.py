@@ -0,0 +1,25 @@
+# tests/test_search_results.py
+
+from praxis_ai.utils.search_results import compact_results, estimate_tokens, render_results, trim_to_tokens
+
+def test_trim_to_tokens_prefers_sentence_boundaries():
+    text = "First sentence here. Second sentence is a good deal longer than the first one."
+    assert trim_to_tokens(text, 100) == text
+    assert trim_to_tokens(text, 8) == "First sentence here."
+    trimmed = trim_to_tokens("word " * 100, 10)
+    assert trimmed.endswith("...") and estimate_tokens(trimmed) <= 11
+
+def test_compact_results_drops_near_duplicates():
+    results = [
+        {"title": "A", "url": "https://a.com", "snippet": "The quick brown fox jumps over the lazy dog", "queries": ["q1"]},
+        {"title": "B", "url": "https://b.com", "snippet": "The quick brown fox jumps over the lazy dog!", "queries": ["q2"]},
+        {"title": "C", "url": "https://c.com", "snippet": "Something else entirely", "queries": ["q1"]},
+    ]
+    compacted = compact_results(results, snippet_tokens=50, similarity_threshold=0.8)
+    assert [r["title"] for r in compacted] == ["A", "C"]
+    assert compacted[0]["queries"] == ["q1", "q2"]
+    assert results[0]["queries"] == ["q1"]
+
+def test_render_results():
+    rendered = render_results([{"title": "A", "url": "https://a.com", "snippet": "About A", "queries": ["x", "y"]}])
+    assert rendered == "1. A\n   https://a.com\n   Found by: x; y\n   About A"
@@ -1,10 +1,10 @@
 # tests/test_sub_agent.py
 
 import pytest
-from config.models import Task
-from core.sub_agent import sub_agent
+from praxis_ai.config.models import Task
+from praxis_ai.core.sub_agent import sub_agent
 
-def test_sub_agent():
+def test_sub_agent(fake_llm):
     task = Task(id="1", description="Test task", status="pending")
     response = sub_agent(task)
     
@@ -12,7 +12,7 @@ def test_sub_agent():
     assert isinstance(response.text, str)
     assert len(response.text) > 0
 
-def test_sub_agent_with_previous_tasks():
+def test_sub_agent_with_previous_tasks(fake_llm):
     previous_tasks = [
         Task(id="1", description="Previous task 1", status="completed", result="Result 1"),
         Task(id="2", description="Previous task 2", status="completed", result="Result 2")
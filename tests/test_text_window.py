@@ -0,0 +1,51 @@
+# tests/test_text_window.py
+
+import pytest
+from praxis_ai.utils.text_window import TextWindow
+
+@pytest.fixture
+def log_file(tmp_path):
+    path = tmp_path / "app.log"
+    path.write_text("".join(f"line {i}\n" for i in range(1, 1001)))
+    return path
+
+def test_read_lines(log_file):
+    with TextWindow(log_file) as window:
+        text, next_offset = window.read_lines(40, 45)
+    assert text == "".join(f"line {i}\n" for i in range(40, 46))
+    assert log_file.read_bytes()[next_offset:].startswith(b"line 46\n")
+
+def test_read_last_lines_reaches_end(log_file):
+    with TextWindow(log_file) as window:
+        text, next_offset = window.read_lines(999, 2000)
+    assert text == "line 999\nline 1000\n"
+    assert next_offset is None
+
+def test_line_past_end_of_file(log_file):
+    with TextWindow(log_file) as window:
+        with pytest.raises(ValueError):
+            window.read_lines(1001, 1002)
+
+def test_pages_cover_file_on_line_boundaries(log_file):
+    pages = []
+    cursor = 0
+    with TextWindow(log_file) as window:
+        while cursor is not None:
+            text, cursor = window.read_page(cursor, 100)
+            assert text.endswith("\n")
+            pages.append(text)
+    assert "".join(pages) == log_file.read_text()
+    assert len(pages) > 1
+
+def test_read_bytes(log_file):
+    with TextWindow(log_file) as window:
+        text, next_offset = window.read_bytes(0, 7)
+    assert text == "line 1\n"
+    assert next_offset == 7
+
+def test_empty_file(tmp_path):
+    path = tmp_path / "empty.txt"
+    path.write_text("")
+    with TextWindow(path) as window:
+        assert window.read_page(0, 100) == ("", None)
+        assert window.read_lines(1, 5) == ("", None)
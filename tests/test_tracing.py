@@ -0,0 +1,100 @@
+# tests/test_tracing.py
+
+import ell
+import pytest
+from types import SimpleNamespace
+from praxis_ai.utils import tracing
+from praxis_ai.utils.tracing import (
+    JsonLinesExporter, span, traced, record_cache, instrument_ell, read_spans, summarize_spans
+)
+
+@pytest.fixture
+def trace_file(tmp_path, monkeypatch):
+    path = str(tmp_path / "spans.jsonl")
+    exporter = JsonLinesExporter(path, max_bytes=1024 * 1024)
+    monkeypatch.setattr(tracing, "exporter", exporter)
+    monkeypatch.setattr(tracing, "TRACING_ENABLED", True)
+    yield path
+    exporter.close()
+
+def test_spans_nest_and_export_as_json_lines(trace_file):
+    @traced("sub_agent", kind="llm")
+    def call_model():
+        record_cache(True)
+        record_cache(False)
+        return "done"
+
+    with pytest.raises(RuntimeError):
+        with span("objective", kind="objective") as root:
+            assert call_model() == "done"
+            raise RuntimeError("boom")
+
+    child, parent = list(read_spans(trace_file))
+    assert (child["name"], child["kind"], parent["name"]) == ("sub_agent", "llm", "objective")
+    assert child["trace_id"] == parent["trace_id"] == root.trace_id
+    assert child["parent_id"] == parent["span_id"] and parent["parent_id"] is None
+    assert child["attributes"] == {"cache_hits": 1, "cache_misses": 1}
+    assert child["status"] == "ok"
+    assert parent["status"] == "error" and parent["error"] == "RuntimeError: boom"
+    assert parent["end"] >= child["end"] >= child["start"] >= parent["start"]
+    assert tracing.current_span() is None
+
+def test_instrumented_providers_record_model_and_tokens(trace_file, monkeypatch):
+    class FakeClient:
+        pass
+
+    class FakeProvider:
+        def call(self, ell_call, origin_id=None, logger=None):
+            usage = {"prompt_tokens": 120, "completion_tokens": 30, "prompt_tokens_details": {"cached_tokens": 64}}
+            return "reply", {"model": ell_call.model}, {"usage": usage}
+
+    provider = FakeProvider()
+    monkeypatch.setitem(ell.config.providers, FakeClient, provider)
+    instrument_ell()
+    instrument_ell()
+
+    with span("chat", kind="llm") as chat_span:
+        provider.call(SimpleNamespace(model="gpt-4o-mini"))
+        provider.call(SimpleNamespace(model="gpt-4o-mini"))
+
+    assert chat_span.attributes == {
+        "model": "gpt-4o-mini", "prompt_tokens": 240, "completion_tokens": 60, "cached_prompt_tokens": 128}
+
+def test_summary_reports_percentiles_per_stage():
+    spans = [{"kind": "llm", "name": "chat", "duration_ms": float(ms), "status": "ok", "start": 100,
+              "attributes": {"prompt_tokens": 10, "completion_tokens": 2}} for ms in range(1, 101)]
+    spans.append({"kind": "tool", "name": "web_search", "duration_ms": 500.0, "status": "error", "start": 100})
+    spans.append({"kind": "tool", "name": "web_search", "duration_ms": 900.0, "status": "ok", "start": 10})
+
+    tool, chat = summarize_spans(spans)
+    assert (chat["count"], chat["p50"], chat["p95"], chat["p99"], chat["max"]) == (100, 50.0, 95.0, 99.0, 100.0)
+    assert (chat["prompt_tokens"], chat["completion_tokens"], chat["errors"]) == (1000, 200, 0)
+    assert (tool["name"], tool["count"], tool["errors"], tool["p50"]) == ("web_search", 2, 1, 500.0)
+
+    recent = summarize_spans(spans, since=50)
+    assert [row["count"] for row in recent] == [1, 100]
+
+def test_exporter_rotates_when_full(tmp_path):
+    path = str(tmp_path / "spans.jsonl")
+    exporter = JsonLinesExporter(path, max_bytes=600)
+    for i in range(4):
+        exporter.export(tracing.Span(f"span-{i}", "stage"))
+    exporter.close()
+
+    rotated = [record["name"] for record in read_spans(path + ".1")]
+    current = [record["name"] for record in read_spans(path)]
+    assert rotated + current == ["span-0", "span-1", "span-2", "span-3"]
+    assert current
+
+def test_failing_listener_does_not_mask_errors_or_skip_others(monkeypatch):
+    seen = []
+    def broken(finished):
+        raise KeyError("metrics")
+    monkeypatch.setattr(tracing, "span_listeners", [broken, lambda finished: seen.append(finished.name)])
+
+    with pytest.raises(RuntimeError, match="boom"):
+        with span("objective"):
+            raise RuntimeError("boom")
+    with span("quiet"):
+        pass
+    assert seen == ["objective", "quiet"]
@@ -0,0 +1,81 @@
+# tests/test_web_fetch.py
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from praxis_ai.tools import web_fetch
+from praxis_ai.utils.disk_cache import DiskCache
+
+PAGE = b"""<html><head><title>Test Page</title><script>var x = 1;</script></head>
+<body><nav>Home | About</nav><main><h1>Heading</h1><p>First   paragraph.</p><p>Second paragraph.</p></main>
+<footer>Copyright</footer></body></html>"""
+
+class Handler(BaseHTTPRequestHandler):
+    requests = []
+
+    def do_GET(self):
+        self.requests.append((self.path, self.headers.get("If-None-Match")))
+        if self.path == "/page":
+            if self.headers.get("If-None-Match") == '"v1"':
+                self.send_response(304)
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("ETag", '"v1"')
+            self.end_headers()
+            self.wfile.write(PAGE)
+        elif self.path == "/big.txt":
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain")
+            self.end_headers()
+            self.wfile.write(b"x" * 10000)
+        elif self.path == "/notes.md":
+            self.send_response(200)
+            self.send_header("Content-Type", "text/markdown")
+            self.end_headers()
+            self.wfile.write("# Café – naïve “quotes”\n".encode("utf-8"))
+        elif self.path == "/image.png":
+            self.send_response(200)
+            self.send_header("Content-Type", "image/png")
+            self.end_headers()
+            self.wfile.write(b"\x89PNG")
+        else:
+            self.send_response(404)
+            self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    Handler.requests = []
+    monkeypatch.setattr(web_fetch, "fetch_cache", DiskCache(str(tmp_path / "fetch.sqlite3"), 1024 * 1024, 60))
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+def test_fetch_extracts_main_text_and_revalidates(server):
+    result = web_fetch.fetch_urls_tool([f"{server}/page"])
+    assert result.startswith(f"## Test Page\nURL: {server}/page\n\nHeading\nFirst paragraph.\nSecond paragraph.")
+    assert "Home" not in result and "Copyright" not in result and "var x" not in result
+
+    assert web_fetch.fetch_urls_tool([f"{server}/page#section"]) == result
+    assert Handler.requests == [("/page", None), ("/page", '"v1"')]
+
+def test_fetch_caps_pages_and_reports_errors(server, monkeypatch):
+    monkeypatch.setattr(web_fetch, "FETCH_MAX_BYTES", 4096)
+    result = web_fetch.fetch_urls_tool([f"{server}/big.txt", f"{server}/image.png", f"{server}/missing", "ftp://x"],
+                                       max_chars_per_page=100)
+    sections = result.split("\n\n")
+    assert "[Truncated: showing 100 of 4096 characters.]" in sections[1]
+    assert "Unsupported content type: image/png" in result
+    assert "404" in result
+    assert "Only http and https URLs can be fetched" in result
+
+def test_text_without_charset_is_decoded_as_utf8(server):
+    result = web_fetch.fetch_urls_tool([f"{server}/notes.md"])
+    assert "# Café – naïve “quotes”" in result
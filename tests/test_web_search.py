@@ -0,0 +1,68 @@
+# tests/test_web_search.py
+
+import json
+import pytest
+from praxis_ai.tools import web_search
+from praxis_ai.utils.disk_cache import DiskCache
+
+class FakeTavilyClient:
+    calls = []
+    instances = 0
+
+    def __init__(self, api_key=None, **kwargs):
+        FakeTavilyClient.instances += 1
+
+    def search(self, query, max_results, search_depth):
+        self.calls.append(query)
+        if query == "fail":
+            raise RuntimeError("quota exceeded")
+        return {"results": [
+            {"title": query, "url": f"https://example.com/{query.replace(' ', '-')}", "content": f"All about {query}"},
+            {"title": "Shared", "url": "http://www.shared.org/page/?utm_source=x&b=2&a=1", "content": "shared"},
+        ]}
+
+@pytest.fixture
+def fake_tavily(tmp_path, monkeypatch):
+    FakeTavilyClient.calls = []
+    FakeTavilyClient.instances = 0
+    monkeypatch.setattr(web_search, "TavilyClient", FakeTavilyClient)
+    monkeypatch.setattr(web_search, "_tavily_client", None)
+    monkeypatch.setattr(web_search, "search_cache", DiskCache(str(tmp_path / "search.sqlite3"), 1024 * 1024, 60))
+    return FakeTavilyClient
+
+def test_cached_search_normalizes_queries(fake_tavily):
+    first = web_search.cached_search("Python  Packaging", 5, "basic")
+    second = web_search.cached_search(" python packaging ", 5, "basic")
+    web_search.cached_search("python packaging", 5, "advanced")
+
+    assert first == second
+    assert fake_tavily.calls == ["Python  Packaging", "python packaging"]
+    assert web_search.search_cache.stats()["hits"] == 1
+
+def test_time_sensitive_queries_expire_sooner():
+    assert web_search.search_ttl("Latest news on AI") == web_search.SEARCH_CACHE_NEWS_TTL
+    assert web_search.search_ttl("history of the printing press") == web_search.SEARCH_CACHE_TTL
+    assert web_search.search_cache_key("A b", max_results=5, search_depth="basic") == \
+        web_search.search_cache_key("a  B", search_depth="basic", max_results=5)
+
+def test_canonical_url():
+    assert web_search.canonical_url("http://WWW.Example.com/a/?utm_medium=x&b=2&a=1#top") == "https://example.com/a?a=1&b=2"
+    assert web_search.canonical_url("https://example.com:8080/") == "https://example.com:8080/"
+
+def test_multi_web_search_merges_and_reuses_client(fake_tavily, monkeypatch):
+    monkeypatch.setattr(web_search.time, "sleep", lambda seconds: None)
+    result = web_search.multi_web_search(["alpha", "beta", "alpha ", "fail"])
+
+    assert sorted(fake_tavily.calls) == ["alpha", "beta", "fail", "fail", "fail"]
+    assert fake_tavily.instances == 1
+    assert result.splitlines()[0] == "3 unique results for 3 queries:"
+    assert "Found by: alpha; beta" in result
+    assert "Search for 'fail' failed: quota exceeded" in result
+
+def test_web_search_returns_text_for_the_model(fake_tavily):
+    result = web_search.web_search("alpha")
+    assert result.startswith("2 results for 'alpha':\n1. alpha\n   https://example.com/alpha")
+    assert "Table object" not in result
+
+    payload = json.loads(web_search.web_search("alpha", output_format="json"))
+    assert [r["title"] for r in payload["results"]] == ["alpha", "Shared"]
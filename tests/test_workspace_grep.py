@@ -0,0 +1,42 @@
+# tests/test_workspace_grep.py
+
+import re
+from praxis_ai.utils.workspace_grep import grep_file, grep_files
+
+def test_grep_file_reports_line_numbers_and_context(tmp_path):
+    path = tmp_path / "app.py"
+    path.write_text("import os\n\ndef alpha():\n    return 1\n\ndef beta():\n    return 2\n")
+
+    matches = grep_file(path, "app.py", re.compile(rb"^def (\w+)", re.MULTILINE), context_lines=1)
+    assert [(m.line_number, m.line) for m in matches] == [(3, "def alpha():"), (6, "def beta():")]
+    assert matches[0].before == [(2, "")]
+    assert matches[0].after == [(4, "    return 1")]
+
+def test_grep_file_reports_each_line_once(tmp_path):
+    path = tmp_path / "notes.txt"
+    path.write_text("todo todo\nnothing\nlast todo")
+    matches = grep_file(path, "notes.txt", re.compile(rb"todo"))
+    assert [(m.line_number, m.line) for m in matches] == [(1, "todo todo"), (3, "last todo")]
+
+def test_grep_file_counts_lines_across_chunks(tmp_path, monkeypatch):
+    monkeypatch.setattr("praxis_ai.utils.workspace_grep._COUNT_CHUNK_BYTES", 7)
+    path = tmp_path / "sparse.txt"
+    path.write_text("needle\n" + "filler line\n" * 40 + "needle\n")
+    matches = grep_file(path, "sparse.txt", re.compile(rb"needle"))
+    assert [m.line_number for m in matches] == [1, 42]
+
+def test_grep_files_skips_binaries_and_stops_at_limit(tmp_path):
+    for i in range(20):
+        (tmp_path / f"file{i:02}.txt").write_text("needle\n")
+    (tmp_path / "image.png").write_bytes(b"\x89PNG\r\n\x1a\nneedle\n")
+
+    matches, scanned, truncated = grep_files(tmp_path, "NEEDLE", ignore_case=True, max_results=50, workers=4)
+    assert len(matches) == 20
+    assert not truncated
+    assert all(m.path.endswith(".txt") for m in matches)
+    assert [m.path for m in matches] == sorted(m.path for m in matches)
+
+    matches, scanned, truncated = grep_files(tmp_path, "needle", max_results=5, workers=2)
+    assert len(matches) == 5
+    assert truncated
+    assert scanned < 21